@@ -1,6 +1,7 @@
 # app/multimedia_gui.py
 import sys
 import os
+import argparse
 import cv2
 import numpy as np
 from PyQt5.QtWidgets import *
@@ -23,6 +24,13 @@ project_root = os.path.dirname(current_dir)
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, 'src'))
 
+from src.config import Config as ProjectConfig
+from src.inference import PREDICTORS, create_predictor, default_model_path
+from src.prediction_cache import PredictionCache
+from src.motion_gate import MotionGate
+from src.landmark_extractor import LandmarkExtractor
+from src.frame_buffers import FrameBuffers
+
 # Updated style sheet for better fullscreen display on Windows
 APP_STYLE = """
 QMainWindow {
@@ -641,10 +649,45 @@ class TutorialDialog(QDialog):
         }
         return tips.get(self.letter, "Coba variasikan posisi untuk mendapatkan akurasi terbaik.")
 
+class VideoFrameLabel(QLabel):
+    """QLabel yang menggambar frame BGR langsung dari buffer numpy.
+
+    QImage dibuat sekali di atas buffer display (tanpa copy) dan di-scale saat
+    paint, sehingga tidak ada QPixmap.fromImage / pixmap.scaled per frame.
+    Buffer harus tetap hidup selama dipakai; referensinya disimpan di sini.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frame = None
+        self.image = None
+    
+    def set_frame(self, frame):
+        if frame is not self.frame:
+            h, w, ch = frame.shape
+            self.image = QImage(frame.data, w, h, ch * w, QImage.Format_BGR888)
+            self.frame = frame
+        self.update()
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.image is None:
+            return
+        size = self.image.size().scaled(self.size(), Qt.KeepAspectRatio)
+        target = QRect((self.width() - size.width()) // 2, (self.height() - size.height()) // 2,
+                       size.width(), size.height())
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(target, self.image)
+        painter.end()
+
 class MultimediaSignLanguageApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, backend=None, use_cache=None, use_gate=None):
         super().__init__()
         self.model = None
+        self.prediction_cache = PredictionCache(enabled=use_cache)
+        self.motion_gate = MotionGate(enabled=use_gate)
+        self.frame_buffers = FrameBuffers()
         self.scaler = None
         self.mp_hands = None
         self.hands = None
@@ -669,8 +712,11 @@ class MultimediaSignLanguageApp(QMainWindow):
             PROCESSED_DIR = os.path.join(DATA_DIR, 'processed')
             NUM_FEATURES = 63
             LETTERS = [chr(i) for i in range(65, 91)]
+            INFERENCE_BACKEND = ProjectConfig.INFERENCE_BACKEND
         
         self.config = Config()
+        if backend:
+            self.config.INFERENCE_BACKEND = backend
         
         self.init_ui()
         self.load_model()
@@ -731,12 +777,10 @@ class MultimediaSignLanguageApp(QMainWindow):
                 return False
             
             # Find model file
-            model_path = None
-            for file in ['coordinate_model.h5', 'coordinate_model_final.h5']:
-                path = os.path.join(self.config.MODELS_DIR, file)
-                if os.path.exists(path):
-                    model_path = path
-                    break
+            try:
+                model_path = default_model_path(self.config.INFERENCE_BACKEND)
+            except FileNotFoundError:
+                model_path = None
             
             if not model_path:
                 self.show_error("Model Not Found", 
@@ -746,11 +790,13 @@ class MultimediaSignLanguageApp(QMainWindow):
                 return False
             
             # Load model
-            self.model = tf.keras.models.load_model(model_path)
+            self.model = create_predictor(self.config.INFERENCE_BACKEND, model_path)
             
-            # Load scaler
+            # Load scaler (model fused sudah berisi scaler)
             scaler_path = os.path.join(self.config.MODELS_DIR, 'scaler.pkl')
-            if os.path.exists(scaler_path):
+            if self.model.includes_scaler:
+                self.scaler = None
+            elif os.path.exists(scaler_path):
                 self.scaler = joblib.load(scaler_path)
             else:
                 from sklearn.preprocessing import StandardScaler
@@ -762,10 +808,11 @@ class MultimediaSignLanguageApp(QMainWindow):
             self.mp_hands = mp.solutions.hands
             self.hands = self.mp_hands.Hands(
                 static_image_mode=False,
-                max_num_hands=1,
+                max_num_hands=ProjectConfig.MAX_HANDS,
                 min_detection_confidence=0.7,
                 min_tracking_confidence=0.5
             )
+            self.landmark_extractor = LandmarkExtractor()
             
             self.status_label.setText("✅ Model berhasil dimuat! Klik 'Mulai Deteksi' untuk memulai.")
             return True
@@ -800,6 +847,7 @@ class MultimediaSignLanguageApp(QMainWindow):
             self.session_data = []
             self.session_start_time = datetime.datetime.now()
             self.frame_count = 0
+            self.motion_gate.reset()
             
         else:
             self.is_running = False
@@ -807,14 +855,28 @@ class MultimediaSignLanguageApp(QMainWindow):
             self.timer.stop()
             if self.cap:
                 self.cap.release()
-            self.status_label.setText("✅ Deteksi dihentikan")
+            self.status_label.setText(f"✅ Deteksi dihentikan | {self.motion_gate.summary()}")
+            print(self.frame_buffers.summary())
+    
+    def predict_probabilities(self, landmarks_array):
+        """Scale + forward pass untuk batch landmark mentah (n, 63)"""
+        if self.scaler is None:
+            processed = np.asarray(landmarks_array, dtype=np.float32)
+        else:
+            processed = self.scaler.transform(landmarks_array)
+        return self.model.predict(processed)
+    
+    def predict_cached(self, landmarks_array):
+        """Probabilitas lewat prediction cache"""
+        return self.prediction_cache.predict(landmarks_array, self.predict_probabilities)
     
     def update_frame(self):
         """Update video frame and prediction"""
         if not self.is_running or not self.cap:
             return
         
-        ret, frame = self.cap.read()
+        # Capture ke buffer yang dipakai ulang
+        ret, frame = self.frame_buffers.read(self.cap)
         if not ret:
             return
         
@@ -822,41 +884,51 @@ class MultimediaSignLanguageApp(QMainWindow):
         self.frame_count += 1
         
         try:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            frame_rgb = self.frame_buffers.to_rgb(frame)
             results = self.hands.process(frame_rgb)
             
             prediction = "?"
             confidence = 0
             
             if results.multi_hand_landmarks:
-                for hand_landmarks in results.multi_hand_landmarks:
-                    landmarks = []
-                    for landmark in hand_landmarks.landmark:
-                        landmarks.extend([landmark.x, landmark.y, landmark.z])
-                    
-                    if len(landmarks) == self.config.NUM_FEATURES:
-                        try:
-                            processed = self.scaler.transform([landmarks])
-                            predictions = self.model.predict(processed, verbose=0)
-                            pred_idx = np.argmax(predictions[0])
-                            confidence = float(np.max(predictions[0]))
+                # View (n_hands, 63) float32 ke buffer extractor
+                landmarks_list, handedness = self.landmark_extractor.extract(results)
+                hand_labels = [label or str(hand_index) for hand_index, label in enumerate(handedness)]
+                
+                if len(landmarks_list):
+                    try:
+                        # Semua tangan diprediksi dalam satu forward pass (n_hands, 63).
+                        # Motion gate memakai ulang hasil jika tangan diam, dan tangan
+                        # yang ada di cache tidak di-scale/predict ulang
+                        predictions = self.motion_gate.predict(landmarks_list, self.predict_cached)
+                        pred_indices = np.argmax(predictions, axis=1)
+                        confidences = np.max(predictions, axis=1)
+                        
+                        for landmarks, hand_label, pred_idx, hand_confidence in zip(
+                                landmarks_list, hand_labels, pred_indices, confidences):
+                            if pred_idx >= len(self.config.LETTERS):
+                                continue
+                            hand_prediction = self.config.LETTERS[pred_idx]
+                            hand_confidence = float(hand_confidence)
+                            
+                            # Record session data
+                            self.session_data.append({
+                                'timestamp': datetime.datetime.now().isoformat(),
+                                'hand': hand_label,
+                                'prediction': hand_prediction,
+                                'confidence': hand_confidence,
+                                'landmarks': landmarks[:10].tolist()
+                            })
                             
-                            if pred_idx < len(self.config.LETTERS):
-                                prediction = self.config.LETTERS[pred_idx]
-                                
-                                # Record session data
-                                self.session_data.append({
-                                    'timestamp': datetime.datetime.now().isoformat(),
-                                    'prediction': prediction,
-                                    'confidence': confidence,
-                                    'landmarks': landmarks[:10]
-                                })
-                                
-                                # Add to history
-                                self.prediction_history.append(prediction)
-                                self.accuracy_history.append(confidence)
-                        except Exception as e:
-                            print(f"Prediction error: {e}")
+                            # Add to history
+                            self.prediction_history.append(hand_prediction)
+                            self.accuracy_history.append(hand_confidence)
+                            
+                            # Tampilkan tangan dengan confidence tertinggi
+                            if hand_confidence > confidence:
+                                prediction, confidence = hand_prediction, hand_confidence
+                    except Exception as e:
+                        print(f"Prediction error: {e}")
             
             # Update UI
             self.prediction_label.setText(prediction)
@@ -878,18 +950,19 @@ class MultimediaSignLanguageApp(QMainWindow):
                 color: {color};
             """)
             
-            # Process frame for display
-            frame = cv2.flip(frame, 1)
-            
-            # Draw landmarks if detected
+            # Draw landmarks if detected (koordinat frame asli, sebelum di-mirror)
             if results.multi_hand_landmarks:
-                mp.solutions.drawing_utils.draw_landmarks(
-                    frame,
-                    results.multi_hand_landmarks[0],
-                    self.mp_hands.HAND_CONNECTIONS,
-                    mp.solutions.drawing_styles.get_default_hand_landmarks_style(),
-                    mp.solutions.drawing_styles.get_default_hand_connections_style()
-                )
+                for hand_landmarks in results.multi_hand_landmarks:
+                    mp.solutions.drawing_utils.draw_landmarks(
+                        frame,
+                        hand_landmarks,
+                        self.mp_hands.HAND_CONNECTIONS,
+                        mp.solutions.drawing_styles.get_default_hand_landmarks_style(),
+                        mp.solutions.drawing_styles.get_default_hand_connections_style()
+                    )
+            
+            # Mirror ke buffer display dalam satu pass
+            frame = self.frame_buffers.flip(frame, inplace=False)
             
             # Add overlay text
             cv2.putText(frame, f"Prediksi: {prediction}", (20, 40),
@@ -902,15 +975,8 @@ class MultimediaSignLanguageApp(QMainWindow):
             cv2.putText(frame, timestamp, (500, 460),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
             
-            # Convert to QImage
-            h, w, ch = frame.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_BGR888)
-            
-            # Display
-            pixmap = QPixmap.fromImage(qt_image)
-            pixmap = pixmap.scaled(self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.video_label.setPixmap(pixmap)
+            # Display: QImage di atas buffer display, di-scale saat paint
+            self.video_label.set_frame(frame)
             
             # Add to history list
             if confidence > 0.7 and prediction != "?":
@@ -928,7 +994,9 @@ class MultimediaSignLanguageApp(QMainWindow):
             # Update FPS setiap 0.5 detik
             current_time = datetime.datetime.now()
             if (current_time - self.last_fps_update).total_seconds() > 0.5:
-                self.fps_indicator.setText(f"FPS: {fps:.1f}")
+                self.fps_indicator.setText(f"FPS: {fps:.1f} | {self.frame_buffers.stats_text()}")
+                self.cache_indicator.setText(self.prediction_cache.stats_text())
+                self.gate_indicator.setText(self.motion_gate.stats_text())
                 self.last_fps_update = current_time
             
             # Update status bar
@@ -1270,6 +1338,16 @@ class MultimediaSignLanguageApp(QMainWindow):
         self.fps_indicator.setStyleSheet(f"font-size: {self.font_config['subtitle']}px;")
         self.status_bar.addPermanentWidget(self.fps_indicator)
         
+        # Prediction cache indicator (hit/miss)
+        self.cache_indicator = QLabel(self.prediction_cache.stats_text())
+        self.cache_indicator.setStyleSheet(f"font-size: {self.font_config['subtitle']}px;")
+        self.status_bar.addPermanentWidget(self.cache_indicator)
+        
+        # Motion gate indicator (rasio frame yang inference-nya dilewati)
+        self.gate_indicator = QLabel(self.motion_gate.stats_text())
+        self.gate_indicator.setStyleSheet(f"font-size: {self.font_config['subtitle']}px;")
+        self.status_bar.addPermanentWidget(self.gate_indicator)
+        
         # Memory indicator
         self.mem_indicator = QLabel("RAM: -")
         self.mem_indicator.setStyleSheet(f"font-size: {self.font_config['subtitle']}px;")
@@ -1443,7 +1521,7 @@ class MultimediaSignLanguageApp(QMainWindow):
         video_layout = QVBoxLayout()
         video_layout.setContentsMargins(5, 5, 5, 5)
         
-        self.video_label = QLabel()
+        self.video_label = VideoFrameLabel()
         self.video_label.setMinimumSize(640, 480)
         self.video_label.setAlignment(Qt.AlignCenter)
         self.video_label.setStyleSheet("""
@@ -2081,7 +2159,16 @@ def main():
     # Suppress warnings
     os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
     
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Penerjemah Bahasa Isyarat (GUI)")
+    parser.add_argument('--backend', choices=sorted(PREDICTORS), default=None,
+                        help="Inference backend (default: Config.INFERENCE_BACKEND)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Matikan prediction cache (untuk benchmarking)")
+    parser.add_argument('--no-gate', action='store_true',
+                        help="Matikan motion gate (score setiap frame)")
+    args, qt_args = parser.parse_known_args()
+    
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setStyle('Fusion')
     
     # Set High DPI scaling before creating any widgets
@@ -2094,7 +2181,9 @@ def main():
     app.setApplicationName("Penerjemah Bahasa Isyarat")
     app.setApplicationDisplayName("Inovasi Multimedia - Penerjemah Bahasa Isyarat")
     
-    window = MultimediaSignLanguageApp()
+    window = MultimediaSignLanguageApp(backend=args.backend,
+                                       use_cache=False if args.no_cache else None,
+                                       use_gate=False if args.no_gate else None)
     
     # Tampilkan maximize
     window.showMaximized()
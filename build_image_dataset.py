@@ -0,0 +1,31 @@
+import argparse
+import os
+from src.config import Config
+from src.dataset_combiner import DatasetCombiner
+from src.image_dataset import ImageDatasetBuilder
+
+def main():
+    parser = argparse.ArgumentParser(description="Build landmark CSV dataset dari folder gambar berlabel")
+    parser.add_argument('image_dir', help="Folder gambar per huruf, mis. asl_alphabet_train/ (A/*.jpg, B/*.jpg, ...)")
+    parser.add_argument('--output', default=None,
+                        help="Folder output CSV (default: Config.IMAGE_COORD_DIR)")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah worker process (default: CPU count)")
+    parser.add_argument('--max-per-class', type=int, default=None, help="Batasi jumlah gambar per huruf")
+    parser.add_argument('--combine', action='store_true',
+                        help="Gabungkan RAW_COORD_DIR + output ini ke dataset biner setelah ekstraksi")
+    args = parser.parse_args()
+    
+    print("=== IMAGE TO LANDMARKS DATASET BUILDER ===")
+    print(f"Images: {args.image_dir}")
+    print(f"Output: {args.output or Config.IMAGE_COORD_DIR} | CPU cores: {os.cpu_count()}")
+    
+    builder = ImageDatasetBuilder(args.image_dir, args.output, args.workers)
+    report = builder.run(max_per_class=args.max_per_class)
+    
+    if args.combine and report:
+        stats = DatasetCombiner(Config.RAW_COORD_DIR, extra_dirs=[builder.output_dir]).combine()
+        print(f"\n✅ Combined dataset: {Config.BINARY_DATASET_PATH} ({stats['samples']} samples)")
+        print(f"🔄 Re-parsed: {', '.join(stats['changed']) or 'none'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import argparse
+import os
+from src.config import Config
+from src.video_dataset import VideoDatasetBuilder
+
+def main():
+    parser = argparse.ArgumentParser(description="Build landmark CSV dataset dari folder video berlabel")
+    parser.add_argument('video_dir', help="Folder video: videos/A/*.mp4 atau videos/A_clip.mp4")
+    parser.add_argument('--output', default=None,
+                        help="Folder output CSV (default: Config.RAW_COORD_DIR)")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah worker process (default: CPU count)")
+    parser.add_argument('--frame-step', type=int, default=1, help="Ambil setiap N frame")
+    parser.add_argument('--scaling', type=int, nargs='+', default=None,
+                        help="Benchmark frames/s untuk jumlah worker ini (mis. --scaling 1 2 4), tanpa menulis CSV")
+    parser.add_argument('--scaling-videos', type=int, default=None,
+                        help="Batasi jumlah video untuk benchmark scaling")
+    args = parser.parse_args()
+    
+    print("=== VIDEO TO LANDMARKS DATASET BUILDER ===")
+    print(f"Videos: {args.video_dir}")
+    print(f"Output: {args.output or Config.RAW_COORD_DIR} | CPU cores: {os.cpu_count()}")
+    
+    builder = VideoDatasetBuilder(args.video_dir, args.output, args.workers, args.frame_step)
+    if args.scaling:
+        builder.benchmark_scaling(args.scaling, args.scaling_videos)
+    else:
+        builder.run()
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 import cv2
 import mediapipe as mp
-import pandas as pd
 import numpy as np
 import os
 import time
 from datetime import datetime
+from src.landmark_extractor import LandmarkExtractor
+from src.sample_writer import BackgroundSampleWriter
+from src.dataset_combiner import DatasetCombiner
+from src.config import Config
 
 class ManualDataCollector:
     def __init__(self):
@@ -17,6 +20,7 @@ class ManualDataCollector:
             min_tracking_confidence=0.5
         )
         self.mp_draw = mp.solutions.drawing_utils
+        self.landmark_extractor = LandmarkExtractor(max_hands=1)
         
         # Setup camera
         self.cap = cv2.VideoCapture(0)
@@ -26,10 +30,12 @@ class ManualDataCollector:
         # Data storage
         self.data_dir = "data/raw_coordinates"
         os.makedirs(self.data_dir, exist_ok=True)
+        self.sample_writer = BackgroundSampleWriter(self.data_dir)
         
         # Collection parameters
         self.current_letter = None
-        self.samples_collected = 0
+        self.samples_collected = 0  # Sample yang sudah di-submit ke writer
+        self.confirmed_base = 0  # Baris huruf ini yang sudah ada di file sebelum sesi huruf dimulai
         self.total_samples = 0
         self.collection_active = False
         self.auto_collect = False
@@ -48,17 +54,13 @@ class ManualDataCollector:
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         results = self.hands.process(rgb_frame)
         
-        landmarks_list = []
+        # View (n_hands, 63) ke buffer float32 extractor
+        landmarks_list, _ = self.landmark_extractor.extract(results)
         hand_detected = False
         
         if results.multi_hand_landmarks:
             hand_detected = True
             for hand_landmarks in results.multi_hand_landmarks:
-                landmarks = []
-                for landmark in hand_landmarks.landmark:
-                    landmarks.extend([landmark.x, landmark.y, landmark.z])
-                landmarks_list.append(landmarks)
-                
                 # Draw landmarks untuk visual feedback
                 self.mp_draw.draw_landmarks(
                     frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
@@ -66,31 +68,22 @@ class ManualDataCollector:
         return landmarks_list, frame, hand_detected
     
     def save_sample(self, landmarks, letter):
-        """Simpan sample ke CSV"""
+        """Kirim sample ke writer thread (capture loop tidak menunggu disk)"""
         if len(landmarks) != 63:  # 21 landmarks * 3 coordinates
             return False
-            
-        # Buat DataFrame atau append ke existing
-        csv_path = os.path.join(self.data_dir, f'{letter}_coordinates.csv')
-        
-        sample_data = landmarks + [letter]
-        columns = self.get_landmark_names()
-        
-        df_new = pd.DataFrame([sample_data], columns=columns)
-        
-        if os.path.exists(csv_path):
-            df_existing = pd.read_csv(csv_path)
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-            df_combined.to_csv(csv_path, index=False)
-        else:
-            df_new.to_csv(csv_path, index=False)
         
+        self.sample_writer.submit(np.asarray(landmarks).tolist(), letter)
         return True
     
+    def samples_saved(self):
+        """Sample huruf aktif yang sudah benar-benar tertulis ke file"""
+        return self.sample_writer.confirmed(self.current_letter) - self.confirmed_base
+    
     def collect_for_letter(self, letter, num_samples=500):
         """Koleksi data untuk satu huruf"""
         self.current_letter = letter
         self.samples_collected = 0
+        self.confirmed_base = self.sample_writer.confirmed(letter)
         self.total_samples = num_samples
         
         print(f"\n🎯 Collecting data for letter: {letter}")
@@ -119,10 +112,10 @@ class ManualDataCollector:
             if self.auto_collect and hand_detected:
                 current_time = time.time()
                 if current_time - auto_start_time >= 1.0 / self.collection_speed:
-                    if landmarks_list and len(landmarks_list[0]) == 63:
+                    if len(landmarks_list) and len(landmarks_list[0]) == 63:
                         if self.save_sample(landmarks_list[0], letter):
                             self.samples_collected += 1
-                            collected_data.append(landmarks_list[0])
+                            collected_data.append(landmarks_list[0].tolist())
                             print(f"Auto-collected sample {self.samples_collected}/{num_samples}")
                         auto_start_time = current_time
             
@@ -131,10 +124,10 @@ class ManualDataCollector:
             key = cv2.waitKey(1) & 0xFF
             
             if key == ord(' '):  # SPACE - manual collection
-                if hand_detected and landmarks_list and len(landmarks_list[0]) == 63:
+                if hand_detected and len(landmarks_list) and len(landmarks_list[0]) == 63:
                     if self.save_sample(landmarks_list[0], letter):
                         self.samples_collected += 1
-                        collected_data.append(landmarks_list[0])
+                        collected_data.append(landmarks_list[0].tolist())
                         print(f"Manual collected sample {self.samples_collected}/{num_samples}")
                         
             elif key == ord('a'):  # A - start auto collection
@@ -157,6 +150,8 @@ class ManualDataCollector:
                 print(f"Target reached! Collected {self.samples_collected} samples for {letter}")
                 break
         
+        self.sample_writer.flush()
+        print(f"✅ {self.samples_saved()} samples for {letter} written to disk")
         return collected_data
     
     def display_info(self, frame, letter, hand_detected):
@@ -167,7 +162,7 @@ class ManualDataCollector:
         
         cv2.putText(frame, f"Letter: {letter}", (10, 30), 
                    cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-        cv2.putText(frame, f"Samples: {self.samples_collected}/{self.total_samples}", (10, 70), 
+        cv2.putText(frame, f"Samples: {self.samples_saved()}/{self.total_samples}", (10, 70), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         cv2.putText(frame, hand_status, (10, 110), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, hand_color, 2)
@@ -191,41 +186,30 @@ class ManualDataCollector:
             cv2.putText(frame, control, (400, 30 + i*25), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
     
-    def create_combined_dataset(self):
-        """Gabungkan semua file CSV menjadi dataset lengkap"""
+    def create_combined_dataset(self, force=False):
+        """Gabungkan semua file CSV menjadi dataset lengkap (hanya file yang berubah di-parse)"""
         print("\n📊 Combining all datasets...")
+        self.sample_writer.flush()
         
-        all_dataframes = []
-        letters = [chr(i) for i in range(65, 91)]  # A-Z
-        
-        for letter in letters:
-            csv_path = os.path.join(self.data_dir, f'{letter}_coordinates.csv')
-            if os.path.exists(csv_path):
-                df = pd.read_csv(csv_path)
-                all_dataframes.append(df)
-                print(f"  {letter}: {len(df)} samples")
+        combined_path = Config().BINARY_DATASET_PATH
+        stats = DatasetCombiner(self.data_dir, combined_path).combine(force)
         
-        if all_dataframes:
-            combined_df = pd.concat(all_dataframes, ignore_index=True)
-            
-            # Buat direktori processed
-            processed_dir = "data/processed"
-            os.makedirs(processed_dir, exist_ok=True)
-            
-            combined_path = os.path.join(processed_dir, "complete_dataset.csv")
-            combined_df.to_csv(combined_path, index=False)
-            
-            print(f"\n✅ Combined dataset saved: {combined_path}")
-            print(f"📈 Total samples: {len(combined_df)}")
-            print(f"🎯 Classes: {combined_df['label'].nunique()}")
+        if stats['samples']:
+            if stats['updated']:
+                changed = ', '.join(stats['changed']) or 'none'
+                print(f"\n✅ Combined dataset saved: {combined_path}")
+                print(f"🔄 Re-parsed: {changed} | removed: {', '.join(stats['removed']) or 'none'}")
+            else:
+                print(f"\n✅ Combined dataset up to date: {combined_path}")
+            print(f"📈 Total samples: {stats['samples']} ({stats['seconds']*1000:.1f} ms)")
+            print(f"🎯 Classes: {len(stats['class_counts'])}")
             
             # Show class distribution
             print("\n📋 Class Distribution:")
-            class_dist = combined_df['label'].value_counts().sort_index()
-            for letter, count in class_dist.items():
+            for letter, count in stats['class_counts'].items():
                 print(f"  {letter}: {count} samples")
                 
-            return combined_df
+            return stats
         else:
             print("❌ No data found to combine!")
             return None
@@ -261,7 +245,12 @@ class ManualDataCollector:
 
 def main():
     collector = ManualDataCollector()
-    collector.run_collection_session()
+    try:
+        collector.run_collection_session()
+    finally:
+        # Ctrl-C di tengah koleksi: sample yang masih di-buffer tetap tersimpan
+        collector.sample_writer.close()
+        print(collector.sample_writer.summary())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
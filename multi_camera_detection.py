@@ -0,0 +1,41 @@
+import argparse
+import os
+from src.config import Config
+from src.inference import PREDICTORS
+from src.multi_camera import MultiCameraDetector, benchmark_scaling
+
+# Suppress TensorFlow warnings
+os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
+
+def parse_source(source):
+    """Index kamera ('0') atau path/URL video"""
+    return int(source) if source.isdigit() else source
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-camera sign language detection")
+    parser.add_argument('--sources', nargs='+', default=['0'],
+                        help="Index kamera atau path/URL video, satu worker process per source")
+    parser.add_argument('--backend', choices=sorted(PREDICTORS), default=None,
+                        help="Inference backend (default: Config.INFERENCE_BACKEND)")
+    parser.add_argument('--model', default=None, help="Path ke file model")
+    parser.add_argument('--duration', type=float, default=None, help="Durasi (detik), default sampai Ctrl-C")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Ukur total FPS untuk 1..N stream (N = jumlah --sources) -> results/multi_camera_scaling.json")
+    parser.add_argument('--benchmark-seconds', type=float, default=20.0, help="Durasi per jumlah stream")
+    args = parser.parse_args()
+    
+    print("=== MULTI-CAMERA SIGN LANGUAGE DETECTION ===")
+    print(f"Sources: {args.sources}")
+    print(f"CPU cores: {os.cpu_count()} | Max hands per stream: {Config.MAX_HANDS}")
+    
+    if args.benchmark:
+        benchmark_scaling([parse_source(s) for s in args.sources], args.benchmark_seconds,
+                          args.backend, args.model)
+        return
+    
+    detector = MultiCameraDetector([parse_source(s) for s in args.sources],
+                                   backend=args.backend, model_path=args.model)
+    detector.run(duration=args.duration)
+
+if __name__ == "__main__":
+    main()
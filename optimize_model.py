@@ -4,6 +4,17 @@ from tensorflow import keras
 import os
 from src.config import Config
 
+def convert_to_tflite(model):
+    """Convert Keras model ke TFLite dengan FP16 weight quantization"""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    
+    # Optimization options
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_types = [tf.float16]  # FP16 quantization
+    converter.experimental_new_converter = True
+    
+    return converter.convert()
+
 def optimize_model_for_production():
     """Optimize model untuk deployment"""
     config = Config()
@@ -13,18 +24,10 @@ def optimize_model_for_production():
     model = keras.models.load_model(model_path)
     
     # 1. CONVERT KE TFLITE (untuk mobile/edge devices)
-    converter = tf.lite.TFLiteConverter.from_keras_model(model)
-    
-    # Optimization options
-    converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    converter.target_spec.supported_types = [tf.float16]  # FP16 quantization
-    converter.experimental_new_converter = True
-    
-    # Convert
-    tflite_model = converter.convert()
+    tflite_model = convert_to_tflite(model)
     
     # Save TFLite model
-    tflite_path = os.path.join(config.MODELS_DIR, 'model.tflite')
+    tflite_path = config.TFLITE_MODEL_PATH
     with open(tflite_path, 'wb') as f:
         f.write(tflite_model)
     
@@ -39,6 +42,170 @@ def optimize_model_for_production():
     
     return tflite_model
 
+def export_fused_model():
+    """Fold scaler.pkl ke Dense pertama dan simpan model yang menerima landmark mentah"""
+    import joblib
+    import numpy as np
+    from src.inference import save_model_metadata
+    from src.numpy_inference import fold_scaler_into_dense
+    
+    config = Config()
+    
+    model = keras.models.load_model(config.MODEL_PATH)
+    scaler = joblib.load(os.path.join(config.MODELS_DIR, 'scaler.pkl'))
+    
+    first_layer = model.layers[0]
+    if not isinstance(first_layer, keras.layers.Dense):
+        raise ValueError(f"First layer must be Dense to fold the scaler, got {type(first_layer).__name__}")
+    
+    # Clone model lalu ganti bobot Dense pertama dengan versi fused
+    fused_model = keras.models.clone_model(model)
+    fused_model.set_weights(model.get_weights())
+    kernel, bias = first_layer.get_weights()
+    fused_model.layers[0].set_weights(fold_scaler_into_dense(kernel, bias, scaler))
+    fused_model.compile(
+        optimizer='adam',
+        loss='sparse_categorical_crossentropy',
+        metrics=['accuracy']
+    )
+    
+    # Verifikasi: fused(x) == model(scaler.transform(x))
+    raw_input = scaler.mean_ + scaler.scale_ * np.random.randn(256, config.NUM_FEATURES)
+    expected = model.predict(scaler.transform(raw_input).astype(np.float32), verbose=0)
+    actual = fused_model.predict(raw_input.astype(np.float32), verbose=0)
+    max_diff = float(np.max(np.abs(expected - actual)))
+    if max_diff > config.INFERENCE_TOLERANCE:
+        raise AssertionError(f"Fused model differs from model + scaler: max diff {max_diff:.2e}")
+    print(f"✅ Fused model matches model + scaler (max diff: {max_diff:.2e})")
+    
+    # Sidecar JSON: predictor membaca flag ini, bukan nama file
+    fused_model.save(config.FUSED_MODEL_PATH)
+    save_model_metadata(config.FUSED_MODEL_PATH, includes_scaler=True, source_model=config.MODEL_PATH)
+    print(f"✅ Fused model saved: {config.FUSED_MODEL_PATH}")
+    
+    with open(config.FUSED_TFLITE_MODEL_PATH, 'wb') as f:
+        f.write(convert_to_tflite(fused_model))
+    save_model_metadata(config.FUSED_TFLITE_MODEL_PATH, includes_scaler=True, source_model=config.MODEL_PATH)
+    print(f"✅ Fused TFLite model saved: {config.FUSED_TFLITE_MODEL_PATH}")
+    
+    return fused_model
+
+def load_calibration_samples(scaler, num_samples=None, seed=42):
+    """Ambil sample dari data/raw_coordinates/*.csv dan scale dengan scaler.pkl"""
+    import glob
+    import numpy as np
+    import pandas as pd
+    
+    config = Config()
+    num_samples = num_samples or config.INT8_CALIBRATION_SAMPLES
+    
+    csv_files = sorted(glob.glob(os.path.join(config.RAW_COORD_DIR, '*.csv')))
+    if not csv_files:
+        raise FileNotFoundError(f"No raw coordinate CSV found in {config.RAW_COORD_DIR}")
+    
+    df = pd.concat([pd.read_csv(path) for path in csv_files], ignore_index=True)
+    features = df.drop(columns=['label']).values
+    
+    rng = np.random.default_rng(seed)
+    indices = rng.choice(len(features), size=min(num_samples, len(features)), replace=False)
+    return scaler.transform(features[indices]).astype(np.float32)
+
+def quantize_int8_model(num_calibration_samples=None):
+    """Full-integer (int8) post-training quantization dengan representative dataset"""
+    import joblib
+    
+    config = Config()
+    
+    model = keras.models.load_model(config.MODEL_PATH)
+    scaler = joblib.load(os.path.join(config.MODELS_DIR, 'scaler.pkl'))
+    calibration_samples = load_calibration_samples(scaler, num_calibration_samples)
+    print(f"Calibration samples: {len(calibration_samples)}")
+    
+    def representative_dataset():
+        for sample in calibration_samples:
+            yield [sample.reshape(1, -1)]
+    
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+    
+    tflite_model = converter.convert()
+    
+    with open(config.INT8_TFLITE_MODEL_PATH, 'wb') as f:
+        f.write(tflite_model)
+    
+    print(f"✅ INT8 TFLite model saved: {config.INT8_TFLITE_MODEL_PATH}")
+    print(f"INT8 TFLite size: {len(tflite_model) / 1024:.2f} KB")
+    
+    return tflite_model
+
+def measure_latency(predictor, input_batch, num_tests=500):
+    """Rata-rata waktu predictor.predict (detik) setelah warmup"""
+    import time
+    
+    # Warmup
+    for _ in range(10):
+        _ = predictor.predict(input_batch)
+    
+    start_time = time.time()
+    for _ in range(num_tests):
+        _ = predictor.predict(input_batch)
+    
+    return (time.time() - start_time) / num_tests
+
+def compare_quantized_model():
+    """Bandingkan size, latency per frame dan test accuracy float vs int8"""
+    import json
+    import numpy as np
+    from src.data_loader import CoordinateDataLoader
+    from src.inference import create_predictor
+    
+    config = Config()
+    
+    # Split yang sama dengan training/evaluasi
+    data_loader = CoordinateDataLoader()
+    _, _, _, _, X_test, y_test, _ = data_loader.load_dataset()
+    X_test = X_test.astype(np.float32)
+    
+    candidates = [
+        ('float32 (keras)', 'keras', config.MODEL_PATH),
+        ('float16 tflite', 'tflite', config.TFLITE_MODEL_PATH),
+        ('int8 tflite', 'tflite', config.INT8_TFLITE_MODEL_PATH),
+    ]
+    
+    report = {}
+    for label, backend, model_path in candidates:
+        if not os.path.exists(model_path):
+            print(f"Skipping {label}: {model_path} not found")
+            continue
+        
+        predictor = create_predictor(backend, model_path)
+        y_pred = np.argmax(predictor.predict(X_test), axis=1)
+        
+        report[label] = {
+            'model_path': model_path,
+            'size_kb': os.path.getsize(model_path) / 1024,
+            'latency_ms': measure_latency(predictor, X_test[:1]) * 1000,
+            'test_accuracy': float(np.mean(y_pred == y_test)),
+        }
+    
+    print(f"\n=== QUANTIZATION REPORT ===")
+    print(f"{'Model':<18}{'Size (KB)':>12}{'Latency (ms)':>15}{'Accuracy':>11}")
+    for label, metrics in report.items():
+        print(f"{label:<18}{metrics['size_kb']:>12.2f}{metrics['latency_ms']:>15.3f}"
+              f"{metrics['test_accuracy']:>11.4f}")
+    
+    os.makedirs(config.RESULTS_DIR, exist_ok=True)
+    report_path = os.path.join(config.RESULTS_DIR, 'quantization_report.json')
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"Quantization report saved to: {report_path}")
+    
+    return report
+
 def benchmark_model():
     """Benchmark model performance"""
     import time
@@ -75,6 +242,87 @@ def benchmark_model():
     
     return avg_time
 
+def benchmark_numpy_model():
+    """Benchmark NumPy inference engine dan cek kesamaan output dengan Keras"""
+    import time
+    import numpy as np
+    from src.numpy_inference import NumpyCoordinateModel
+    
+    config = Config()
+    
+    model_path = os.path.join(config.MODELS_DIR, 'coordinate_model.h5')
+    numpy_model = NumpyCoordinateModel(model_path)
+    
+    # Verifikasi output terhadap Keras
+    max_diff = numpy_model.verify_against_keras(keras.models.load_model(model_path))
+    print(f"\n✅ NumPy engine match Keras (max diff: {max_diff:.2e})")
+    
+    dummy_input = np.random.randn(1, config.NUM_FEATURES).astype(np.float32)
+    
+    # Warmup
+    for _ in range(10):
+        _ = numpy_model.predict(dummy_input)
+    
+    # Benchmark
+    num_tests = 1000
+    start_time = time.time()
+    
+    for _ in range(num_tests):
+        _ = numpy_model.predict(dummy_input)
+    
+    total_time = time.time() - start_time
+    avg_time = total_time / num_tests
+    
+    print(f"\n=== NUMPY ENGINE BENCHMARK ===")
+    print(f"Total predictions: {num_tests}")
+    print(f"Total time: {total_time:.4f} seconds")
+    print(f"Average inference time: {avg_time*1000:.3f} ms")
+    print(f"FPS potential: {1/avg_time:.1f}")
+    
+    return avg_time
+
+def benchmark_backends(num_tests=500, batch_sizes=(1, 2, 4)):
+    """Benchmark semua inference backend untuk beberapa jumlah tangan per frame"""
+    import numpy as np
+    from src.inference import PREDICTORS, create_predictor
+    
+    config = Config()
+    results = {}
+    
+    print(f"\n=== BACKEND BENCHMARK ===")
+    for backend in sorted(PREDICTORS):
+        try:
+            predictor = create_predictor(backend)
+        except (OSError, ImportError) as e:
+            print(f"{backend:>8}: skipped ({e})")
+            continue
+        
+        for batch_size in batch_sizes:
+            dummy_input = np.random.randn(batch_size, config.NUM_FEATURES).astype(np.float32)
+            avg_time = measure_latency(predictor, dummy_input, num_tests)
+            
+            results[(backend, batch_size)] = avg_time
+            print(f"{backend:>8} x{batch_size} hands: {avg_time*1000:.3f} ms/frame "
+                  f"({1/avg_time:.1f} FPS potential)")
+    
+    return results
+
 if __name__ == "__main__":
-    optimize_model_for_production()
-    benchmark_model()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Optimize coordinate model for deployment")
+    parser.add_argument('--int8', action='store_true',
+                        help="Full-integer quantization + laporan perbandingan float vs int8")
+    parser.add_argument('--calibration-samples', type=int, default=None,
+                        help="Jumlah sample representative dataset (default: Config.INT8_CALIBRATION_SAMPLES)")
+    args = parser.parse_args()
+    
+    if args.int8:
+        quantize_int8_model(args.calibration_samples)
+        compare_quantized_model()
+    else:
+        optimize_model_for_production()
+        export_fused_model()
+        benchmark_model()
+        benchmark_numpy_model()
+        benchmark_backends()
\ No newline at end of file
@@ -6,44 +6,82 @@ import time
 import os
 import joblib
 import sys
+import argparse
+import itertools
+import threading
 from src.config import Config
+from src.inference import PREDICTORS, create_predictor, default_model_path
+from src.smoothing import PredictionSmoother
+from src.prediction_cache import PredictionCache
+from src.motion_gate import MotionGate
+from src.landmark_extractor import LandmarkExtractor
+from src.hand_roi import HandROI
+from src.adaptive_resolution import ResolutionController
+from src.frame_scheduler import FrameSkipScheduler
+from src.frame_buffers import FrameBuffers
+from src.hud_overlay import HudCompositor
+from src.pipeline import FramePacket, LatencyStats, LatestQueue, get_or_none, start_stage
 
 # Suppress TensorFlow warnings
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 tf.get_logger().setLevel('ERROR')
 
 class RealTimeCoordinateDetector:
-    def __init__(self, model_path=None):
+    INSTRUCTIONS = (
+        "Instructions:",
+        "1. Show one hand in the frame",
+        "2. Make sign language gestures",
+        "3. Press 'q' to quit",
+        "4. Press 'c' to capture frame"
+    )
+    CONFIDENCE_BAR = (10, 180, 200, 20)  # x, y, width, height
+    
+    def __init__(self, model_path=None, backend=None, use_cache=None, use_gate=None, use_roi=None,
+                 adaptive_resolution=None, frame_skip=None):
         print("Initializing RealTimeCoordinateDetector...")
         self.config = Config()
+        self.backend = backend or self.config.INFERENCE_BACKEND
+        self.prediction_cache = PredictionCache(enabled=use_cache)
+        self.motion_gate = MotionGate(enabled=use_gate)
+        self.hand_roi = HandROI(enabled=use_roi)
+        self.resolution = ResolutionController(enabled=adaptive_resolution)
+        self.scheduler = FrameSkipScheduler(enabled=frame_skip)
+        self.frame_buffers = FrameBuffers()
+        self.hud = HudCompositor(self.render_static_hud)
         
         # Load model
         if model_path is None:
-            model_path = os.path.join(self.config.MODELS_DIR, 'coordinate_model.h5')
-            if not os.path.exists(model_path):
-                model_path = os.path.join(self.config.MODELS_DIR, 'coordinate_model_final.h5')
+            try:
+                model_path = default_model_path(self.backend)
+            except FileNotFoundError:
+                model_path = (self.config.TFLITE_MODEL_PATH if self.backend == 'tflite'
+                              else self.config.MODEL_PATH)
         
         print(f"Looking for model at: {model_path}")
         
-        if not os.path.exists(model_path):
+        if self.backend != 'remote' and not os.path.exists(model_path):
             print(f"❌ ERROR: Model file not found at {model_path}")
             print("Please run 'python train_coordinate_model.py' first to train the model.")
             sys.exit(1)
         
         try:
-            self.model = tf.keras.models.load_model(model_path)
-            print("✅ Model loaded successfully")
+            self.predictor = create_predictor(self.backend, model_path)
+            print(f"✅ Model loaded successfully (backend: {self.backend})")
         except Exception as e:
             print(f"❌ ERROR loading model: {e}")
             sys.exit(1)
         
-        # Load scaler
+        # Load scaler (tidak perlu jika scaler sudah di-fold ke model)
         try:
-            self.scaler = self.load_scaler()
-            if self.scaler is None:
-                print("❌ ERROR: Scaler not found! Please train the model first.")
-                sys.exit(1)
-            print("✅ Scaler loaded successfully")
+            if self.predictor.includes_scaler:
+                self.scaler = None
+                print("✅ Fused model: scaler folded into first layer")
+            else:
+                self.scaler = self.load_scaler()
+                if self.scaler is None:
+                    print("❌ ERROR: Scaler not found! Please train the model first.")
+                    sys.exit(1)
+                print("✅ Scaler loaded successfully")
         except Exception as e:
             print(f"❌ ERROR loading scaler: {e}")
             sys.exit(1)
@@ -59,6 +97,7 @@ class RealTimeCoordinateDetector:
             )
             self.mp_drawing = mp.solutions.drawing_utils
             self.mp_drawing_styles = mp.solutions.drawing_styles
+            self.landmark_extractor = LandmarkExtractor()
             print("✅ MediaPipe Hands initialized")
         except Exception as e:
             print(f"❌ ERROR initializing MediaPipe: {e}")
@@ -78,9 +117,10 @@ class RealTimeCoordinateDetector:
             print(f"❌ ERROR initializing camera: {e}")
             sys.exit(1)
         
-        # Prediction smoothing
-        self.prediction_history = []
+        # Prediction smoothing (per tangan)
         self.history_size = 7
+        self.smoother = PredictionSmoother(self.history_size, min_history=3)
+        self.hand_keys = []
         self.current_prediction = "None"
         self.current_confidence = 0.0
         
@@ -88,6 +128,7 @@ class RealTimeCoordinateDetector:
         self.fps = 0
         self.frame_count = 0
         self.start_time = time.time()
+        self.session_start = self.start_time
         
         print("✅ RealTimeCoordinateDetector initialized successfully!")
     
@@ -120,43 +161,83 @@ class RealTimeCoordinateDetector:
             return None
     
     def extract_landmarks(self, image):
-        """Extract hand landmarks dari frame"""
+        """Extract hand landmarks dari frame (view (n_hands, 63) ke buffer extractor)"""
         try:
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_image)
+            start = time.perf_counter()
+            
+            # Frame tanpa hands.process: landmark dari prediksi Kalman filter
+            if not self.scheduler.should_detect():
+                landmarks_list = self.scheduler.predict(start)
+                self.hand_roi.update(landmarks_list, image.shape)
+                self.draw_predicted_landmarks(image, landmarks_list)
+                return landmarks_list, image, True
             
-            landmarks = []
+            # Crop di sekitar tangan frame sebelumnya; fallback full frame jika hilang
+            crop, roi = self.hand_roi.crop(image)
+            results = self.process_hands(crop, roi, image.shape[1])
+            if roi is not None and not results.multi_hand_landmarks:
+                crop, roi = image, None
+                results = self.process_hands(crop, roi, image.shape[1])
+            self.resolution.update(time.perf_counter() - start)
+            
+            landmarks_list, handedness = self.landmark_extractor.extract(results)
+            self.hand_roi.remap(landmarks_list, roi, image.shape)
+            self.hand_roi.update(landmarks_list, image.shape)
+            self.scheduler.detected(landmarks_list, start)
+            # Key smoothing: (index tangan, handedness)
+            self.hand_keys = list(enumerate(handedness))
             hand_detected = False
             
             if results.multi_hand_landmarks:
                 hand_detected = True
                 for hand_landmarks in results.multi_hand_landmarks:
-                    # Extract semua landmarks (x, y, z)
-                    for landmark in hand_landmarks.landmark:
-                        landmarks.extend([landmark.x, landmark.y, landmark.z])
-                    
-                    # Draw landmarks pada frame
+                    # Draw landmarks pada frame (crop = view ke frame, koordinat crop)
                     self.mp_drawing.draw_landmarks(
-                        image,
+                        crop,
                         hand_landmarks,
                         self.mp_hands.HAND_CONNECTIONS,
                         self.mp_drawing_styles.get_default_hand_landmarks_style(),
                         self.mp_drawing_styles.get_default_hand_connections_style()
                     )
             
-            return landmarks, image, hand_detected
+            return landmarks_list, image, hand_detected
         except Exception as e:
             print(f"Error in extract_landmarks: {e}")
             return [], image, False
     
+    def draw_predicted_landmarks(self, image, landmarks_list):
+        """Overlay landmark hasil prediksi Kalman (frame tanpa hands.process)"""
+        h, w = image.shape[:2]
+        for landmarks in landmarks_list:
+            points = [(int(x * w), int(y * h)) for x, y in landmarks.reshape(-1, 3)[:, :2]]
+            for start_index, end_index in self.mp_hands.HAND_CONNECTIONS:
+                cv2.line(image, points[start_index], points[end_index], (200, 200, 200), 2)
+            for point in points:
+                cv2.circle(image, point, 3, (0, 200, 255), -1)
+    
+    def process_hands(self, image, roi, frame_width):
+        """hands.process untuk full frame atau crop ROI, dengan statistik pixel/latency"""
+        start = time.perf_counter()
+        # Hanya input MediaPipe yang di-resize; landmark ternormalisasi tidak berubah
+        image = self.resolution.resize(image, frame_width)
+        results = self.hands.process(self.frame_buffers.to_rgb(image))
+        self.hand_roi.record(image.shape, roi, time.perf_counter() - start)
+        return results
+    
     def preprocess_landmarks(self, landmarks):
-        """Preprocess landmarks untuk prediction"""
-        if len(landmarks) != self.config.NUM_FEATURES:
-            return None
-        
+        """Preprocess landmarks (satu tangan atau batch (n_hands, 63)) untuk prediction"""
         try:
-            # Convert to numpy array dan reshape
-            landmarks_array = np.array(landmarks).reshape(1, -1)
+            # Convert to numpy array 2D
+            landmarks_array = np.asarray(landmarks)
+            if landmarks_array.ndim == 1:
+                landmarks_array = landmarks_array.reshape(1, -1)
+            
+            if landmarks_array.shape[1] != self.config.NUM_FEATURES:
+                return None
+            
+            # Model fused menerima landmark mentah
+            if self.scaler is None:
+                return landmarks_array.astype(np.float32)
             
             # Transform menggunakan scaler yang sudah di-fit
             processed_landmarks = self.scaler.transform(landmarks_array)
@@ -167,52 +248,84 @@ class RealTimeCoordinateDetector:
             print(f"Preprocessing error: {e}")
             return None
     
-    def predict_from_landmarks(self, landmarks):
-        """Predict huruf dari landmarks"""
-        if len(landmarks) != self.config.NUM_FEATURES:
-            return "None", 0.0
+    def predict_batch(self, landmarks_list):
+        """Predict huruf untuk semua tangan sekaligus dalam satu forward pass"""
+        if len(landmarks_list) == 0:
+            return []
         
         try:
-            # Preprocess landmarks
-            processed_landmarks = self.preprocess_landmarks(landmarks)
-            
-            if processed_landmarks is None:
-                return "None", 0.0
+            # Stack semua tangan menjadi (n_hands, 63)
+            landmarks_array = np.asarray(landmarks_list, dtype=np.float32)
             
-            # Predict
-            predictions = self.model.predict(processed_landmarks, verbose=0)
-            predicted_class_idx = np.argmax(predictions[0])
-            confidence = np.max(predictions[0])
+            if landmarks_array.ndim != 2 or landmarks_array.shape[1] != self.config.NUM_FEATURES:
+                return [("None", 0.0)] * len(landmarks_list)
             
-            predicted_letter = self.config.LETTERS[predicted_class_idx]
+            # Motion gate -> cache -> predictor: inference hanya jika tangan bergerak
+            # dan landmark belum ada di cache
+            predictions = self.motion_gate.predict(landmarks_array, self.predict_cached)
+            predicted_class_idx = np.argmax(predictions, axis=1)
+            confidences = np.max(predictions, axis=1)
             
-            return predicted_letter, confidence
+            return [(self.config.LETTERS[idx], conf)
+                    for idx, conf in zip(predicted_class_idx, confidences)]
             
         except Exception as e:
             print(f"Prediction error: {e}")
+            return [("None", 0.0)] * len(landmarks_list)
+    
+    def predict_probabilities(self, landmarks_array):
+        """Scale + forward pass untuk batch landmark mentah (n, 63)"""
+        processed_landmarks = self.preprocess_landmarks(landmarks_array)
+        if processed_landmarks is None:
+            raise ValueError("Invalid landmarks shape")
+        return self.predictor.predict(processed_landmarks)
+    
+    def predict_cached(self, landmarks_array):
+        """Probabilitas lewat prediction cache"""
+        return self.prediction_cache.predict(landmarks_array, self.predict_probabilities)
+    
+    def predict_from_landmarks(self, landmarks):
+        """Predict huruf dari landmarks satu tangan"""
+        if len(landmarks) != self.config.NUM_FEATURES:
             return "None", 0.0
+        
+        return self.predict_batch([landmarks])[0]
     
-    def smooth_prediction(self, new_prediction, new_confidence):
-        """Smooth prediction menggunakan moving average"""
-        self.prediction_history.append((new_prediction, new_confidence))
-        
-        if len(self.prediction_history) > self.history_size:
-            self.prediction_history.pop(0)
-        
-        # Jika ada cukup history, gunakan voting dengan confidence
-        if len(self.prediction_history) >= 3:
-            # Cari prediction dengan confidence tertinggi
-            best_pred = max(self.prediction_history, key=lambda x: x[1])
-            self.current_prediction = best_pred[0]
-            self.current_confidence = best_pred[1]
-        else:
-            self.current_prediction = new_prediction
-            self.current_confidence = new_confidence
+    def smooth_prediction(self, new_prediction, new_confidence, hand_key=(0, None)):
+        """Smooth prediction per tangan menggunakan history"""
+        return self.smoother.update(hand_key, new_prediction, new_confidence)
+    
+    def predict_hands(self, landmarks_list, hand_keys=None):
+        """Predict + smoothing semua tangan; return (prediction, confidence) per tangan"""
+        if hand_keys is None:
+            hand_keys = self.hand_keys
+        hand_results = self.predict_batch(landmarks_list)
+        smoothed = [
+            self.smooth_prediction(prediction, confidence, hand_key)
+            for (prediction, confidence), hand_key in zip(hand_results, hand_keys)
+        ]
+        self.smoother.prune(hand_keys)
         
-        return self.current_prediction, self.current_confidence
+        # Prediksi utama = tangan dengan confidence tertinggi
+        if smoothed:
+            self.current_prediction, self.current_confidence = max(smoothed, key=lambda x: x[1])
+        
+        return smoothed
+    
+    def draw_hand_labels(self, frame, landmarks_list, hand_predictions, hand_keys=None):
+        """Tulis prediksi per tangan di dekat pergelangan (mode multi-hand)"""
+        if hand_keys is None:
+            hand_keys = self.hand_keys
+        h, w = frame.shape[:2]
+        for landmarks, (hand_index, handedness), (prediction, confidence) in zip(
+                landmarks_list, hand_keys, hand_predictions):
+            wrist_x, wrist_y = int(landmarks[0] * w), int(landmarks[1] * h)
+            label = f"{handedness or hand_index}: {prediction} ({confidence:.2f})"
+            cv2.putText(frame, label, (wrist_x - 40, min(wrist_y + 30, h - 10)),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
     
     def draw_interface(self, frame, prediction, confidence, hand_detected):
-        """Draw interface pada frame"""
+        """Draw interface pada frame (layer statis di-cache, hanya field dinamis yang dirender)"""
         # Calculate FPS
         self.frame_count += 1
         if self.frame_count % 30 == 0:
@@ -232,55 +345,81 @@ class RealTimeCoordinateDetector:
         else:
             pred_color = (0, 165, 255)  # Orange - low confidence
         
+        # Instruksi, background/border confidence bar dan label: satu blend
+        self.hud.draw_static(frame)
+        
         # Draw detection status
-        cv2.putText(frame, f"Status: {detection_status}", 
-                   (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, detection_color, 2)
+        self.hud.draw_text(frame, 'status', f"Status: {detection_status}",
+                           (10, 30), 0.7, detection_color, 2)
         
         # Draw prediction
-        cv2.putText(frame, f"Prediction: {prediction}", 
-                   (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 1, pred_color, 2)
-        cv2.putText(frame, f"Confidence: {confidence:.3f}", 
-                   (10, 110), cv2.FONT_HERSHEY_SIMPLEX, 0.7, pred_color, 2)
+        self.hud.draw_text(frame, 'prediction', f"Prediction: {prediction}",
+                           (10, 70), 1, pred_color, 2)
+        self.hud.draw_text(frame, 'confidence', f"Confidence: {confidence:.3f}",
+                           (10, 110), 0.7, pred_color, 2)
         
         # Draw FPS
-        cv2.putText(frame, f"FPS: {self.fps:.1f}", 
-                   (10, 150), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
-        
-        # Draw confidence bar
-        bar_width = 200
-        bar_height = 20
-        bar_x = 10
-        bar_y = 180
+        self.hud.draw_text(frame, 'fps', f"FPS: {self.fps:.1f} | {self.prediction_cache.stats_text()} | "
+                           f"{self.motion_gate.stats_text()}", (10, 150), 0.6, (255, 255, 255))
+        
+        # Confidence level (di dalam border statis)
+        bar_x, bar_y, bar_width, bar_height = self.CONFIDENCE_BAR
         fill_width = int(confidence * bar_width)
+        if fill_width > 1:
+            cv2.rectangle(frame, (bar_x + 1, bar_y + 1),
+                         (bar_x + fill_width - 1, bar_y + bar_height - 1),
+                         pred_color, -1)
+        
+        # Statistik ROI MediaPipe
+        self.hud.draw_text(frame, 'roi', f"{self.hand_roi.stats_text()} | {self.resolution.stats_text()}",
+                           (10, 385), 0.5, (255, 255, 255))
+        self.hud.draw_text(frame, 'scheduler', f"{self.scheduler.stats_text()} | {self.frame_buffers.stats_text()}",
+                           (10, 410), 0.5, (255, 255, 255))
+    
+    def render_static_hud(self, canvas):
+        """Bagian HUD yang tidak berubah antar frame, digambar sekali ke canvas BGRA"""
+        bar_x, bar_y, bar_width, bar_height = self.CONFIDENCE_BAR
         
         # Background bar
-        cv2.rectangle(frame, (bar_x, bar_y), 
+        cv2.rectangle(canvas, (bar_x, bar_y), 
                      (bar_x + bar_width, bar_y + bar_height), 
-                     (100, 100, 100), -1)
-        # Confidence level
-        cv2.rectangle(frame, (bar_x, bar_y), 
-                     (bar_x + fill_width, bar_y + bar_height), 
-                     pred_color, -1)
+                     (100, 100, 100, 255), -1)
         # Border
-        cv2.rectangle(frame, (bar_x, bar_y), 
+        cv2.rectangle(canvas, (bar_x, bar_y), 
                      (bar_x + bar_width, bar_y + bar_height), 
-                     (255, 255, 255), 1)
-        
-        cv2.putText(frame, "Confidence Level", 
-                   (bar_x, bar_y - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        
-        # Instructions
-        instructions = [
-            "Instructions:",
-            "1. Show one hand in the frame",
-            "2. Make sign language gestures",
-            "3. Press 'q' to quit",
-            "4. Press 'c' to capture frame"
-        ]
+                     (255, 255, 255, 255), 1)
         
-        for i, instruction in enumerate(instructions):
-            cv2.putText(frame, instruction, 
-                       (10, 230 + i * 25), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        cv2.putText(canvas, "Confidence Level", 
+                   (bar_x, bar_y - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255, 255), 1)
+        
+        for i, instruction in enumerate(self.INSTRUCTIONS):
+            cv2.putText(canvas, instruction, 
+                       (10, 230 + i * 25), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255, 255), 1)
+    
+    def average_fps(self):
+        elapsed = time.time() - self.session_start
+        return self.frame_count / elapsed if elapsed > 0 else 0.0
+    
+    def handle_key(self, key, frame):
+        """Handle key press; return False jika harus keluar"""
+        if key == ord('q'):
+            return False
+        elif key == ord('c'):
+            # Capture frame
+            timestamp = int(time.time())
+            capture_path = os.path.join(self.config.RESULTS_DIR, f'capture_{timestamp}.jpg')
+            cv2.imwrite(capture_path, frame)
+            print(f"Frame captured: {capture_path}")
+        elif key == ord('r'):
+            # Reset prediction history
+            self.reset_prediction_state()
+            print("Prediction history reset")
+        return True
+    
+    def reset_prediction_state(self):
+        self.smoother.reset()
+        self.motion_gate.reset()
+        self.hand_roi.reset()
     
     def run_detection(self):
         """Jalankan real-time detection"""
@@ -289,29 +428,32 @@ class RealTimeCoordinateDetector:
         print("Press 'q' to quit")
         print("Press 'c' to capture current frame")
         print("Press 'r' to reset prediction history")
+        self.session_start = time.time()
         
         try:
             while True:
-                ret, frame = self.cap.read()
+                # Capture ke buffer yang dipakai ulang, mirror in place
+                ret, frame = self.frame_buffers.read(self.cap)
                 if not ret:
                     print("Failed to capture frame")
                     break
                 
                 # Flip frame horizontally untuk mirror effect
-                frame = cv2.flip(frame, 1)
+                frame = self.frame_buffers.flip(frame)
                 
                 # Extract landmarks
-                landmarks, processed_frame, hand_detected = self.extract_landmarks(frame)
+                landmarks_list, processed_frame, hand_detected = self.extract_landmarks(frame)
                 
                 prediction = "None"
                 confidence = 0.0
                 
-                if hand_detected and len(landmarks) == self.config.NUM_FEATURES:
-                    # Predict dari landmarks
-                    new_prediction, new_confidence = self.predict_from_landmarks(landmarks)
+                if hand_detected and len(landmarks_list):
+                    # Predict semua tangan dalam satu batch + smoothing per tangan
+                    hand_predictions = self.predict_hands(landmarks_list)
+                    prediction, confidence = self.current_prediction, self.current_confidence
                     
-                    # Smooth prediction
-                    prediction, confidence = self.smooth_prediction(new_prediction, new_confidence)
+                    if len(landmarks_list) > 1:
+                        self.draw_hand_labels(processed_frame, landmarks_list, hand_predictions)
                 
                 # Draw interface
                 self.draw_interface(processed_frame, prediction, confidence, hand_detected)
@@ -321,18 +463,8 @@ class RealTimeCoordinateDetector:
                 
                 # Handle key presses
                 key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
+                if not self.handle_key(key, processed_frame):
                     break
-                elif key == ord('c'):
-                    # Capture frame
-                    timestamp = int(time.time())
-                    capture_path = os.path.join(self.config.RESULTS_DIR, f'capture_{timestamp}.jpg')
-                    cv2.imwrite(capture_path, processed_frame)
-                    print(f"Frame captured: {capture_path}")
-                elif key == ord('r'):
-                    # Reset prediction history
-                    self.prediction_history = []
-                    print("Prediction history reset")
         
         except Exception as e:
             print(f"Error during detection: {e}")
@@ -341,12 +473,182 @@ class RealTimeCoordinateDetector:
             # Cleanup
             self.cap.release()
             cv2.destroyAllWindows()
+            print(self.motion_gate.summary())
+            print(self.hand_roi.summary())
+            print(self.resolution.summary())
+            print(self.scheduler.summary())
+            print(self.frame_buffers.summary())
+            print(f"Average FPS: {self.average_fps():.1f}")
             print("Detection stopped")
+    
+    def run_pipelined_detection(self):
+        """Detection dengan stage capture -> landmark -> classify -> render di thread terpisah.
+
+        Antar stage dihubungkan queue bounded yang membuang item paling lama,
+        sehingga render selalu menampilkan frame terbaru dengan prediksi terbaru
+        yang tersedia. Timestamp capture ikut mengalir untuk mengukur latency
+        glass-to-glass.
+        """
+        print("=== COORDINATE-BASED SIGN LANGUAGE DETECTION (PIPELINED) ===")
+        print("Press 'q' to quit")
+        print("Press 'c' to capture current frame")
+        print("Press 'r' to reset prediction history")
+        self.session_start = time.time()
+        
+        queue_size = self.config.PIPELINE_QUEUE_SIZE
+        capture_queue = LatestQueue(queue_size)
+        classify_queue = LatestQueue(queue_size)
+        render_queue = LatestQueue(queue_size)
+        stop_event = threading.Event()
+        reset_event = threading.Event()
+        state_lock = threading.Lock()
+        frame_ids = itertools.count()
+        
+        # Prediksi terbaru dari classify stage
+        latest = {'prediction': "None", 'confidence': 0.0, 'hand_predictions': [], 'capture_time': None}
+        glass_to_glass = LatencyStats()
+        prediction_age = LatencyStats()
+        
+        def capture_stage():
+            ret, frame = self.cap.read()
+            if not ret:
+                print("Failed to capture frame")
+                stop_event.set()
+                return
+            capture_time = time.time()
+            # Frame milik packet (antar thread), jadi tidak memakai buffer bersama; flip in place
+            self.frame_buffers.count_owned_frame()
+            capture_queue.put_latest(FramePacket(next(frame_ids), capture_time, cv2.flip(frame, 1, dst=frame)))
+        
+        def landmark_stage():
+            packet = get_or_none(capture_queue)
+            if packet is None:
+                return
+            landmarks_list, packet.frame, packet.hand_detected = self.extract_landmarks(packet.frame)
+            # Copy: buffer extractor ditimpa frame berikutnya sebelum classify selesai
+            packet.landmarks_list = landmarks_list.copy()
+            packet.hand_keys = list(self.hand_keys)
+            packet.landmark_time = time.time()
+            classify_queue.put_latest(packet)
+            render_queue.put_latest(packet)
+        
+        def classify_stage():
+            packet = get_or_none(classify_queue)
+            if packet is None:
+                return
+            if reset_event.is_set():
+                self.reset_prediction_state()
+                reset_event.clear()
+            
+            prediction, confidence, hand_predictions = "None", 0.0, []
+            if packet.hand_detected and len(packet.landmarks_list):
+                hand_predictions = self.predict_hands(packet.landmarks_list, packet.hand_keys)
+                prediction, confidence = self.current_prediction, self.current_confidence
+            
+            with state_lock:
+                latest.update(prediction=prediction, confidence=confidence,
+                              hand_predictions=hand_predictions, capture_time=packet.capture_time)
+        
+        threads = [
+            start_stage(capture_stage, stop_event, 'capture'),
+            start_stage(landmark_stage, stop_event, 'landmark'),
+            start_stage(classify_stage, stop_event, 'classify'),
+        ]
+        
+        # Render stage di main thread (cv2.imshow)
+        try:
+            while not stop_event.is_set():
+                packet = get_or_none(render_queue)
+                if packet is None:
+                    continue
+                
+                with state_lock:
+                    snapshot = dict(latest)
+                
+                prediction, confidence = "None", 0.0
+                if packet.hand_detected:
+                    prediction, confidence = snapshot['prediction'], snapshot['confidence']
+                    if len(packet.landmarks_list) > 1 and \
+                            len(snapshot['hand_predictions']) == len(packet.landmarks_list):
+                        self.draw_hand_labels(packet.frame, packet.landmarks_list,
+                                              snapshot['hand_predictions'], packet.hand_keys)
+                
+                self.draw_interface(packet.frame, prediction, confidence, packet.hand_detected)
+                self.hud.draw_text(packet.frame, 'latency', f"Latency: {glass_to_glass.mean_ms:.0f} ms",
+                                   (10, 360), 0.5, (255, 255, 255))
+                cv2.imshow('Coordinate-Based Sign Language Detection', packet.frame)
+                key = cv2.waitKey(1) & 0xFF
+                
+                # Diukur setelah waitKey: window baru benar-benar digambar di event loop HighGUI
+                now = time.time()
+                glass_to_glass.add(now - packet.capture_time)
+                if snapshot['capture_time'] is not None:
+                    prediction_age.add(now - snapshot['capture_time'])
+                
+                if key == ord('r'):
+                    reset_event.set()
+                    print("Prediction history reset")
+                elif not self.handle_key(key, packet.frame):
+                    break
+        
+        except Exception as e:
+            print(f"Error during detection: {e}")
+        
+        finally:
+            stop_event.set()
+            for thread in threads:
+                thread.join(timeout=1.0)
+            self.cap.release()
+            cv2.destroyAllWindows()
+            print(f"Glass-to-glass latency: {glass_to_glass.summary()}")
+            print(f"Prediction age at display: {prediction_age.summary()}")
+            print(f"Dropped frames (capture/classify/render queue): "
+                  f"{capture_queue.dropped}/{classify_queue.dropped}/{render_queue.dropped}")
+            print(self.motion_gate.summary())
+            print(self.hand_roi.summary())
+            print(self.resolution.summary())
+            print(self.scheduler.summary())
+            print(self.frame_buffers.summary())
+            print(f"Average FPS: {self.average_fps():.1f}")
+            print("Detection stopped")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Coordinate-based sign language detection")
+    parser.add_argument('--backend', choices=sorted(PREDICTORS), default=None,
+                        help="Inference backend (default: Config.INFERENCE_BACKEND)")
+    parser.add_argument('--model', default=None, help="Path ke file model")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Matikan prediction cache (untuk benchmarking)")
+    parser.add_argument('--no-gate', action='store_true',
+                        help="Matikan motion gate (score setiap frame)")
+    parser.add_argument('--no-roi', action='store_true',
+                        help="Selalu proses full frame di MediaPipe (tanpa crop ROI)")
+    parser.add_argument('--fixed-resolution', action='store_true',
+                        help="Matikan adaptive resolution (input MediaPipe selalu full frame)")
+    parser.add_argument('--frame-skip', action='store_true',
+                        help="hands.process setiap N frame (adaptif), Kalman filter di antaranya")
+    parser.add_argument('--pipelined', action='store_true',
+                        help="Jalankan capture/landmark/classify/render di thread terpisah")
+    parser.add_argument('--server', default=None,
+                        help="Pakai inference server lokal di alamat ini ('host:port' atau 'unix:/path')")
+    args = parser.parse_args()
+    if args.server:
+        args.backend, args.model = 'remote', args.server
+    return args
 
 def main():
+    args = parse_args()
     try:
-        detector = RealTimeCoordinateDetector()
-        detector.run_detection()
+        detector = RealTimeCoordinateDetector(model_path=args.model, backend=args.backend,
+                                              use_cache=False if args.no_cache else None,
+                                              use_gate=False if args.no_gate else None,
+                                              use_roi=False if args.no_roi else None,
+                                              adaptive_resolution=False if args.fixed_resolution else None,
+                                              frame_skip=True if args.frame_skip else None)
+        if args.pipelined:
+            detector.run_pipelined_detection()
+        else:
+            detector.run_detection()
     except Exception as e:
         print(f"❌ Fatal error: {e}")
         print("Please check:")
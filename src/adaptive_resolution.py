@@ -0,0 +1,82 @@
+import time
+import numpy as np
+from src.config import Config
+
+class ResolutionController:
+    """Turun/naik resolusi input MediaPipe berdasarkan latency hands.process.
+
+    Lebar input dipilih dari RESOLUTION_LADDER (mis. 640 -> 480 -> 320).
+    Rata-rata latency per window dibandingkan dengan budget: di atas budget
+    turun satu anak tangga, di bawah RESOLUTION_UP_RATIO * budget naik satu.
+    Jarak antar threshold + cooldown setelah perubahan = hysteresis, sehingga
+    resolusi tidak bolak-balik. Hanya input MediaPipe yang di-resize; frame
+    display tetap full resolution dan landmark ternormalisasi tidak berubah.
+    """
+
+    def __init__(self, ladder=None, budget_ms=None, enabled=None, name="MediaPipe"):
+        config = Config()
+        self.ladder = sorted(ladder or config.RESOLUTION_LADDER, reverse=True)
+        self.budget = (budget_ms or config.RESOLUTION_BUDGET_MS) / 1000.0
+        self.up_ratio = config.RESOLUTION_UP_RATIO
+        self.window = config.RESOLUTION_WINDOW
+        self.cooldown = config.RESOLUTION_COOLDOWN
+        self.enabled = config.RESOLUTION_ADAPTIVE if enabled is None else enabled
+        self.name = name
+
+        self.level = 0
+        self.samples = []
+        self.frames_since_change = 0
+        self.changes = []  # (timestamp, width lama, width baru, alasan)
+
+    @property
+    def width(self):
+        return self.ladder[self.level]
+
+    def resize(self, image, frame_width):
+        """Resize image (full frame atau crop) dengan skala ladder / lebar frame asli"""
+        import cv2
+
+        scale = self.width / frame_width
+        if not self.enabled or scale >= 1.0:
+            return image
+        h, w = image.shape[:2]
+        size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+    def update(self, latency):
+        """Catat latency satu frame (detik); ganti resolusi jika perlu"""
+        if not self.enabled:
+            return
+        self.samples.append(latency)
+        self.frames_since_change += 1
+        if len(self.samples) > self.window:
+            self.samples.pop(0)
+        if self.frames_since_change < self.cooldown or len(self.samples) < self.window:
+            return
+
+        mean_latency = float(np.mean(self.samples))
+        if mean_latency > self.budget and self.level < len(self.ladder) - 1:
+            self._change(self.level + 1,
+                         f"{mean_latency*1000:.1f} ms > budget {self.budget*1000:.1f} ms")
+        elif mean_latency < self.budget * self.up_ratio and self.level > 0:
+            self._change(self.level - 1,
+                         f"{mean_latency*1000:.1f} ms < {self.up_ratio:.0%} of budget {self.budget*1000:.1f} ms")
+
+    def _change(self, level, reason):
+        old_width, new_width = self.width, self.ladder[level]
+        self.level = level
+        self.samples = []
+        self.frames_since_change = 0
+        self.changes.append((time.time(), old_width, new_width, reason))
+        print(f"{time.strftime('%H:%M:%S')} {self.name} resolution {old_width} -> {new_width} px wide: {reason}")
+
+    def stats_text(self):
+        if not self.enabled:
+            return "Res: fixed"
+        return f"Res: {self.width}px"
+
+    def summary(self):
+        if not self.enabled:
+            return "Adaptive resolution: off"
+        return (f"Adaptive resolution: {len(self.changes)} change(s), "
+                f"final width {self.width} px (budget {self.budget*1000:.1f} ms)")
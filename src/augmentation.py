@@ -0,0 +1,181 @@
+import argparse
+import copy
+import json
+import os
+import time
+import numpy as np
+from src.config import Config
+
+class LandmarkAugmenter:
+    """Augmentasi landmark (batch, 21, 3) dalam satu operasi NumPy per batch.
+
+    Per sample: rotasi in-plane + tilt 3D di sekitar wrist (landmark 0),
+    scale, mirror horizontal, translasi dan jitter per landmark. Koordinat
+    x/z dikalikan aspect ratio kamera sebelum rotasi agar rotasi terjadi di
+    ruang pixel, bukan di ruang ternormalisasi yang tidak persegi.
+
+    z wrist tidak diubah: MediaPipe mendefinisikan z relatif terhadap wrist,
+    jadi fitur itu konstan (0) di data training dan scale_ StandardScaler-nya
+    ~1e-7; noise sekecil apa pun akan menjadi ribuan standar deviasi.
+    """
+
+    def __init__(self, seed=None, rotation_deg=None, tilt_deg=None, scale_range=None,
+                 translate=None, jitter=None, mirror_prob=None, aspect_ratio=None):
+        config = Config()
+        self.seed = config.AUGMENT_SEED if seed is None else seed
+        self.rng = np.random.default_rng(self.seed)
+        self.rotation = np.deg2rad(config.AUGMENT_ROTATION_DEG if rotation_deg is None else rotation_deg)
+        self.tilt = np.deg2rad(config.AUGMENT_TILT_DEG if tilt_deg is None else tilt_deg)
+        self.scale_range = config.AUGMENT_SCALE_RANGE if scale_range is None else scale_range
+        self.translate = config.AUGMENT_TRANSLATE if translate is None else translate
+        self.jitter = config.AUGMENT_JITTER if jitter is None else jitter
+        self.mirror_prob = config.AUGMENT_MIRROR_PROB if mirror_prob is None else mirror_prob
+        self.aspect_ratio = config.AUGMENT_ASPECT_RATIO if aspect_ratio is None else aspect_ratio
+
+    def for_batch(self, index):
+        """Salinan dengan RNG sendiri dari (seed, index batch): hasil tidak bergantung urutan thread"""
+        augmenter = copy.copy(self)
+        augmenter.rng = np.random.default_rng((self.seed, int(index)))
+        return augmenter
+
+    def rotation_matrices(self, n):
+        """(n, 3, 3) = Rz(roll) @ Ry(yaw) @ Rx(pitch) dengan sudut acak per sample"""
+        roll = self.rng.uniform(-self.rotation, self.rotation, n)
+        yaw, pitch = self.rng.uniform(-self.tilt, self.tilt, (2, n))
+        cr, sr = np.cos(roll), np.sin(roll)
+        cy, sy = np.cos(yaw), np.sin(yaw)
+        cp, sp = np.cos(pitch), np.sin(pitch)
+
+        matrices = np.empty((n, 3, 3), dtype=np.float32)
+        matrices[:, 0, 0] = cr * cy
+        matrices[:, 0, 1] = cr * sy * sp - sr * cp
+        matrices[:, 0, 2] = cr * sy * cp + sr * sp
+        matrices[:, 1, 0] = sr * cy
+        matrices[:, 1, 1] = sr * sy * sp + cr * cp
+        matrices[:, 1, 2] = sr * sy * cp - cr * sp
+        matrices[:, 2, 0] = -sy
+        matrices[:, 2, 1] = cy * sp
+        matrices[:, 2, 2] = cy * cp
+        return matrices
+
+    def augment(self, batch):
+        """Return batch teraugmentasi (float32) dengan shape sama: (n, 63) atau (n, 21, 3)"""
+        shape = np.shape(batch)
+        points = np.asarray(batch, dtype=np.float32).reshape(len(batch), -1, 3)
+        n = len(points)
+        axis_scale = np.array([self.aspect_ratio, 1.0, self.aspect_ratio], dtype=np.float32)
+
+        wrist = points[:, :1, :]
+        relative = (points - wrist) * axis_scale
+
+        scale = self.rng.uniform(1 - self.scale_range, 1 + self.scale_range, n).astype(np.float32)
+        mirror = np.where(self.rng.random(n) < self.mirror_prob, -1.0, 1.0).astype(np.float32)
+        # Mirror dan scale digabung ke matriks rotasi: satu matmul untuk semua transformasi linear
+        matrices = self.rotation_matrices(n) * scale[:, None, None]
+        matrices[:, :, 0] *= mirror[:, None]
+        relative = np.matmul(relative, matrices.transpose(0, 2, 1))
+
+        shift = np.zeros((n, 1, 3), dtype=np.float32)
+        shift[:, 0, :2] = self.rng.uniform(-self.translate, self.translate, (n, 2))
+        augmented = relative / axis_scale + wrist + shift
+        if self.jitter > 0:
+            noise = self.rng.normal(0.0, self.jitter, augmented.shape).astype(np.float32)
+            noise[:, 0, 2] = 0.0  # z wrist selalu 0
+            augmented += noise
+        return augmented.reshape(shape)
+
+    def augment_scaled(self, batch, scaler):
+        """Augmentasi data yang sudah di-StandardScaler: kembalikan ke koordinat mentah dulu.
+
+        Fitur yang (hampir) konstan di data training (scale_ < 1e-4) dibiarkan
+        apa adanya, karena error float32 pun sudah besar setelah dibagi scale_.
+        """
+        batch = np.asarray(batch, dtype=np.float32)
+        mean = scaler.mean_.astype(np.float32)
+        scale = scaler.scale_.astype(np.float32)
+        augmented = (self.augment(batch * scale + mean) - mean) / scale
+        constant = scaler.scale_ < 1e-4
+        augmented[..., constant] = batch[..., constant]
+        return augmented
+
+    def batches(self, X, y, batch_size, scaler=None):
+        """Generator tak terbatas (X_batch, y_batch) teraugmentasi, diacak ulang setiap epoch"""
+        n = len(X)
+        while True:
+            order = self.rng.permutation(n)
+            for start in range(0, n, batch_size):
+                index = order[start:start + batch_size]
+                if scaler is not None:
+                    yield self.augment_scaled(X[index], scaler), y[index]
+                else:
+                    yield self.augment(X[index]), y[index]
+
+def check_scaled_range(augmenter, X=None, scaler=None, limit=20.0):
+    """Pastikan batch hasil augment_scaled tetap di rentang wajar (|x| < limit std).
+
+    Tanpa X/scaler dipakai data sintetis dengan z wrist = 0 seperti output MediaPipe.
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    if X is None:
+        rng = np.random.default_rng(0)
+        points = rng.uniform(0.3, 0.7, (4096, 21, 3)).astype(np.float32)
+        points[:, :, 2] = rng.normal(0.0, 0.05, (4096, 21))
+        points[:, 0, 2] = 0.0
+        X = points.reshape(len(points), -1)
+    if scaler is None:
+        scaler = StandardScaler().fit(X)
+    X_scaled = scaler.transform(X).astype(np.float32)
+
+    augmented = augmenter.augment_scaled(X_scaled, scaler)
+    worst = float(np.abs(augmented).max())
+    if not np.isfinite(worst) or worst > limit:
+        feature = int(np.abs(augmented).max(axis=0).argmax())
+        raise ValueError(f"Augmented scaled batch out of range: |x| = {worst:.1f} at feature {feature}")
+    return worst
+
+def benchmark_augmentation(batch_sizes=(32, 256, 4096), num_samples=20000, seed=0):
+    """Bandingkan samples/s: augmentasi per sample vs satu operasi per batch"""
+    config = Config()
+    rng = np.random.default_rng(seed)
+    data = rng.random((num_samples, config.NUM_FEATURES), dtype=np.float32)
+    augmenter = LandmarkAugmenter(seed=seed)
+
+    # Sanity check: seed sama -> hasil sama
+    assert np.array_equal(LandmarkAugmenter(seed=1).augment(data[:64]),
+                          LandmarkAugmenter(seed=1).augment(data[:64]))
+    check_scaled_range(augmenter)
+
+    print("=== LANDMARK AUGMENTATION BENCHMARK ===")
+    report = {'num_samples': num_samples, 'results': []}
+
+    loop_samples = min(num_samples, 2000)
+    start = time.perf_counter()
+    for i in range(loop_samples):
+        augmenter.augment(data[i:i + 1])
+    per_sample_rate = loop_samples / (time.perf_counter() - start)
+    report['per_sample_loop'] = per_sample_rate
+    print(f"per-sample loop: {per_sample_rate:12.0f} samples/s")
+
+    for batch_size in batch_sizes:
+        start = time.perf_counter()
+        for offset in range(0, num_samples, batch_size):
+            augmenter.augment(data[offset:offset + batch_size])
+        rate = num_samples / (time.perf_counter() - start)
+        report['results'].append({'batch_size': batch_size, 'samples_per_second': rate,
+                                  'speedup': rate / per_sample_rate})
+        print(f"batch {batch_size:5d}:     {rate:12.0f} samples/s | speedup {rate / per_sample_rate:.0f}x")
+
+    os.makedirs(config.RESULTS_DIR, exist_ok=True)
+    report_path = os.path.join(config.RESULTS_DIR, 'augmentation_benchmark.json')
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Benchmark saved: {report_path}")
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark landmark augmentation")
+    parser.add_argument('--samples', type=int, default=20000)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[32, 256, 4096])
+    args = parser.parse_args()
+    benchmark_augmentation(args.batch_sizes, args.samples)
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import numpy as np
+from src.config import Config
+
+FORMAT_VERSION = 1
+
+def header_path(path):
+    """complete_dataset.bin -> complete_dataset.json"""
+    return os.path.splitext(path)[0] + '.json'
+
+def file_hash(path, chunk_size=1 << 20):
+    """SHA-256 isi file (dibaca per chunk)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def write_binary_dataset(features, labels, class_names, path=None):
+    """Tulis dataset biner: features float32 (n, 63) lalu labels uint8 (n,) + header JSON.
+
+    labels adalah index ke class_names. File .bin ditulis ke file sementara
+    lalu di-rename, header ditulis terakhir, sehingga pembaca tidak pernah
+    melihat dataset setengah jadi.
+    """
+    config = Config()
+    path = path or config.BINARY_DATASET_PATH
+    features = np.ascontiguousarray(features, dtype=np.float32)
+    labels = np.ascontiguousarray(labels, dtype=np.uint8)
+    if features.ndim != 2 or len(features) != len(labels):
+        raise ValueError(f"features {features.shape} and labels {labels.shape} do not match")
+    if len(class_names) > 256:
+        raise ValueError(f"uint8 labels support at most 256 classes, got {len(class_names)}")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(features.tobytes())
+        f.write(labels.tobytes())
+    os.replace(tmp_path, path)
+
+    header = {
+        'version': FORMAT_VERSION,
+        'num_samples': int(features.shape[0]),
+        'num_features': int(features.shape[1]),
+        'features_dtype': 'float32',
+        'labels_dtype': 'uint8',
+        'features_offset': 0,
+        'labels_offset': features.nbytes,
+        'class_names': [str(name) for name in class_names],
+        'sha256': file_hash(path),
+    }
+    tmp_path = header_path(path) + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(header, f, indent=2)
+    os.replace(tmp_path, header_path(path))
+    return header
+
+def read_header(path=None):
+    path = path or Config().BINARY_DATASET_PATH
+    with open(header_path(path)) as f:
+        header = json.load(f)
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported dataset version {header.get('version')} in {header_path(path)}")
+    return header
+
+def load_binary_dataset(path=None, verify=False):
+    """Return (features, labels, header) sebagai np.memmap read-only tanpa parsing/copy.
+
+    verify=True menghitung ulang SHA-256 dan membandingkan dengan header
+    (membaca seluruh file, jadi default-nya dimatikan).
+    """
+    path = path or Config().BINARY_DATASET_PATH
+    header = read_header(path)
+    n, d = header['num_samples'], header['num_features']
+    expected_size = header['labels_offset'] + n
+    if os.path.getsize(path) != expected_size:
+        raise ValueError(f"{path} is {os.path.getsize(path)} bytes, header expects {expected_size}")
+    if verify and file_hash(path) != header['sha256']:
+        raise ValueError(f"{path} does not match the hash in {header_path(path)}")
+    if n == 0:
+        return np.empty((0, d), dtype=np.float32), np.empty(0, dtype=np.uint8), header
+
+    features = np.memmap(path, dtype=np.float32, mode='r', offset=header['features_offset'], shape=(n, d))
+    labels = np.memmap(path, dtype=np.uint8, mode='r', offset=header['labels_offset'], shape=(n,))
+    return features, labels, header
+
+def dataframe_to_binary(df, path=None):
+    """DataFrame berkolom x_0..z_20,label (format CSV koleksi) -> dataset biner"""
+    feature_columns = [col for col in df.columns if col != 'label']
+    class_names, labels = np.unique(df['label'].astype(str).values, return_inverse=True)
+    return write_binary_dataset(df[feature_columns].values, labels, class_names, path)
+
+def convert_csv(csv_path=None, path=None):
+    """Konversi complete_dataset.csv lama ke format biner (sekali saja)"""
+    import pandas as pd
+
+    config = Config()
+    csv_path = csv_path or config.COORDINATE_CSV
+    header = dataframe_to_binary(pd.read_csv(csv_path), path)
+    print(f"✅ Converted {csv_path} -> {path or config.BINARY_DATASET_PATH} "
+          f"({header['num_samples']} samples)")
+    return header
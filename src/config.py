@@ -5,6 +5,7 @@ class Config:
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     DATA_DIR = os.path.join(BASE_DIR, 'data')
     RAW_COORD_DIR = os.path.join(DATA_DIR, 'raw_coordinates')
+    IMAGE_COORD_DIR = os.path.join(DATA_DIR, 'image_coordinates')  # build_image_dataset.py, terpisah dari koleksi webcam
     PROCESSED_DIR = os.path.join(DATA_DIR, 'processed')
     MODELS_DIR = os.path.join(DATA_DIR, 'models')
     RESULTS_DIR = os.path.join(BASE_DIR, 'results')  # ✅ TAMBAH INI
@@ -19,14 +20,96 @@ class Config:
     NUM_FEATURES = NUM_LANDMARKS * 3  # x, y, z untuk setiap landmark
     NUM_CLASSES = 26  # A-Z
     
+    # Penulisan sample saat koleksi (collect.py)
+    SAMPLE_WRITER_FLUSH_ROWS = 50  # Flush setelah N baris di buffer
+    SAMPLE_WRITER_FLUSH_SECONDS = 2.0  # ... atau setelah N detik
+    SAMPLE_WRITER_QUEUE_SIZE = 256  # Sample antri maksimal sebelum capture loop menunggu writer
+    
+    # Dataset dari video / gambar (build_video_dataset.py, build_image_dataset.py)
+    VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm')
+    VIDEO_CHECKPOINT_NAME = 'video_checkpoint.json'  # Di folder output, untuk resume
+    IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')  # build_image_dataset.py
+    
     # Parameter model
     BATCH_SIZE = 32
     EPOCHS = 100
     LEARNING_RATE = 0.001
     
+    # Augmentasi landmark on-the-fly (train_coordinate_model.py --augment)
+    AUGMENT_SEED = 42
+    AUGMENT_ROTATION_DEG = 15.0  # Rotasi in-plane maksimum di sekitar wrist
+    AUGMENT_TILT_DEG = 10.0  # Rotasi 3D (pitch/yaw) maksimum
+    AUGMENT_SCALE_RANGE = 0.1  # Scale acak 1 +/- 0.1
+    AUGMENT_TRANSLATE = 0.05  # Translasi x/y maksimum (koordinat ternormalisasi)
+    AUGMENT_JITTER = 0.003  # Std noise gaussian per landmark
+    AUGMENT_MIRROR_PROB = 0.5  # Peluang mirror horizontal (tangan kiri/kanan)
+    AUGMENT_ASPECT_RATIO = 640 / 480  # Lebar/tinggi frame kamera saat koleksi
+    
+    # Pipeline tf.data (train_coordinate_model.py --tf-data)
+    TFDATA_SHUFFLE_BUFFER = 10000  # >= jumlah sample training -> shuffle penuh
+    
     # Label huruf A-Z
     LETTERS = [chr(i) for i in range(65, 91)]  # A-Z
     
     # File paths
-    COORDINATE_CSV = os.path.join(PROCESSED_DIR, 'complete_dataset.csv')
-    MODEL_PATH = os.path.join(MODELS_DIR, 'coordinate_model.h5')
\ No newline at end of file
+    COORDINATE_CSV = os.path.join(PROCESSED_DIR, 'complete_dataset.csv')  # Format lama (dikonversi otomatis)
+    # Dataset biner: float32 features + uint8 labels, header di complete_dataset.json
+    BINARY_DATASET_PATH = os.path.join(PROCESSED_DIR, 'complete_dataset.bin')
+    # Size/mtime/hash per file sumber untuk combine incremental
+    COMBINE_MANIFEST_PATH = os.path.join(PROCESSED_DIR, 'combine_manifest.json')
+    # Cache split train/val/test + scaler, key = hash dataset + parameter split
+    SPLIT_CACHE_DIR = os.path.join(PROCESSED_DIR, 'split_cache')
+    SPLIT_RANDOM_STATE = 42
+    MODEL_PATH = os.path.join(MODELS_DIR, 'coordinate_model.h5')
+    TFLITE_MODEL_PATH = os.path.join(MODELS_DIR, 'model.tflite')
+    # Model dengan StandardScaler yang sudah di-fold (input: landmark mentah)
+    FUSED_MODEL_PATH = os.path.join(MODELS_DIR, 'coordinate_model_fused.h5')
+    FUSED_TFLITE_MODEL_PATH = os.path.join(MODELS_DIR, 'model_fused.tflite')
+    INT8_TFLITE_MODEL_PATH = os.path.join(MODELS_DIR, 'model_int8.tflite')
+    INT8_CALIBRATION_SAMPLES = 500  # Sample representative dataset untuk int8
+    
+    # Parameter inference
+    INFERENCE_BACKEND = 'keras'  # 'keras', 'tflite', 'numpy' atau 'remote'
+    INFERENCE_TOLERANCE = 1e-5  # Max selisih probabilitas NumPy engine vs Keras
+    
+    # Prediction cache (LRU, key = landmark relatif wrist yang di-quantize)
+    PREDICTION_CACHE_ENABLED = True
+    PREDICTION_CACHE_SIZE = 2048  # Jumlah entry maksimum
+    PREDICTION_CACHE_GRID = 0.005  # Ukuran grid quantization (koordinat ternormalisasi)
+    
+    # Motion gate: pakai ulang prediksi jika tangan tidak bergerak
+    MOTION_GATE_ENABLED = True
+    MOTION_GATE_THRESHOLD = 0.004  # Displacement maksimum per landmark (koordinat ternormalisasi)
+    MOTION_GATE_MAX_SKIP = 10  # Paksa re-score setiap N frame
+    
+    # ROI crop MediaPipe: proses hanya area di sekitar tangan frame sebelumnya
+    ROI_ENABLED = True
+    ROI_PADDING = 0.3  # Padding per sisi, relatif terhadap ukuran bounding box tangan
+    ROI_MIN_SIZE = 160  # Sisi crop minimum (pixel)
+    ROI_SIZE_STEP = 32  # Sisi crop dibulatkan ke kelipatan ini agar input MediaPipe stabil
+    ROI_MAX_AREA_RATIO = 0.8  # Crop lebih besar dari ini -> pakai full frame
+    
+    # Adaptive resolution: lebar input MediaPipe mengikuti budget latency hands.process
+    RESOLUTION_ADAPTIVE = True
+    RESOLUTION_LADDER = (640, 480, 320)  # Lebar input MediaPipe (pixel)
+    RESOLUTION_BUDGET_MS = 20.0  # Target latency hands.process per frame
+    RESOLUTION_UP_RATIO = 0.6  # Naik resolusi jika latency < 60% budget
+    RESOLUTION_WINDOW = 15  # Jumlah frame untuk rata-rata latency
+    RESOLUTION_COOLDOWN = 30  # Minimal frame antar perubahan resolusi
+    
+    # Frame skip scheduler: hands.process setiap N frame, Kalman filter di antaranya
+    SKIP_SCHEDULER_ENABLED = False  # Aktifkan dengan --frame-skip (untuk CPU lemah)
+    SKIP_MAX_INTERVAL = 4  # N maksimum
+    SKIP_ERROR_LOW = 0.01  # Error prediksi di bawah ini -> N naik
+    SKIP_ERROR_HIGH = 0.03  # Error prediksi di atas ini -> N kembali ke 1
+    KALMAN_PROCESS_NOISE = 4.0  # Varians akselerasi (koordinat ternormalisasi / s^2)
+    KALMAN_MEASUREMENT_NOISE = 1e-5  # Varians noise landmark MediaPipe
+    
+    # Pipelined detection (--pipelined)
+    PIPELINE_QUEUE_SIZE = 2  # Kapasitas queue antar stage (item paling lama dibuang)
+    
+    # Inference server lokal (python -m src.inference_server)
+    INFERENCE_SERVER_ADDRESS = '127.0.0.1:8765'  # atau 'unix:/tmp/sign_inference.sock'
+    INFERENCE_SERVER_BATCH_WINDOW_MS = 2.0
+    INFERENCE_SERVER_MAX_BATCH = 64
+    INFERENCE_SERVER_MAX_ROWS = INFERENCE_SERVER_MAX_BATCH * 2  # Request lebih besar ditolak sebelum body dibaca
\ No newline at end of file
@@ -4,44 +4,60 @@ import numpy as np
 import pandas as pd
 import os
 from .config import Config
+from .landmark_extractor import LandmarkExtractor
+from .sample_writer import BackgroundSampleWriter
+from .dataset_combiner import DatasetCombiner
 
 class CoordinateExtractor:
-    def __init__(self):
+    def __init__(self, static_image_mode=False):
         self.config = Config()
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
+            static_image_mode=static_image_mode,
             max_num_hands=self.config.MAX_HANDS,
             min_detection_confidence=self.config.MIN_DETECTION_CONFIDENCE,
             min_tracking_confidence=self.config.MIN_TRACKING_CONFIDENCE
         )
         self.mp_draw = mp.solutions.drawing_utils
+        self.landmark_extractor = LandmarkExtractor()
         
     def extract_landmarks(self, image):
         """Extract landmarks dari image"""
         rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         results = self.hands.process(rgb_image)
         
-        landmarks_list = []
+        # View (n_hands, 63) ke buffer float32 extractor
+        landmarks_list, _ = self.landmark_extractor.extract(results)
         
         if results.multi_hand_landmarks:
             for hand_landmarks in results.multi_hand_landmarks:
-                landmarks = []
-                for landmark in hand_landmarks.landmark:
-                    landmarks.extend([landmark.x, landmark.y, landmark.z])
-                landmarks_list.append(landmarks)
-                
                 # Draw landmarks (optional untuk visualization)
                 self.mp_draw.draw_landmarks(
                     image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
         
         return landmarks_list, image
     
+    def extract_image_file(self, image_path):
+        """Landmark tangan pertama dari file gambar (tanpa drawing).
+        
+        Return (landmarks (63,) atau None, status): 'ok', 'decode_error' atau 'no_hand'
+        """
+        image = cv2.imread(image_path)
+        if image is None:
+            return None, 'decode_error'
+        results = self.hands.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        landmarks_list, _ = self.landmark_extractor.extract(results)
+        if not len(landmarks_list):
+            return None, 'no_hand'
+        return landmarks_list[0].tolist(), 'ok'
+    
     def collect_coordinates_for_letter(self, letter, num_samples=1000):
         """Koleksi koordinat untuk huruf tertentu"""
         cap = cv2.VideoCapture(0)
         collected_data = []
         count = 0
+        # Sample ditulis di background thread; file huruf ini ditimpa seperti save_to_csv
+        writer = BackgroundSampleWriter(self.config.RAW_COORD_DIR, mode='w')
         
         print(f"Koleksi data untuk huruf: {letter}")
         print("Tekan 's' untuk simpan, 'q' untuk keluar")
@@ -55,11 +71,11 @@ class CoordinateExtractor:
             landmarks_list, processed_frame = self.extract_landmarks(frame)
             
             # Jika tangan terdeteksi
-            if landmarks_list and len(landmarks_list[0]) == 63:  # 21 landmarks * 3
+            if len(landmarks_list) and len(landmarks_list[0]) == 63:  # 21 landmarks * 3
                 # Tampilkan preview
                 cv2.putText(processed_frame, f"Letter: {letter}", (10, 30),
                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                cv2.putText(processed_frame, f"Samples: {count}/{num_samples}", (10, 70),
+                cv2.putText(processed_frame, f"Samples: {writer.confirmed(letter)}/{num_samples}", (10, 70),
                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
                 cv2.putText(processed_frame, "Press 's' to save", (10, 110),
                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
@@ -70,8 +86,9 @@ class CoordinateExtractor:
                 
                 if key == ord('s'):
                     # Simpan koordinat + label
-                    sample_data = landmarks_list[0] + [letter]
-                    collected_data.append(sample_data)
+                    sample_data = landmarks_list[0].tolist()
+                    writer.submit(sample_data, letter)
+                    collected_data.append(sample_data + [letter])
                     count += 1
                     print(f"Saved sample {count}/{num_samples}")
                     
@@ -91,9 +108,10 @@ class CoordinateExtractor:
         cap.release()
         cv2.destroyAllWindows()
         
-        # Simpan ke CSV
+        writer.close()
         if collected_data:
-            self.save_to_csv(collected_data, letter)
+            print(f"Data saved to: {os.path.join(self.config.RAW_COORD_DIR, f'{letter}_coordinates.csv')}")
+            print(writer.summary())
             
         return collected_data
     
@@ -116,24 +134,19 @@ class CoordinateExtractor:
         
         return df
     
-    def create_combined_dataset(self):
-        """Gabungkan semua file CSV menjadi dataset lengkap"""
-        all_data = []
+    def create_combined_dataset(self, force=False):
+        """Gabungkan semua file CSV menjadi dataset lengkap (hanya file yang berubah di-parse)"""
+        stats = DatasetCombiner(self.config.RAW_COORD_DIR, self.config.BINARY_DATASET_PATH).combine(force)
         
-        for letter in self.config.LETTERS:
-            csv_path = os.path.join(self.config.RAW_COORD_DIR, f'{letter}_coordinates.csv')
-            if os.path.exists(csv_path):
-                df = pd.read_csv(csv_path)
-                all_data.append(df)
-                print(f"Loaded {len(df)} samples for {letter}")
+        if not stats['samples']:
+            print("No data found!")
+            return None
         
-        if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
-            os.makedirs(self.config.PROCESSED_DIR, exist_ok=True)
-            combined_df.to_csv(self.config.COORDINATE_CSV, index=False)
-            print(f"Combined dataset saved to: {self.config.COORDINATE_CSV}")
-            print(f"Total samples: {len(combined_df)}")
-            return combined_df
+        for key in stats['changed']:
+            print(f"Loaded {stats['class_counts'].get(key.split('/')[-1], 0)} samples for {key}")
+        if stats['updated']:
+            print(f"Combined dataset saved to: {self.config.BINARY_DATASET_PATH}")
         else:
-            print("No data found!")
-            return None
\ No newline at end of file
+            print(f"Combined dataset up to date: {self.config.BINARY_DATASET_PATH}")
+        print(f"Total samples: {stats['samples']} ({stats['seconds']*1000:.1f} ms)")
+        return stats
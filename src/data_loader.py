@@ -1,74 +1,132 @@
-import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder, StandardScaler
+import hashlib
+import joblib
 import os
 from src.config import Config
+from src.binary_dataset import load_binary_dataset, convert_csv
 
 class CoordinateDataLoader:
+    SPLIT_ARRAYS = ('X_train', 'y_train', 'X_val', 'y_val', 'X_test', 'y_test')
+    
     def __init__(self):
         self.config = Config()
         self.scaler = StandardScaler()
         self.label_encoder = LabelEncoder()
         
-    def load_dataset(self, test_size=0.2, val_size=0.2):
-        """Load dan preprocess dataset koordinat"""
-        print(f"Looking for dataset at: {self.config.COORDINATE_CSV}")
-        print(f"File exists: {os.path.exists(self.config.COORDINATE_CSV)}")
+    def load_arrays(self):
+        """Return (X float32 memmap, y uint8 index kelas, header) dari dataset biner.
+
+        complete_dataset.csv lama dikonversi sekali ke format biner jika
+        file .bin belum ada.
+        """
+        dataset_path = self.config.BINARY_DATASET_PATH
+        print(f"Looking for dataset at: {dataset_path}")
         
-        if not os.path.exists(self.config.COORDINATE_CSV):
-            # Cek apa ada file di direktori
-            processed_dir = self.config.PROCESSED_DIR
-            print(f"Contents of {processed_dir}:")
-            if os.path.exists(processed_dir):
-                for file in os.listdir(processed_dir):
-                    print(f"  - {file}")
-            raise FileNotFoundError(f"Dataset not found: {self.config.COORDINATE_CSV}")
+        if not os.path.exists(dataset_path):
+            if os.path.exists(self.config.COORDINATE_CSV):
+                print(f"Binary dataset missing, converting {self.config.COORDINATE_CSV}")
+                convert_csv(self.config.COORDINATE_CSV, dataset_path)
+            else:
+                # Cek apa ada file di direktori
+                processed_dir = self.config.PROCESSED_DIR
+                print(f"Contents of {processed_dir}:")
+                if os.path.exists(processed_dir):
+                    for file in os.listdir(processed_dir):
+                        print(f"  - {file}")
+                raise FileNotFoundError(f"Dataset not found: {dataset_path}")
         
-        # Load data
-        df = pd.read_csv(self.config.COORDINATE_CSV)
-        print(f"Dataset loaded: {len(df)} samples")
-        print(f"Columns: {df.columns.tolist()}")
-        print(f"First few rows:")
-        print(df.head())
+        X, y, header = load_binary_dataset(dataset_path)
+        print(f"Dataset loaded: {len(X)} samples (sha256 {header['sha256'][:12]})")
+        return X, y, header
+    
+    def split_cache_paths(self, dataset_sha256, test_size, val_size):
+        """Path (npz, scaler) cache split untuk dataset + parameter split ini"""
+        params = f"{dataset_sha256}:{test_size}:{val_size}:{self.config.SPLIT_RANDOM_STATE}"
+        key = f"{dataset_sha256[:12]}_{hashlib.sha256(params.encode()).hexdigest()[:12]}"
+        cache_dir = self.config.SPLIT_CACHE_DIR
+        return os.path.join(cache_dir, f'{key}.npz'), os.path.join(cache_dir, f'{key}_scaler.pkl')
+    
+    def load_split_cache(self, cache_path, scaler_path):
+        if not (os.path.exists(cache_path) and os.path.exists(scaler_path)):
+            return None
+        try:
+            with np.load(cache_path) as cache:
+                splits = tuple(cache[name] for name in self.SPLIT_ARRAYS)
+            self.scaler = joblib.load(scaler_path)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable split cache {cache_path}: {e}")
+            return None
+        return splits
+    
+    def save_split_cache(self, cache_path, scaler_path, arrays):
+        """Tulis cache (atomic) dan hapus cache milik versi dataset lain"""
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        prefix = os.path.basename(cache_path).split('_')[0]
+        for name in os.listdir(cache_dir):
+            if not name.startswith(prefix):
+                os.remove(os.path.join(cache_dir, name))
         
-        # Check for missing values
-        print(f"Missing values: {df.isnull().sum().sum()}")
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        joblib.dump(self.scaler, scaler_path + '.tmp')
+        os.replace(scaler_path + '.tmp', scaler_path)
+        os.replace(tmp_path, cache_path)
+    
+    def load_dataset(self, test_size=0.2, val_size=0.2, use_cache=True):
+        """Load dan preprocess dataset koordinat (split + scaler di-cache per hash dataset)"""
+        X, y_encoded, header = self.load_arrays()
         
-        # Pisahkan features dan labels
-        feature_columns = [col for col in df.columns if col != 'label']
-        X = df[feature_columns].values
-        y = df['label'].values
+        # Label sudah di-encode (index ke class_names di header)
+        self.label_encoder.fit(header['class_names'])
+        class_names = self.label_encoder.classes_
         
-        print(f"Features shape: {X.shape}")
-        print(f"Labels: {np.unique(y)}")
+        cache_path, scaler_path = self.split_cache_paths(header['sha256'], test_size, val_size)
+        if use_cache:
+            splits = self.load_split_cache(cache_path, scaler_path)
+            if splits is not None:
+                print(f"✅ Split + scaler loaded from cache: {cache_path}")
+                return (*splits, class_names)
         
-        # Encode labels
-        y_encoded = self.label_encoder.fit_transform(y)
-        print(f"Encoded labels: {np.unique(y_encoded)}")
-        print(f"Label mapping: {dict(zip(self.label_encoder.classes_, range(len(self.label_encoder.classes_))))}")
+        # Check for missing values
+        print(f"Missing values: {np.isnan(X).sum()}")
+        print(f"Features shape: {X.shape}")
+        print(f"Labels: {class_names}")
+        print(f"Label mapping: {dict(zip(class_names, range(len(class_names))))}")
         
-        # Split data: train -> 60%, val -> 20%, test -> 20%
-        X_temp, X_test, y_temp, y_test = train_test_split(
-            X, y_encoded, test_size=test_size, random_state=42, stratify=y_encoded
+        # Split index: train -> 60%, val -> 20%, test -> 20%
+        indices = np.arange(len(X))
+        temp_idx, test_idx = train_test_split(
+            indices, test_size=test_size, random_state=self.config.SPLIT_RANDOM_STATE, stratify=y_encoded
         )
         
         val_ratio = val_size / (1 - test_size)
-        X_train, X_val, y_train, y_val = train_test_split(
-            X_temp, y_temp, test_size=val_ratio, random_state=42, stratify=y_temp
+        train_idx, val_idx = train_test_split(
+            temp_idx, test_size=val_ratio, random_state=self.config.SPLIT_RANDOM_STATE,
+            stratify=y_encoded[temp_idx]
         )
         
         # Normalize features
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_val_scaled = self.scaler.transform(X_val)
-        X_test_scaled = self.scaler.transform(X_test)
+        self.scaler = StandardScaler()
+        X_train_scaled = self.scaler.fit_transform(X[train_idx])
+        X_val_scaled = self.scaler.transform(X[val_idx])
+        X_test_scaled = self.scaler.transform(X[test_idx])
+        splits = (X_train_scaled, y_encoded[train_idx], X_val_scaled, y_encoded[val_idx],
+                  X_test_scaled, y_encoded[test_idx])
         
         print(f"Training set: {X_train_scaled.shape}")
         print(f"Validation set: {X_val_scaled.shape}")
         print(f"Test set: {X_test_scaled.shape}")
         
-        return (X_train_scaled, y_train, X_val_scaled, y_val, 
-                X_test_scaled, y_test, self.label_encoder.classes_)
+        if use_cache:
+            arrays = dict(zip(self.SPLIT_ARRAYS, splits))
+            arrays.update(train_idx=train_idx, val_idx=val_idx, test_idx=test_idx)
+            self.save_split_cache(cache_path, scaler_path, arrays)
+        
+        return (*splits, class_names)
     
     def preprocess_single_sample(self, landmarks):
         """Preprocess single sample untuk prediction"""
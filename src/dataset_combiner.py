@@ -0,0 +1,145 @@
+import json
+import os
+import time
+import numpy as np
+from src.config import Config
+from src.binary_dataset import file_hash, load_binary_dataset, read_header, write_binary_dataset
+
+class DatasetCombiner:
+    """Gabungkan {letter}_coordinates.csv ke dataset biner secara incremental.
+
+    Manifest mencatat size, mtime dan SHA-256 setiap file sumber beserta
+    range barisnya di dataset gabungan. Saat combine ulang, file yang
+    size/mtime-nya sama tidak dibaca sama sekali; file yang berubah
+    di-hash, dan hanya yang isinya benar-benar berbeda yang di-parse ulang.
+    Baris file lain diambil langsung dari dataset lama (memmap).
+
+    extra_dirs (mis. IMAGE_COORD_DIR) ikut digabung secara eksplisit; key
+    manifest-nya '{nama folder}/{huruf}', sedangkan raw_dir tetap '{huruf}'.
+    """
+
+    def __init__(self, raw_dir=None, dataset_path=None, manifest_path=None, extra_dirs=()):
+        self.config = Config()
+        self.raw_dir = raw_dir or self.config.RAW_COORD_DIR
+        self.extra_dirs = list(extra_dirs)
+        self.dataset_path = dataset_path or self.config.BINARY_DATASET_PATH
+        self.manifest_path = manifest_path or self.config.COMBINE_MANIFEST_PATH
+
+    def find_sources(self):
+        """Return list (key, path) file CSV per huruf yang ada: raw_dir A-Z, lalu extra_dirs"""
+        sources = []
+        for directory in [self.raw_dir] + self.extra_dirs:
+            prefix = '' if directory == self.raw_dir else os.path.basename(os.path.normpath(directory)) + '/'
+            for letter in self.config.LETTERS:
+                path = os.path.join(directory, f'{letter}_coordinates.csv')
+                if os.path.exists(path):
+                    sources.append((prefix + letter, path))
+        return sources
+
+    def load_manifest(self):
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        return {'dataset_sha256': None, 'files': {}}
+
+    def save_manifest(self, manifest):
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _dataset_matches(self, manifest):
+        """Manifest hanya dipakai jika dataset biner yang dideskripsikannya masih ada"""
+        if not manifest['files'] or not os.path.exists(self.dataset_path):
+            return False
+        try:
+            return read_header(self.dataset_path)['sha256'] == manifest['dataset_sha256']
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def _scan(self, sources, previous):
+        """Bandingkan sumber dengan manifest; return (entries, changed keys)"""
+        entries = {}
+        changed = []
+        for key, path in sources:
+            stat = os.stat(path)
+            old = previous.get(key)
+            if old and old['size'] == stat.st_size and old['mtime'] == stat.st_mtime_ns:
+                entries[key] = old
+                continue
+            digest = file_hash(path)
+            entries[key] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha256': digest}
+            if old and old['sha256'] == digest:
+                # Hanya di-touch: isi sama, baris lama tetap dipakai
+                entries[key].update(start=old['start'], count=old['count'])
+            else:
+                changed.append(key)
+        return entries, changed
+
+    def _read_csv(self, path):
+        import pandas as pd
+
+        df = pd.read_csv(path)
+        feature_columns = [col for col in df.columns if col != 'label']
+        return df[feature_columns].values.astype(np.float32), df['label'].astype(str).values
+
+    def combine(self, force=False):
+        """Update dataset biner; return dict statistik (samples, changed, class_counts, ...)"""
+        start = time.perf_counter()
+        manifest = self.load_manifest()
+        previous = manifest['files'] if not force and self._dataset_matches(manifest) else {}
+
+        sources = self.find_sources()
+        entries, changed = self._scan(sources, previous)
+        removed = sorted(set(previous) - set(entries))
+        stats = {'sources': len(sources), 'changed': changed, 'removed': removed}
+
+        if previous and not changed and not removed:
+            if entries != previous:
+                manifest['files'] = entries
+                self.save_manifest(manifest)
+            header = read_header(self.dataset_path)
+            _, labels, _ = load_binary_dataset(self.dataset_path)
+            stats.update(samples=header['num_samples'], updated=False,
+                         class_counts=dict(zip(header['class_names'],
+                                               np.bincount(labels, minlength=len(header['class_names'])).tolist())),
+                         seconds=time.perf_counter() - start)
+            return stats
+
+        if not sources:
+            stats.update(samples=0, updated=False, class_counts={}, seconds=time.perf_counter() - start)
+            return stats
+
+        old_features = old_labels = old_names = None
+        if previous:
+            old_features, old_labels, old_header = load_binary_dataset(self.dataset_path)
+            old_names = np.array(old_header['class_names'])
+
+        feature_parts = []
+        name_parts = []
+        offset = 0
+        for key, path in sources:
+            entry = entries[key]
+            if key in changed:
+                features, names = self._read_csv(path)
+            else:
+                rows = slice(entry['start'], entry['start'] + entry['count'])
+                features, names = old_features[rows], old_names[old_labels[rows]]
+            entry['start'], entry['count'] = offset, len(features)
+            offset += len(features)
+            feature_parts.append(features)
+            name_parts.append(names)
+
+        features = np.concatenate(feature_parts)
+        class_names, labels = np.unique(np.concatenate(name_parts), return_inverse=True)
+        # Lepas memmap lama sebelum file-nya diganti
+        del feature_parts, old_features, old_labels
+
+        header = write_binary_dataset(features, labels, class_names, self.dataset_path)
+        self.save_manifest({'dataset_sha256': header['sha256'], 'files': entries})
+
+        stats.update(samples=header['num_samples'], updated=True,
+                     class_counts=dict(zip(header['class_names'],
+                                           np.bincount(labels, minlength=len(class_names)).tolist())),
+                     seconds=time.perf_counter() - start)
+        return stats
@@ -0,0 +1,69 @@
+import cv2
+import numpy as np
+
+class FrameBuffers:
+    """Buffer frame yang dialokasikan sekali per resolusi dan dipakai ulang setiap frame.
+
+    Semua operasi OpenCV menulis ke buffer lewat dst= (atau cap.read(image)).
+    Jika OpenCV tetap mengembalikan array baru (shape/dtype tidak cocok),
+    itu dihitung sebagai alokasi sehingga alokasi per frame bisa diukur.
+    """
+
+    def __init__(self):
+        self.capture = None  # BGR dari kamera
+        self.display = None  # BGR flipped untuk display (QImage dibuat di atas buffer ini)
+        self.rgb_buffers = {}  # shape -> buffer RGB untuk MediaPipe (full frame / crop ROI)
+        self.allocations = 0
+        self.frames = 0
+
+    def _allocate(self, shape):
+        self.allocations += 1
+        return np.empty(shape, dtype=np.uint8)
+
+    def _track(self, result, buffer):
+        if result is not buffer:
+            self.allocations += 1
+        return result
+
+    def read(self, cap):
+        """cap.read ke buffer capture; return (ret, frame)"""
+        self.frames += 1
+        ret, frame = cap.read(self.capture)
+        if ret and frame is not self.capture:
+            # Frame pertama / resolusi berubah: buffer baru dari OpenCV
+            self.allocations += 1
+            self.capture = frame
+        return ret, frame
+
+    def count_owned_frame(self):
+        """Frame yang sengaja dialokasikan baru (mis. packet mode pipelined yang pindah thread)"""
+        self.frames += 1
+        self.allocations += 1
+
+    def flip(self, frame, inplace=True):
+        """Flip horizontal (mirror) in place, atau ke buffer display"""
+        if inplace:
+            return self._track(cv2.flip(frame, 1, dst=frame), frame)
+        if self.display is None or self.display.shape != frame.shape:
+            self.display = self._allocate(frame.shape)
+        return self._track(cv2.flip(frame, 1, dst=self.display), self.display)
+
+    def to_rgb(self, image):
+        """BGR -> RGB ke buffer per shape (crop ROI dengan ukuran sama memakai buffer yang sama)"""
+        buffer = self.rgb_buffers.get(image.shape)
+        if buffer is None:
+            if len(self.rgb_buffers) >= 16:
+                self.rgb_buffers.clear()
+            buffer = self.rgb_buffers[image.shape] = self._allocate(image.shape)
+        return self._track(cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=buffer), buffer)
+
+    @property
+    def allocations_per_frame(self):
+        return self.allocations / self.frames if self.frames else 0.0
+
+    def stats_text(self):
+        return f"Alloc/frame: {self.allocations_per_frame:.2f}"
+
+    def summary(self):
+        return (f"Frame buffers: {self.allocations} allocations over {self.frames} frames "
+                f"({self.allocations_per_frame:.3f} per frame)")
@@ -0,0 +1,143 @@
+import numpy as np
+from src.config import Config
+
+class LandmarkKalmanFilter:
+    """Kalman filter constant-velocity per koordinat, vectorized atas semua 63 koordinat.
+
+    State per koordinat = (posisi, kecepatan); setiap koordinat independen,
+    jadi kovarian 2x2 disimpan sebagai tiga array (P00, P01, P11).
+    """
+
+    def __init__(self, process_noise=None, measurement_noise=None):
+        config = Config()
+        self.q = config.KALMAN_PROCESS_NOISE if process_noise is None else process_noise
+        self.r = config.KALMAN_MEASUREMENT_NOISE if measurement_noise is None else measurement_noise
+        self.reset()
+
+    def reset(self):
+        self.shape = None
+        self.position = None
+        self.velocity = None
+
+    @property
+    def initialized(self):
+        return self.position is not None
+
+    def initialize(self, measurement):
+        measurement = np.asarray(measurement, dtype=np.float64)
+        self.shape = measurement.shape
+        self.position = measurement.ravel().copy()
+        self.velocity = np.zeros_like(self.position)
+        self.p00 = np.full_like(self.position, self.r)
+        self.p01 = np.zeros_like(self.position)
+        self.p11 = np.ones_like(self.position)
+
+    def predict(self, dt):
+        """Propagasi state sejauh dt detik; return posisi prediksi (shape measurement)"""
+        self.position += self.velocity * dt
+        self.p00 += dt * (2 * self.p01 + dt * self.p11) + self.q * dt ** 4 / 4
+        self.p01 += dt * self.p11 + self.q * dt ** 3 / 2
+        self.p11 += self.q * dt ** 2
+        return self.position.reshape(self.shape)
+
+    def update(self, measurement):
+        """Koreksi state dengan landmark hasil deteksi"""
+        residual = np.asarray(measurement, dtype=np.float64).ravel() - self.position
+        s = self.p00 + self.r
+        k0 = self.p00 / s
+        k1 = self.p01 / s
+        self.position += k0 * residual
+        self.velocity += k1 * residual
+        self.p11 -= k1 * self.p01
+        self.p01 *= 1 - k0
+        self.p00 *= 1 - k0
+
+class FrameSkipScheduler:
+    """Jalankan hands.process setiap N frame; frame di antaranya memakai prediksi Kalman.
+
+    N adaptif: naik (sampai SKIP_MAX_INTERVAL) selama error prediksi saat
+    deteksi asli datang di bawah SKIP_ERROR_LOW, kembali ke 1 jika di atas
+    SKIP_ERROR_HIGH atau tangan hilang.
+    """
+
+    def __init__(self, max_interval=None, enabled=None):
+        config = Config()
+        self.max_interval = max_interval or config.SKIP_MAX_INTERVAL
+        self.error_low = config.SKIP_ERROR_LOW
+        self.error_high = config.SKIP_ERROR_HIGH
+        self.enabled = config.SKIP_SCHEDULER_ENABLED if enabled is None else enabled
+        self.filter = LandmarkKalmanFilter()
+
+        self.interval = 1
+        self.frames_since_detection = 0
+        self.last_time = None
+
+        # Statistik
+        self.detected_frames = 0
+        self.predicted_frames = 0
+        self.errors = []
+
+    def should_detect(self):
+        if not self.enabled or not self.filter.initialized:
+            return True
+        return self.frames_since_detection + 1 >= self.interval
+
+    def predict(self, timestamp):
+        """Landmark prediksi (n_hands, 63) untuk frame tanpa hands.process"""
+        predicted = self.filter.predict(timestamp - self.last_time)
+        self.last_time = timestamp
+        self.frames_since_detection += 1
+        self.predicted_frames += 1
+        return predicted.astype(np.float32)
+
+    def detected(self, landmarks, timestamp):
+        """Dipanggil setelah hands.process; bandingkan dengan prediksi lalu koreksi filter"""
+        self.detected_frames += 1
+        if not self.enabled:
+            return
+        if len(landmarks) == 0:
+            self.filter.reset()
+            self.interval = 1
+            return
+
+        if self.filter.initialized and self.filter.shape == landmarks.shape:
+            predicted = self.filter.predict(timestamp - self.last_time)
+            displacement = (predicted - landmarks).reshape(len(landmarks), -1, 3)
+            error = float(np.sqrt((displacement ** 2).sum(axis=2)).mean())
+            self.errors.append(error)
+            if len(self.errors) > 1000:
+                self.errors.pop(0)
+
+            if error > self.error_high:
+                self.interval = 1
+            elif error < self.error_low:
+                self.interval = min(self.interval + 1, self.max_interval)
+            self.filter.update(landmarks)
+        else:
+            self.filter.initialize(landmarks)
+            self.interval = 1
+
+        self.last_time = timestamp
+        self.frames_since_detection = 0
+
+    @property
+    def skip_rate(self):
+        total = self.detected_frames + self.predicted_frames
+        return self.predicted_frames / total if total else 0.0
+
+    @property
+    def mean_error(self):
+        return float(np.mean(self.errors)) if self.errors else 0.0
+
+    def stats_text(self):
+        if not self.enabled:
+            return "Frame skip: off"
+        return f"N={self.interval} | skip {self.skip_rate*100:.0f}% | err {self.mean_error:.4f}"
+
+    def summary(self):
+        if not self.enabled:
+            return "Frame skip scheduler: off"
+        total = self.detected_frames + self.predicted_frames
+        return (f"Frame skip: {self.predicted_frames}/{total} frames predicted "
+                f"({self.skip_rate*100:.1f}%), mean Kalman error at detection "
+                f"{self.mean_error:.4f} (normalized units)")
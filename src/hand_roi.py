@@ -0,0 +1,118 @@
+import numpy as np
+from src.config import Config
+
+class HandROI:
+    """Crop frame di sekitar tangan frame sebelumnya sebelum hands.process.
+
+    ROI = bounding box landmark frame sebelumnya + padding, ukuran dibulatkan
+    ke kelipatan ROI_SIZE_STEP agar ukuran input MediaPipe stabil. Landmark
+    hasil crop di-remap ke koordinat ternormalisasi full frame sehingga
+    classifier dan scaler.pkl melihat sistem koordinat yang sama. Tanpa
+    tangan, ROI dilepas dan frame berikutnya diproses full frame.
+    """
+
+    def __init__(self, padding=None, min_size=None, enabled=None):
+        config = Config()
+        self.padding = config.ROI_PADDING if padding is None else padding
+        self.min_size = min_size or config.ROI_MIN_SIZE
+        self.size_step = config.ROI_SIZE_STEP
+        self.max_area_ratio = config.ROI_MAX_AREA_RATIO
+        self.enabled = config.ROI_ENABLED if enabled is None else enabled
+        self.roi = None  # (x0, y0, x1, y1) pixel
+
+        # Statistik: pixel dan waktu hands.process untuk full frame vs ROI
+        self.full_frames = 0
+        self.full_time = 0.0
+        self.roi_frames = 0
+        self.roi_time = 0.0
+        self.frames = 0
+        self.pixels = 0
+        self.frame_pixels = 0
+
+    def reset(self):
+        self.roi = None
+
+    def crop(self, frame):
+        """Return (image untuk MediaPipe, roi); roi None berarti full frame"""
+        self.frames += 1
+        self.frame_pixels += frame.shape[0] * frame.shape[1]
+        if not self.enabled or self.roi is None:
+            return frame, None
+        x0, y0, x1, y1 = self.roi
+        return frame[y0:y1, x0:x1], self.roi
+
+    def remap(self, landmarks, roi, frame_shape):
+        """Koordinat ternormalisasi crop -> full frame (in place, batch (n, 63))"""
+        if roi is None or len(landmarks) == 0:
+            return landmarks
+        h, w = frame_shape[:2]
+        x0, y0, x1, y1 = roi
+        points = landmarks.reshape(len(landmarks), -1, 3)
+        points[:, :, 0] *= (x1 - x0) / w
+        points[:, :, 0] += x0 / w
+        points[:, :, 1] *= (y1 - y0) / h
+        points[:, :, 1] += y0 / h
+        # z MediaPipe berskala seperti x (lebar image)
+        points[:, :, 2] *= (x1 - x0) / w
+        return landmarks
+
+    def update(self, landmarks, frame_shape):
+        """Hitung ROI frame berikutnya dari landmark full frame (n, 63)"""
+        if not self.enabled or len(landmarks) == 0:
+            self.roi = None
+            return
+
+        h, w = frame_shape[:2]
+        points = landmarks.reshape(len(landmarks), -1, 3)
+        xs = points[:, :, 0] * w
+        ys = points[:, :, 1] * h
+        x_min, x_max = float(xs.min()), float(xs.max())
+        y_min, y_max = float(ys.min()), float(ys.max())
+
+        size = max(x_max - x_min, y_max - y_min) * (1 + 2 * self.padding)
+        size = max(self.min_size, int(np.ceil(size / self.size_step)) * self.size_step)
+        cx, cy = (x_min + x_max) / 2, (y_min + y_max) / 2
+
+        x0, x1 = int(max(0, cx - size / 2)), int(min(w, cx + size / 2))
+        y0, y1 = int(max(0, cy - size / 2)), int(min(h, cy + size / 2))
+        if x1 <= x0 or y1 <= y0 or (x1 - x0) * (y1 - y0) > self.max_area_ratio * w * h:
+            self.roi = None  # Crop hampir full frame: tidak ada penghematan
+        else:
+            self.roi = (x0, y0, x1, y1)
+
+    def record(self, image_shape, roi, elapsed):
+        """Catat pixel yang diproses dan waktu hands.process satu panggilan"""
+        self.pixels += image_shape[0] * image_shape[1]
+        if roi is None:
+            self.full_frames += 1
+            self.full_time += elapsed
+        else:
+            self.roi_frames += 1
+            self.roi_time += elapsed
+
+    @property
+    def pixels_per_frame(self):
+        """Termasuk panggilan ulang full frame saat ROI kehilangan tangan"""
+        return self.pixels / self.frames if self.frames else 0.0
+
+    @property
+    def latency_saved_ms(self):
+        """Selisih rata-rata waktu full frame vs ROI per panggilan ROI"""
+        if not self.full_frames or not self.roi_frames:
+            return 0.0
+        return (self.full_time / self.full_frames - self.roi_time / self.roi_frames) * 1000
+
+    def stats_text(self):
+        if not self.enabled:
+            return "ROI: off"
+        return f"ROI: {self.pixels_per_frame/1000:.0f}k px | saved {self.latency_saved_ms:.1f} ms"
+
+    def summary(self):
+        calls = self.full_frames + self.roi_frames
+        ratio = self.pixels / self.frame_pixels if self.frame_pixels else 0.0
+        full_ms = self.full_time / self.full_frames * 1000 if self.full_frames else 0.0
+        roi_ms = self.roi_time / self.roi_frames * 1000 if self.roi_frames else 0.0
+        return (f"MediaPipe pixels/frame: {self.pixels_per_frame:.0f} ({ratio*100:.1f}% of full frame), "
+                f"ROI calls {self.roi_frames}/{calls} | "
+                f"full {full_ms:.2f} ms vs ROI {roi_ms:.2f} ms "
+                f"(saved {self.latency_saved_ms:.2f} ms per ROI call)")
@@ -0,0 +1,83 @@
+import cv2
+import numpy as np
+
+class OverlayLayer:
+    """Patch BGRA pada posisi (x, y) frame; blend ke frame dengan satu operasi vectorized"""
+
+    def __init__(self, bgra, x, y):
+        alpha = bgra[:, :, 3:4].astype(np.float32) / 255.0
+        self.x = x
+        self.y = y
+        # Premultiplied: frame * (1 - alpha) + color * alpha
+        self.color = bgra[:, :, :3].astype(np.float32) * alpha
+        self.inverse_alpha = 1.0 - alpha
+
+    @classmethod
+    def from_canvas(cls, canvas):
+        """Layer dari canvas BGRA seukuran frame, dipotong ke bounding box pixel yang terlihat"""
+        ys, xs = np.nonzero(canvas[:, :, 3])
+        if len(ys) == 0:
+            return None
+        y0, y1, x0, x1 = ys.min(), ys.max() + 1, xs.min(), xs.max() + 1
+        return cls(canvas[y0:y1, x0:x1], int(x0), int(y0))
+
+    def blend(self, frame):
+        h, w = self.color.shape[:2]
+        x0, y0 = max(self.x, 0), max(self.y, 0)
+        x1, y1 = min(self.x + w, frame.shape[1]), min(self.y + h, frame.shape[0])
+        if x1 <= x0 or y1 <= y0:
+            return
+        sx, sy = x0 - self.x, y0 - self.y
+        region = frame[y0:y1, x0:x1]
+        blended = (region * self.inverse_alpha[sy:sy + y1 - y0, sx:sx + x1 - x0]
+                   + self.color[sy:sy + y1 - y0, sx:sx + x1 - x0])
+        np.copyto(region, blended, casting='unsafe')
+
+def render_text(text, font_scale, color, thickness, font=cv2.FONT_HERSHEY_SIMPLEX):
+    """Render teks ke patch BGRA; return (patch, offset origin baseline di dalam patch)"""
+    (w, h), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+    pad = thickness
+    canvas = np.zeros((h + baseline + 2 * pad, w + 2 * pad, 4), dtype=np.uint8)
+    origin = (pad, h + pad)
+    cv2.putText(canvas, text, origin, font, font_scale, (*color, 255), thickness)
+    return canvas, origin
+
+class HudCompositor:
+    """HUD = layer statis (di-render sekali per resolusi) + field teks dinamis.
+
+    render_static(canvas) menggambar bagian statis ke canvas BGRA seukuran
+    frame (warna (b, g, r, 255)). Field dinamis di-render ulang hanya jika
+    teks/warna berubah; frame berikutnya cukup blend patch yang sudah ada.
+    """
+
+    def __init__(self, render_static):
+        self.render_static = render_static
+        self.static_layers = {}  # (h, w) -> OverlayLayer
+        self.fields = {}  # nama field -> (key, OverlayLayer)
+        self.field_renders = 0
+        self.field_draws = 0
+
+    def draw_static(self, frame):
+        shape = frame.shape[:2]
+        if shape not in self.static_layers:
+            canvas = np.zeros((*shape, 4), dtype=np.uint8)
+            self.render_static(canvas)
+            self.static_layers[shape] = OverlayLayer.from_canvas(canvas)
+        layer = self.static_layers[shape]
+        if layer is not None:
+            layer.blend(frame)
+
+    def draw_text(self, frame, name, text, origin, font_scale, color, thickness=1):
+        key = (text, origin, font_scale, color, thickness)
+        cached = self.fields.get(name)
+        if cached is None or cached[0] != key:
+            patch, (ox, oy) = render_text(text, font_scale, color, thickness)
+            cached = self.fields[name] = (key, OverlayLayer(patch, origin[0] - ox, origin[1] - oy))
+            self.field_renders += 1
+        self.field_draws += 1
+        cached[1].blend(frame)
+
+    @property
+    def render_ratio(self):
+        """Fraksi draw field dinamis yang perlu render ulang"""
+        return self.field_renders / self.field_draws if self.field_draws else 0.0
@@ -0,0 +1,128 @@
+import csv
+import json
+import multiprocessing
+import os
+import time
+from src.config import Config
+from src.sample_writer import landmark_columns
+
+_extractor = None
+
+def _init_worker():
+    """Satu CoordinateExtractor (static_image_mode=True) per worker process"""
+    global _extractor
+    from src.coordinate_extractor import CoordinateExtractor
+    _extractor = CoordinateExtractor(static_image_mode=True)
+
+def _process_image(task):
+    image_path, label = task
+    landmarks, status = _extractor.extract_image_file(image_path)
+    return label, landmarks, status
+
+class ImageDatasetBuilder:
+    """Ekstraksi landmark dari folder gambar berlabel (mis. Kaggle ASL Alphabet).
+
+    Struktur: image_dir/A/*.jpg, image_dir/B/*.jpg, ... Folder yang bukan
+    huruf A-Z (mis. 'del', 'nothing', 'space') dilewati. Worker hanya
+    menerima path dan men-decode gambar sendiri, hasil ditulis langsung ke
+    CSV saat tiba, sehingga memori tidak tumbuh dengan ukuran dataset.
+    Output default ke IMAGE_COORD_DIR, bukan RAW_COORD_DIR, agar tidak
+    bercampur dengan koleksi webcam; gabungkan lewat DatasetCombiner(extra_dirs=...).
+    """
+
+    def __init__(self, image_dir, output_dir=None, workers=None):
+        self.config = Config()
+        self.image_dir = image_dir
+        self.output_dir = output_dir or self.config.IMAGE_COORD_DIR
+        self.workers = workers or os.cpu_count() or 1
+
+    def find_images(self, max_per_class=None):
+        """Return list (path, label) terurut"""
+        images = []
+        for class_name in sorted(os.listdir(self.image_dir)):
+            class_dir = os.path.join(self.image_dir, class_name)
+            if not os.path.isdir(class_dir):
+                continue
+            label = class_name.upper()
+            if label not in self.config.LETTERS:
+                print(f"⚠️ Skipping folder {class_name}: not a letter A-Z")
+                continue
+            names = sorted(name for name in os.listdir(class_dir)
+                           if os.path.splitext(name)[1].lower() in self.config.IMAGE_EXTENSIONS)
+            images.extend((os.path.join(class_dir, name), label) for name in names[:max_per_class])
+        return images
+
+    def run(self, max_per_class=None, chunksize=16):
+        images = self.find_images(max_per_class)
+        if not images:
+            print(f"❌ No images found in {self.image_dir}")
+            return None
+        print(f"Images: {len(images)} in {len(set(label for _, label in images))} classes, "
+              f"{self.workers} workers")
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        stats = {}
+        files = {}
+        writers = {}
+        start = time.perf_counter()
+
+        context = multiprocessing.get_context('spawn')
+        try:
+            with context.Pool(processes=self.workers, initializer=_init_worker) as pool:
+                for done, (label, landmarks, status) in enumerate(
+                        pool.imap_unordered(_process_image, images, chunksize=chunksize), 1):
+                    class_stats = stats.setdefault(label, {'images': 0, 'ok': 0, 'no_hand': 0, 'decode_error': 0})
+                    class_stats['images'] += 1
+                    class_stats[status] += 1
+
+                    if landmarks is not None:
+                        if label not in writers:
+                            path = os.path.join(self.output_dir, f'{label}_coordinates.csv')
+                            write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+                            files[label] = open(path, 'a', newline='')
+                            writers[label] = csv.writer(files[label])
+                            if write_header:
+                                writers[label].writerow(landmark_columns())
+                        writers[label].writerow(landmarks + [label])
+
+                    if done % 1000 == 0:
+                        elapsed = time.perf_counter() - start
+                        print(f"  {done}/{len(images)} images ({done / elapsed:.1f} images/s)")
+        finally:
+            for f in files.values():
+                f.close()
+
+        elapsed = time.perf_counter() - start
+        return self.report(stats, elapsed)
+
+    def report(self, stats, elapsed):
+        total = sum(s['images'] for s in stats.values())
+        written = sum(s['ok'] for s in stats.values())
+
+        print("\n=== IMAGE INGESTION REPORT ===")
+        print(f"{'Class':<6} {'Images':>7} {'Rows':>7} {'No hand':>8} {'Decode':>7} {'Fail %':>7}")
+        for label in sorted(stats):
+            s = stats[label]
+            s['failure_rate'] = (s['no_hand'] + s['decode_error']) / s['images'] if s['images'] else 0.0
+            print(f"{label:<6} {s['images']:>7} {s['ok']:>7} {s['no_hand']:>8} "
+                  f"{s['decode_error']:>7} {s['failure_rate']*100:>6.1f}%")
+
+        throughput = total / elapsed if elapsed > 0 else 0.0
+        print(f"\nTotal: {total} images, {written} rows written to {self.output_dir}")
+        print(f"Throughput: {throughput:.1f} images/s ({elapsed:.1f}s, {self.workers} workers)")
+
+        report = {
+            'image_dir': self.image_dir,
+            'workers': self.workers,
+            'images': total,
+            'rows_written': written,
+            'seconds': elapsed,
+            'images_per_second': throughput,
+            'per_class': stats,
+        }
+        os.makedirs(self.config.RESULTS_DIR, exist_ok=True)
+        report_path = os.path.join(self.config.RESULTS_DIR, 'image_dataset_report.json')
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Report saved: {report_path}")
+        return report
@@ -0,0 +1,211 @@
+import json
+import os
+import numpy as np
+from src.config import Config
+
+class BasePredictor:
+    """Interface predictor: predict(x) -> probabilitas (n_samples, n_classes)"""
+    name = None
+
+    def __init__(self, model_path):
+        self.config = Config()
+        self.model_path = model_path
+        # Model fused menerima landmark mentah, scaler.pkl tidak dipakai lagi
+        self.includes_scaler = is_fused_model(model_path)
+
+    def predict(self, x):
+        raise NotImplementedError
+
+    def __call__(self, x):
+        return self.predict(x)
+
+    @staticmethod
+    def _as_batch(x):
+        x = np.asarray(x, dtype=np.float32)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        return x
+
+class KerasPredictor(BasePredictor):
+    """Backend tf.keras (.h5 / SavedModel)"""
+    name = 'keras'
+
+    def __init__(self, model_path):
+        super().__init__(model_path)
+        import tensorflow as tf
+        self.model = tf.keras.models.load_model(model_path)
+
+    def predict(self, x):
+        # Memanggil model langsung menghindari overhead Model.predict untuk batch kecil
+        return self.model(self._as_batch(x), training=False).numpy()
+
+class TFLitePredictor(BasePredictor):
+    """Backend TFLite dengan input tensor yang dialokasikan sekali.
+
+    Mendukung model full-integer (int8): input di-quantize dan output
+    di-dequantize memakai parameter quantization dari interpreter.
+    """
+    name = 'tflite'
+
+    def __init__(self, model_path):
+        super().__init__(model_path)
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+
+        self.interpreter = Interpreter(model_path=model_path)
+        self.interpreter.allocate_tensors()
+        input_details = self.interpreter.get_input_details()[0]
+        output_details = self.interpreter.get_output_details()[0]
+        self.input_index = input_details['index']
+        self.output_index = output_details['index']
+        self.input_dtype = input_details['dtype']
+        self.input_scale, self.input_zero_point = input_details['quantization']
+        self.output_scale, self.output_zero_point = output_details['quantization']
+        self._allocate(1)
+
+    def _allocate(self, batch_size):
+        """(Re)alokasi tensor interpreter dan buffer input untuk batch_size"""
+        input_details = self.interpreter.get_input_details()[0]
+        if input_details['shape'][0] != batch_size:
+            self.interpreter.resize_tensor_input(
+                self.input_index, [batch_size, self.config.NUM_FEATURES])
+            self.interpreter.allocate_tensors()
+        self.batch_size = batch_size
+        self.input_buffer = np.zeros(
+            (batch_size, self.config.NUM_FEATURES), dtype=input_details['dtype'])
+
+    def predict(self, x):
+        x = self._as_batch(x)
+        if x.shape[0] != self.batch_size:
+            self._allocate(x.shape[0])
+
+        if self.input_scale:
+            # Quantize: q = round(x / scale + zero_point), clip ke range dtype
+            info = np.iinfo(self.input_dtype)
+            x = np.clip(np.round(x / self.input_scale + self.input_zero_point),
+                        info.min, info.max)
+        self.input_buffer[...] = x
+        self.interpreter.set_tensor(self.input_index, self.input_buffer)
+        self.interpreter.invoke()
+
+        output = self.interpreter.get_tensor(self.output_index)
+        if self.output_scale:
+            return (output.astype(np.float32) - self.output_zero_point) * self.output_scale
+        return output.copy()
+
+class NumpyPredictor(BasePredictor):
+    """Backend NumPy murni (lihat src/numpy_inference.py)"""
+    name = 'numpy'
+
+    def __init__(self, model_path):
+        super().__init__(model_path)
+        from src.numpy_inference import NumpyCoordinateModel
+        self.model = NumpyCoordinateModel(model_path)
+
+    def predict(self, x):
+        return self.model.predict(x)
+
+class RemotePredictor(BasePredictor):
+    """Client ke inference server lokal (src/inference_server.py).
+
+    model_path berisi alamat server ('host:port' atau 'unix:/path').
+    Scaling dilakukan di server, jadi landmark dikirim mentah.
+    """
+    name = 'remote'
+
+    def __init__(self, model_path):
+        super().__init__(model_path)
+        from src.inference_server import InferenceClient
+        self.client = InferenceClient(model_path)
+        self.includes_scaler = True
+
+    def predict(self, x):
+        return self.client.predict(self._as_batch(x))
+
+PREDICTORS = {
+    KerasPredictor.name: KerasPredictor,
+    TFLitePredictor.name: TFLitePredictor,
+    NumpyPredictor.name: NumpyPredictor,
+    RemotePredictor.name: RemotePredictor,
+}
+
+def register_predictor(predictor_class):
+    """Daftarkan backend baru (subclass BasePredictor dengan atribut name)"""
+    PREDICTORS[predictor_class.name] = predictor_class
+    return predictor_class
+
+def model_metadata_path(model_path):
+    """coordinate_model_fused.h5 -> coordinate_model_fused.h5.json (sidecar metadata model)"""
+    return model_path + '.json'
+
+def save_model_metadata(model_path, **metadata):
+    with open(model_metadata_path(model_path), 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+def load_model_metadata(model_path):
+    """Return dict metadata sidecar, atau None jika tidak ada"""
+    path = model_metadata_path(model_path)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def is_fused_model(model_path):
+    """True jika model sudah berisi StandardScaler (sidecar dari export_fused_model)"""
+    metadata = load_model_metadata(model_path)
+    if metadata is not None:
+        return bool(metadata.get('includes_scaler', False))
+    if os.path.splitext(os.path.basename(model_path))[0].endswith('_fused'):
+        # Model fused lama tanpa sidecar
+        print(f"⚠️ {model_path} has no {os.path.basename(model_metadata_path(model_path))}, "
+              "assuming it includes the scaler from its '_fused' name. "
+              "Re-run 'python optimize_model.py' to write the metadata.")
+        return True
+    return False
+
+def default_model_path(backend, prefer_fused=True):
+    """Cari file model default untuk backend tertentu"""
+    config = Config()
+
+    if backend == 'remote':
+        return config.INFERENCE_SERVER_ADDRESS
+
+    if backend == 'tflite':
+        fused_path = config.FUSED_TFLITE_MODEL_PATH
+        candidates = [config.TFLITE_MODEL_PATH]
+    else:
+        fused_path = config.FUSED_MODEL_PATH
+        candidates = [
+            config.MODEL_PATH,
+            os.path.join(config.MODELS_DIR, 'coordinate_model_final.h5'),
+            os.path.join(config.MODELS_DIR, 'best_model.h5'),
+        ]
+
+    # Pakai model fused hanya jika tidak lebih lama dari model hasil training
+    if prefer_fused and os.path.exists(fused_path):
+        if not os.path.exists(config.MODEL_PATH) or \
+                os.path.getmtime(fused_path) >= os.path.getmtime(config.MODEL_PATH):
+            return fused_path
+        print(f"⚠️ Fused model is older than {config.MODEL_PATH}, ignoring it. "
+              "Re-run 'python optimize_model.py' to refresh it.")
+
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+
+    raise FileNotFoundError(f"No model found for backend '{backend}': {candidates}")
+
+def create_predictor(backend=None, model_path=None):
+    """Buat predictor sesuai backend (default: Config.INFERENCE_BACKEND)"""
+    backend = backend or Config().INFERENCE_BACKEND
+
+    if backend not in PREDICTORS:
+        raise ValueError(f"Unknown inference backend '{backend}'. Available: {sorted(PREDICTORS)}")
+
+    if model_path is None:
+        model_path = default_model_path(backend)
+
+    return PREDICTORS[backend](model_path)
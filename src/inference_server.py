@@ -0,0 +1,259 @@
+import argparse
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+import numpy as np
+from src.config import Config
+
+# Protokol: header (n_rows, n_cols) uint32 big-endian + n_rows * n_cols float32
+HEADER = struct.Struct('!II')
+
+def parse_address(address):
+    """'unix:/path/to.sock' -> (AF_UNIX, path), 'host:port' -> (AF_INET, (host, port))"""
+    if address.startswith('unix:'):
+        return socket.AF_UNIX, address[len('unix:'):]
+    host, port = address.rsplit(':', 1)
+    return socket.AF_INET, (host, int(port))
+
+def recv_exact(sock, num_bytes):
+    """Baca tepat num_bytes dari socket"""
+    buffer = bytearray(num_bytes)
+    view = memoryview(buffer)
+    received = 0
+    while received < num_bytes:
+        n = sock.recv_into(view[received:])
+        if n == 0:
+            raise ConnectionError("Connection closed by peer")
+        received += n
+    return buffer
+
+def send_array(sock, array):
+    array = np.ascontiguousarray(array, dtype=np.float32)
+    sock.sendall(HEADER.pack(*array.shape) + array.tobytes())
+
+class RequestRejected(ValueError):
+    """Header request tidak valid; body tidak dibaca sehingga koneksi harus ditutup"""
+
+def recv_array(sock, max_rows=None, expected_cols=None):
+    """Terima array float32; header di-validasi dulu agar client tidak bisa memaksa alokasi besar"""
+    rows, cols = HEADER.unpack(recv_exact(sock, HEADER.size))
+    if expected_cols is not None and cols != expected_cols:
+        raise RequestRejected(f"Expected {expected_cols} features, got {cols}")
+    if max_rows is not None and rows > max_rows:
+        raise RequestRejected(f"Request has {rows} rows, limit is {max_rows}")
+    data = recv_exact(sock, rows * cols * 4)
+    return np.frombuffer(data, dtype=np.float32).reshape(rows, cols)
+
+class _PendingRequest:
+    """Request satu client yang menunggu hasil batch"""
+    __slots__ = ('landmarks', 'result', 'error', 'done')
+
+    def __init__(self, landmarks):
+        self.landmarks = landmarks
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+class MicroBatcher:
+    """Gabungkan request yang datang dalam window singkat menjadi satu forward pass"""
+
+    def __init__(self, predictor, scaler=None, window_ms=None, max_batch=None):
+        config = Config()
+        self.predictor = predictor
+        self.scaler = scaler
+        self.window = (window_ms if window_ms is not None
+                       else config.INFERENCE_SERVER_BATCH_WINDOW_MS) / 1000.0
+        self.max_batch = max_batch or config.INFERENCE_SERVER_MAX_BATCH
+        self.requests = queue.Queue()
+
+        # Statistik
+        self.num_requests = 0
+        self.num_batches = 0
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, landmarks):
+        """Dipanggil dari thread client; blok sampai hasil batch tersedia"""
+        request = _PendingRequest(landmarks)
+        self.requests.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _collect_batch(self):
+        batch = [self.requests.get()]
+        num_rows = len(batch[0].landmarks)
+        deadline = time.perf_counter() + self.window
+
+        while num_rows < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = self.requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            num_rows += len(request.landmarks)
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            try:
+                landmarks = np.concatenate([request.landmarks for request in batch])
+                if self.scaler is not None:
+                    landmarks = self.scaler.transform(landmarks)
+                predictions = self.predictor.predict(landmarks)
+
+                start = 0
+                for request in batch:
+                    end = start + len(request.landmarks)
+                    request.result = predictions[start:end]
+                    start = end
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+
+            self.num_requests += len(batch)
+            self.num_batches += 1
+            for request in batch:
+                request.done.set()
+
+    @property
+    def average_batch_size(self):
+        return self.num_requests / self.num_batches if self.num_batches else 0.0
+
+class _InferenceRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while True:
+            try:
+                landmarks = recv_array(self.request, Config.INFERENCE_SERVER_MAX_ROWS, Config.NUM_FEATURES)
+            except ConnectionError:
+                return
+            except RequestRejected as e:
+                # Shape salah hanya ditolak untuk client ini (tidak masuk batch client lain).
+                # Body tidak dibaca, stream tidak sinkron lagi: balas error lalu tutup koneksi
+                print(f"Request rejected: {e}")
+                send_array(self.request, np.zeros((0, 0), dtype=np.float32))
+                return
+
+            try:
+                predictions = self.server.batcher.submit(landmarks)
+            except Exception as e:
+                print(f"Prediction error: {e}")
+                predictions = np.zeros((0, 0), dtype=np.float32)
+
+            send_array(self.request, predictions)
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class _ThreadingUnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+class InferenceServer:
+    """Server inference lokal: satu model + scaler untuk banyak detector station"""
+
+    def __init__(self, address=None, backend=None, model_path=None,
+                 window_ms=None, max_batch=None):
+        import joblib
+        from src.inference import create_predictor
+
+        self.config = Config()
+        self.address = address or self.config.INFERENCE_SERVER_ADDRESS
+
+        predictor = create_predictor(backend, model_path)
+        scaler = None
+        if not predictor.includes_scaler:
+            scaler = joblib.load(os.path.join(self.config.MODELS_DIR, 'scaler.pkl'))
+        print(f"✅ Model loaded: {predictor.model_path} (backend: {predictor.name})")
+
+        self.batcher = MicroBatcher(predictor, scaler, window_ms, max_batch)
+
+        family, bind_address = parse_address(self.address)
+        if family == socket.AF_UNIX:
+            if os.path.exists(bind_address):
+                os.remove(bind_address)
+            self.server = _ThreadingUnixServer(bind_address, _InferenceRequestHandler)
+        else:
+            self.server = _ThreadingTCPServer(bind_address, _InferenceRequestHandler)
+        self.server.batcher = self.batcher
+
+    def serve_forever(self, stats_interval=10.0):
+        print(f"✅ Inference server listening on {self.address}")
+        print(f"Batch window: {self.batcher.window*1000:.1f} ms, max batch: {self.batcher.max_batch}")
+
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            while True:
+                time.sleep(stats_interval)
+                print(f"Requests: {self.batcher.num_requests} | "
+                      f"Batches: {self.batcher.num_batches} | "
+                      f"Avg batch size: {self.batcher.average_batch_size:.2f}")
+        except KeyboardInterrupt:
+            print("Stopping inference server...")
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        family, bind_address = parse_address(self.address)
+        if family == socket.AF_UNIX and os.path.exists(bind_address):
+            os.remove(bind_address)
+
+class InferenceClient:
+    """Client tipis: kirim landmark mentah, terima probabilitas"""
+
+    def __init__(self, address=None, timeout=5.0):
+        self.address = address or Config().INFERENCE_SERVER_ADDRESS
+        family, connect_address = parse_address(self.address)
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(connect_address)
+        if family == socket.AF_INET:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def predict(self, landmarks):
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        if landmarks.ndim == 1:
+            landmarks = landmarks.reshape(1, -1)
+
+        send_array(self.sock, landmarks)
+        predictions = recv_array(self.sock)
+        if predictions.shape[0] != landmarks.shape[0]:
+            raise RuntimeError("Inference server failed to process request")
+        return predictions
+
+    def close(self):
+        self.sock.close()
+
+def main():
+    from src.inference import PREDICTORS
+
+    parser = argparse.ArgumentParser(description="Local micro-batching inference server")
+    parser.add_argument('--address', default=None,
+                        help="'host:port' atau 'unix:/path/to.sock' (default: Config.INFERENCE_SERVER_ADDRESS)")
+    parser.add_argument('--backend', choices=sorted(b for b in PREDICTORS if b != 'remote'),
+                        default=None, help="Inference backend di server")
+    parser.add_argument('--model', default=None, help="Path ke file model")
+    parser.add_argument('--window-ms', type=float, default=None, help="Batch window (ms)")
+    parser.add_argument('--max-batch', type=int, default=None, help="Max baris per batch")
+    args = parser.parse_args()
+
+    server = InferenceServer(args.address, args.backend, args.model,
+                             args.window_ms, args.max_batch)
+    server.serve_forever()
+
+if __name__ == "__main__":
+    main()
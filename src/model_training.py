@@ -2,7 +2,10 @@ import tensorflow as tf
 from tensorflow import keras
 from tensorflow.keras import layers
 import numpy as np
+import json
+import math
 import os
+import time
 import joblib  # ✅ TAMBAHKAN INI
 from src.config import Config
 
@@ -48,8 +51,67 @@ class CoordinateModel:
         self.model = model
         return model
     
-    def train(self, X_train, y_train, X_val, y_val, data_loader=None):
-        """Training model"""
+    def make_dataset(self, X, y, training=False, augmenter=None, scaler=None):
+        """tf.data: cache (bagian statis) -> shuffle -> batch -> map augmentasi paralel -> prefetch.
+        
+        Dengan augmenter, dataset diulang tanpa batas (pakai steps_per_epoch) dan setiap
+        batch memakai RNG dari (seed, nomor batch global), sehingga run dengan seed sama
+        identik walaupun map berjalan paralel.
+        """
+        dataset = tf.data.Dataset.from_tensor_slices(
+            (np.asarray(X, dtype=np.float32), np.asarray(y, dtype=np.int32))).cache()
+        if training:
+            dataset = dataset.shuffle(self.config.TFDATA_SHUFFLE_BUFFER, seed=self.config.AUGMENT_SEED,
+                                      reshuffle_each_iteration=True)
+        dataset = dataset.batch(self.config.BATCH_SIZE)
+        
+        if training and augmenter is not None:
+            def augment(index, features):
+                batch_augmenter = augmenter.for_batch(index)
+                if scaler is not None:
+                    return batch_augmenter.augment_scaled(features, scaler)
+                return batch_augmenter.augment(features)
+            
+            def augment_batch(index, batch):
+                # Augmentasi per batch (vectorized) di thread tf.data, bukan di training thread
+                features, labels = batch
+                features = tf.numpy_function(augment, [index, features], tf.float32)
+                features.set_shape((None, self.config.NUM_FEATURES))
+                return features, labels
+            
+            dataset = tf.data.Dataset.zip(tf.data.Dataset.counter(), dataset.repeat())
+            dataset = dataset.map(augment_batch, num_parallel_calls=tf.data.AUTOTUNE, deterministic=True)
+        return dataset.prefetch(tf.data.AUTOTUNE)
+    
+    def fit_inputs(self, X_train, y_train, X_val, y_val, data_loader=None, augmenter=None, use_tf_data=False):
+        """Argumen input untuk model.fit: array NumPy, generator augmentasi, atau pipeline tf.data"""
+        scaler = None
+        if augmenter is not None:
+            # X_train sudah di-scale: augmenter perlu scaler untuk kembali ke koordinat mentah
+            scaler = data_loader.scaler if data_loader is not None else None
+            if scaler is None:
+                print("⚠️ No data_loader scaler: augmenting X_train as raw coordinates")
+            else:
+                from src.augmentation import check_scaled_range
+                sample = scaler.inverse_transform(X_train[:4096])
+                print(f"Augmentation range check: max |x| = {check_scaled_range(augmenter, sample, scaler):.1f} std")
+        
+        if use_tf_data:
+            # Shuffle sudah di pipeline/generator
+            inputs = {'x': self.make_dataset(X_train, y_train, True, augmenter, scaler),
+                      'validation_data': self.make_dataset(X_val, y_val), 'shuffle': False}
+            if augmenter is not None:
+                inputs['steps_per_epoch'] = math.ceil(len(X_train) / self.config.BATCH_SIZE)
+            return inputs
+        if augmenter is not None:
+            return {'x': augmenter.batches(X_train, y_train, self.config.BATCH_SIZE, scaler),
+                    'steps_per_epoch': math.ceil(len(X_train) / self.config.BATCH_SIZE),
+                    'validation_data': (X_val, y_val), 'shuffle': False}
+        return {'x': X_train, 'y': y_train, 'batch_size': self.config.BATCH_SIZE,
+                'validation_data': (X_val, y_val)}
+    
+    def train(self, X_train, y_train, X_val, y_val, data_loader=None, augmenter=None, use_tf_data=False):
+        """Training model (augmenter: LandmarkAugmenter per batch; use_tf_data: pipeline tf.data)"""
         
         callbacks = [
             keras.callbacks.EarlyStopping(
@@ -72,10 +134,8 @@ class CoordinateModel:
         ]
         
         history = self.model.fit(
-            X_train, y_train,
-            batch_size=self.config.BATCH_SIZE,
+            **self.fit_inputs(X_train, y_train, X_val, y_val, data_loader, augmenter, use_tf_data),
             epochs=self.config.EPOCHS,
-            validation_data=(X_val, y_val),
             callbacks=callbacks,
             verbose=1
         )
@@ -97,4 +157,74 @@ class CoordinateModel:
         print(f"Test Accuracy: {test_accuracy:.4f}")
         print(f"Test Loss: {test_loss:.4f}")
         
-        return test_loss, test_accuracy
\ No newline at end of file
+        return test_loss, test_accuracy
+
+class StepTimeCallback(keras.callbacks.Callback):
+    """Waktu wall-clock antar training step (input + compute); step pertama tiap epoch dilewati"""
+    
+    def __init__(self):
+        super().__init__()
+        self.step_times = []
+        self.last = None
+    
+    def on_epoch_begin(self, epoch, logs=None):
+        self.last = None
+    
+    def on_train_batch_end(self, batch, logs=None):
+        now = time.perf_counter()
+        if self.last is not None:
+            self.step_times.append(now - self.last)
+        self.last = now
+
+def input_time_per_batch(inputs, num_batches):
+    """Waktu rata-rata mengambil satu batch dari input (tanpa training)"""
+    x = inputs['x']
+    if isinstance(x, np.ndarray):
+        # Array NumPy: biaya input = gather batch acak (seperti shuffle Keras)
+        index = np.random.default_rng(0).permutation(len(x))
+        batch_size = inputs['batch_size']
+        start = time.perf_counter()
+        for i in range(num_batches):
+            batch = index[i * batch_size % len(x):][:batch_size]
+            features, labels = x[batch], inputs['y'][batch]
+        return (time.perf_counter() - start) / num_batches
+    iterator = iter(x)
+    next(iterator)  # Warmup (tracing / isi buffer prefetch)
+    start = time.perf_counter()
+    for _ in range(num_batches):
+        next(iterator)
+    return (time.perf_counter() - start) / num_batches
+
+def benchmark_input_pipeline(X_train, y_train, X_val, y_val, data_loader=None, augmenter=None, epochs=3):
+    """Bandingkan step time training: array NumPy vs tf.data (dengan/tanpa augmentasi).
+    
+    Input time per batch diukur terpisah dengan iterasi input tanpa training;
+    jika jauh di bawah step time, training compute-bound (bukan input-bound).
+    Model baru per konfigurasi dan tanpa ModelCheckpoint, jadi model.h5 tidak tertimpa.
+    """
+    config = Config()
+    setups = [('numpy arrays', None, False), ('tf.data', None, True)]
+    if augmenter is not None:
+        setups += [('generator + augment', augmenter, False), ('tf.data + augment', augmenter, True)]
+    
+    print("=== TRAINING STEP TIME REPORT ===")
+    report = {'epochs': epochs, 'batch_size': config.BATCH_SIZE, 'results': []}
+    for name, setup_augmenter, use_tf_data in setups:
+        model = CoordinateModel()
+        model.build_model()
+        inputs = model.fit_inputs(X_train, y_train, X_val, y_val, data_loader, setup_augmenter, use_tf_data)
+        timer = StepTimeCallback()
+        model.model.fit(**inputs, epochs=epochs, callbacks=[timer], verbose=0)
+        
+        step_ms = float(np.median(timer.step_times) * 1000) if timer.step_times else 0.0
+        input_ms = input_time_per_batch(inputs, num_batches=50) * 1000
+        bound = 'input-bound' if input_ms > 0.5 * step_ms else 'compute-bound'
+        report['results'].append({'setup': name, 'step_ms': step_ms, 'input_ms': input_ms, 'bound': bound})
+        print(f"{name:<22} step {step_ms:7.2f} ms | input {input_ms:6.2f} ms/batch | {bound}")
+    
+    os.makedirs(config.RESULTS_DIR, exist_ok=True)
+    report_path = os.path.join(config.RESULTS_DIR, 'training_step_time.json')
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Step time report saved: {report_path}")
+    return report
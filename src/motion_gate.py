@@ -0,0 +1,66 @@
+import numpy as np
+from src.config import Config
+
+class MotionGate:
+    """Lewati inference jika tangan tidak bergerak sejak frame terakhir yang di-score.
+
+    Metrik gerakan = displacement maksimum per landmark (x, y, z) terhadap
+    landmark frame terakhir yang di-score. Di bawah threshold, vektor
+    probabilitas sebelumnya dipakai ulang. Setiap max_skip frame tetap
+    di-score ulang agar hasil tidak basi.
+    """
+
+    def __init__(self, threshold=None, max_skip=None, enabled=None):
+        config = Config()
+        self.threshold = config.MOTION_GATE_THRESHOLD if threshold is None else threshold
+        self.max_skip = config.MOTION_GATE_MAX_SKIP if max_skip is None else max_skip
+        self.enabled = config.MOTION_GATE_ENABLED if enabled is None else enabled
+        self.scored_frames = 0
+        self.skipped_frames = 0
+        self.reset()
+
+    def reset(self):
+        self.last_landmarks = None
+        self.last_predictions = None
+        self.frames_since_score = 0
+
+    def motion(self, landmarks):
+        """Displacement maksimum per landmark sejak frame terakhir yang di-score"""
+        if self.last_landmarks is None or self.last_landmarks.shape != landmarks.shape:
+            return np.inf
+        displacement = (landmarks - self.last_landmarks).reshape(len(landmarks), -1, 3)
+        return float(np.sqrt((displacement ** 2).sum(axis=2)).max())
+
+    def predict(self, landmarks, predict_fn):
+        """Probabilitas untuk batch landmark (n_hands, 63); predict_fn hanya dipanggil jika perlu"""
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        if landmarks.ndim == 1:
+            landmarks = landmarks.reshape(1, -1)
+
+        if (self.enabled and self.frames_since_score < self.max_skip
+                and self.motion(landmarks) < self.threshold):
+            self.frames_since_score += 1
+            self.skipped_frames += 1
+            return self.last_predictions
+
+        predictions = predict_fn(landmarks)
+        self.last_landmarks = landmarks.copy()
+        self.last_predictions = predictions
+        self.frames_since_score = 0
+        self.scored_frames += 1
+        return predictions
+
+    @property
+    def skip_ratio(self):
+        total = self.scored_frames + self.skipped_frames
+        return self.skipped_frames / total if total else 0.0
+
+    def stats_text(self):
+        if not self.enabled:
+            return "Gate: off"
+        return f"Skip: {self.skip_ratio*100:.0f}%"
+
+    def summary(self):
+        total = self.scored_frames + self.skipped_frames
+        return (f"Inference skipped on {self.skipped_frames}/{total} frames "
+                f"({self.skip_ratio*100:.1f}%)")
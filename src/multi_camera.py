@@ -0,0 +1,240 @@
+import json
+import multiprocessing
+import os
+import queue
+import time
+import numpy as np
+from src.config import Config
+
+def camera_worker(stream_id, source, result_queue, stop_event, width=640, height=480):
+    """Proses worker per kamera: capture + MediaPipe Hands, kirim landmark ke coordinator.
+
+    Setiap worker punya instance Hands sendiri (state graph per kamera) dan
+    berjalan di proses terpisah sehingga tidak berbagi GIL.
+    """
+    import cv2
+    import mediapipe as mp
+    from src.landmark_extractor import LandmarkExtractor
+
+    config = Config()
+    cap = cv2.VideoCapture(source)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    if not cap.isOpened():
+        result_queue.put((stream_id, None, None, None, None))
+        return
+
+    hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=config.MAX_HANDS,
+        min_detection_confidence=config.MIN_DETECTION_CONFIDENCE,
+        min_tracking_confidence=config.MIN_TRACKING_CONFIDENCE
+    )
+    landmark_extractor = LandmarkExtractor()
+
+    try:
+        while not stop_event.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                break
+            capture_time = time.time()
+
+            frame = cv2.flip(frame, 1)
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            results = hands.process(rgb_frame)
+
+            # Copy: Queue mem-pickle di feeder thread, buffer extractor dipakai ulang
+            landmarks, handedness_list = landmark_extractor.extract(results)
+            landmarks_array = landmarks.copy()
+            process_latency = time.time() - capture_time
+
+            try:
+                result_queue.put_nowait(
+                    (stream_id, capture_time, process_latency, landmarks_array, handedness_list))
+            except queue.Full:
+                pass  # Coordinator tertinggal: lewati hasil frame ini
+    finally:
+        hands.close()
+        cap.release()
+
+class StreamStats:
+    """FPS dan latency per stream kamera"""
+
+    def __init__(self):
+        self.frames = 0
+        self.fps = 0.0
+        self.landmark_latency = 0.0  # capture -> landmark (di worker)
+        self.total_latency = 0.0  # capture -> prediction (di coordinator)
+        self._window_start = time.time()
+        self._window_frames = 0
+
+    def update(self, landmark_latency, total_latency, alpha=0.1):
+        self.frames += 1
+        self._window_frames += 1
+        self.landmark_latency += alpha * (landmark_latency - self.landmark_latency)
+        self.total_latency += alpha * (total_latency - self.total_latency)
+
+        elapsed = time.time() - self._window_start
+        if elapsed >= 1.0:
+            self.fps = self._window_frames / elapsed
+            self._window_start = time.time()
+            self._window_frames = 0
+
+class MultiCameraDetector:
+    """Coordinator: kumpulkan landmark dari semua worker kamera, satu classifier batch"""
+
+    def __init__(self, sources, backend=None, model_path=None, width=640, height=480):
+        import joblib
+        from src.inference import create_predictor
+        from src.smoothing import PredictionSmoother
+
+        self.config = Config()
+        self.sources = list(sources)
+        self.width = width
+        self.height = height
+
+        self.predictor = create_predictor(backend, model_path)
+        self.scaler = None
+        if not self.predictor.includes_scaler:
+            self.scaler = joblib.load(os.path.join(self.config.MODELS_DIR, 'scaler.pkl'))
+
+        # Key smoothing: (stream_id, hand_index, handedness)
+        self.smoother = PredictionSmoother(history_size=7, min_history=3)
+        self.stats = {stream_id: StreamStats() for stream_id in range(len(self.sources))}
+        self.predictions = {}  # stream_id -> list (prediction, confidence) per tangan
+        self.first_frame_time = None  # Untuk throughput benchmark (setelah startup worker)
+
+        self.context = multiprocessing.get_context('spawn')
+        self.result_queue = self.context.Queue(maxsize=4 * len(self.sources))
+        self.stop_event = self.context.Event()
+        self.workers = []
+
+    def start(self):
+        for stream_id, source in enumerate(self.sources):
+            worker = self.context.Process(
+                target=camera_worker,
+                args=(stream_id, source, self.result_queue, self.stop_event,
+                      self.width, self.height),
+                daemon=True
+            )
+            worker.start()
+            self.workers.append(worker)
+        print(f"✅ Started {len(self.workers)} camera workers")
+
+    def _drain_queue(self, timeout=0.1):
+        """Ambil semua hasil yang sudah tersedia (blok sampai ada minimal satu)"""
+        try:
+            messages = [self.result_queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                messages.append(self.result_queue.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def process_messages(self, messages):
+        """Klasifikasi landmark semua stream dalam satu forward pass"""
+        batches = []
+        for stream_id, capture_time, process_latency, landmarks, handedness in messages:
+            if capture_time is None:
+                print(f"❌ Stream {stream_id}: cannot open source {self.sources[stream_id]}")
+                continue
+            batches.append((stream_id, capture_time, process_latency, landmarks, handedness))
+
+        all_landmarks = [landmarks for _, _, _, landmarks, _ in batches if len(landmarks)]
+        if all_landmarks:
+            stacked = np.concatenate(all_landmarks)
+            if self.scaler is not None:
+                stacked = self.scaler.transform(stacked)
+            probabilities = self.predictor.predict(stacked)
+        else:
+            probabilities = np.zeros((0, self.config.NUM_CLASSES), dtype=np.float32)
+
+        now = time.time()
+        if batches and self.first_frame_time is None:
+            self.first_frame_time = now
+        row = 0
+        for stream_id, capture_time, process_latency, landmarks, handedness in batches:
+            hand_predictions = []
+            hand_keys = set()
+            for hand_index in range(len(landmarks)):
+                probs = probabilities[row]
+                row += 1
+                prediction = self.config.LETTERS[int(np.argmax(probs))]
+                hand_key = (stream_id, hand_index, handedness[hand_index])
+                hand_keys.add(hand_key)
+                hand_predictions.append(self.smoother.update(hand_key, prediction, float(np.max(probs))))
+            # Hapus history tangan yang hilang dari stream ini saja (stream lain tidak ada di frame ini)
+            self.smoother.prune(hand_keys | {key for key in self.smoother.histories if key[0] != stream_id})
+            self.predictions[stream_id] = hand_predictions
+            self.stats[stream_id].update(process_latency, now - capture_time)
+
+    def print_stats(self):
+        total_fps = sum(stats.fps for stats in self.stats.values())
+        print(f"\n=== MULTI-CAMERA STATS (total {total_fps:.1f} FPS) ===")
+        for stream_id, stats in self.stats.items():
+            predictions = ", ".join(f"{p} ({c:.2f})" for p, c in self.predictions.get(stream_id, [])) or "-"
+            print(f"Stream {stream_id} [{self.sources[stream_id]}]: {stats.fps:5.1f} FPS | "
+                  f"landmark {stats.landmark_latency*1000:5.1f} ms | "
+                  f"end-to-end {stats.total_latency*1000:5.1f} ms | {predictions}")
+
+    @property
+    def total_frames(self):
+        return sum(stats.frames for stats in self.stats.values())
+
+    def run(self, duration=None, stats_interval=2.0):
+        self.start()
+        start_time = last_stats = time.time()
+        try:
+            while duration is None or time.time() - start_time < duration:
+                messages = self._drain_queue()
+                if messages:
+                    self.process_messages(messages)
+
+                if time.time() - last_stats >= stats_interval:
+                    self.print_stats()
+                    last_stats = time.time()
+
+                if not any(worker.is_alive() for worker in self.workers):
+                    print("All camera workers stopped")
+                    break
+        except KeyboardInterrupt:
+            print("Stopping multi-camera detection...")
+        finally:
+            self.stop()
+            self.print_stats()
+
+    def stop(self):
+        self.stop_event.set()
+        for worker in self.workers:
+            worker.join(timeout=2.0)
+            if worker.is_alive():
+                worker.terminate()
+        self.workers = []
+
+def benchmark_scaling(sources, seconds=20.0, backend=None, model_path=None):
+    """Total FPS untuk 1..N stream (N = jumlah source); idealnya naik linear sampai jumlah core"""
+    config = Config()
+    print(f"=== MULTI-CAMERA SCALING BENCHMARK ({len(sources)} sources, {os.cpu_count()} cores) ===")
+    report = {'cpu_count': os.cpu_count(), 'seconds': seconds, 'results': []}
+    baseline = None
+    for num_streams in range(1, len(sources) + 1):
+        detector = MultiCameraDetector(sources[:num_streams], backend, model_path)
+        detector.run(duration=seconds, stats_interval=float('inf'))
+        elapsed = time.time() - detector.first_frame_time if detector.first_frame_time else 0.0
+        total_fps = detector.total_frames / elapsed if elapsed > 0 else 0.0
+        baseline = baseline or total_fps
+        speedup = total_fps / baseline if baseline else 0.0
+        report['results'].append({'streams': num_streams, 'frames': detector.total_frames,
+                                  'total_fps': total_fps, 'fps_per_stream': total_fps / num_streams,
+                                  'speedup': speedup})
+        print(f"{num_streams:2d} streams: {total_fps:7.1f} total FPS | "
+              f"{total_fps / num_streams:6.1f} FPS/stream | speedup {speedup:.2f}x")
+
+    os.makedirs(config.RESULTS_DIR, exist_ok=True)
+    report_path = os.path.join(config.RESULTS_DIR, 'multi_camera_scaling.json')
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Scaling report saved: {report_path}")
+    return report
@@ -0,0 +1,164 @@
+import json
+import numpy as np
+from src.config import Config
+
+ACTIVATIONS = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0, out=x),
+    'sigmoid': lambda x: 1.0 / (1.0 + np.exp(-x)),
+    'tanh': np.tanh,
+}
+
+def softmax(x):
+    """Softmax stabil numerik per baris"""
+    x -= x.max(axis=1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=1, keepdims=True)
+    return x
+
+ACTIVATIONS['softmax'] = softmax
+
+def fold_scaler_into_dense(kernel, bias, scaler):
+    """Fold StandardScaler ke Dense pertama: Dense((x - mean) / scale) = Dense'(x)"""
+    kernel = np.asarray(kernel, dtype=np.float64)
+    bias = np.asarray(bias, dtype=np.float64)
+    mean = scaler.mean_ if getattr(scaler, 'mean_', None) is not None else np.zeros(kernel.shape[0])
+    scale = scaler.scale_ if getattr(scaler, 'scale_', None) is not None else np.ones(kernel.shape[0])
+
+    fused_kernel = kernel / np.asarray(scale, dtype=np.float64)[:, None]
+    fused_bias = bias - np.asarray(mean, dtype=np.float64) @ fused_kernel
+    return fused_kernel.astype(np.float32), fused_bias.astype(np.float32)
+
+class NumpyCoordinateModel:
+    """Forward pass coordinate MLP dengan NumPy murni (tanpa TensorFlow).
+
+    Bobot Dense/BatchNormalization dibaca sekali dari file .h5 Keras.
+    BatchNormalization di-fold ke layer Dense (ke Dense sebelumnya jika
+    aktivasinya linear, selain itu ke Dense berikutnya karena di model ini
+    BN berada setelah ReLU). Dropout diabaikan karena identitas saat inference.
+    """
+
+    def __init__(self, model_path=None):
+        self.config = Config()
+        self.model_path = model_path or self.config.MODEL_PATH
+        self.layers = []  # list of (kernel, bias, activation)
+        self.load_weights(self.model_path)
+
+    @staticmethod
+    def _read_layer_weights(weights_group, layer_name):
+        """Baca semua weight satu layer sebagai dict {nama: array float64}"""
+        group = weights_group[layer_name]
+        weights = {}
+        for weight_name in group.attrs['weight_names']:
+            if isinstance(weight_name, bytes):
+                weight_name = weight_name.decode('utf-8')
+            short_name = weight_name.split('/')[-1].split(':')[0]
+            weights[short_name] = np.asarray(group[weight_name], dtype=np.float64)
+        return weights
+
+    def load_weights(self, model_path):
+        """Load dan fold bobot dari file .h5 Keras"""
+        import h5py
+
+        with h5py.File(model_path, 'r') as f:
+            model_config = f.attrs['model_config']
+            if isinstance(model_config, bytes):
+                model_config = model_config.decode('utf-8')
+            layer_configs = json.loads(model_config)['config']['layers']
+            weights_group = f['model_weights'] if 'model_weights' in f else f
+
+            layers = []
+            # Affine (scale, shift) dari BN yang menunggu Dense berikutnya
+            pending_scale, pending_shift = None, None
+
+            for layer in layer_configs:
+                class_name = layer['class_name']
+                cfg = layer['config']
+
+                if class_name in ('InputLayer', 'Dropout'):
+                    continue
+
+                if class_name == 'Dense':
+                    weights = self._read_layer_weights(weights_group, cfg['name'])
+                    kernel = weights['kernel']
+                    bias = weights.get('bias', np.zeros(kernel.shape[1]))
+
+                    if pending_scale is not None:
+                        # Dense(BN(h)) = h @ (diag(s) W) + (t @ W + b)
+                        bias = pending_shift @ kernel + bias
+                        kernel = pending_scale[:, None] * kernel
+                        pending_scale, pending_shift = None, None
+
+                    layers.append([kernel, bias, cfg.get('activation', 'linear')])
+
+                elif class_name == 'BatchNormalization':
+                    weights = self._read_layer_weights(weights_group, cfg['name'])
+                    mean = weights['moving_mean']
+                    gamma = weights.get('gamma', np.ones_like(mean))
+                    beta = weights.get('beta', np.zeros_like(mean))
+                    scale = gamma / np.sqrt(weights['moving_variance'] + cfg.get('epsilon', 1e-3))
+                    shift = beta - mean * scale
+
+                    if pending_scale is not None:
+                        pending_shift = pending_shift * scale + shift
+                        pending_scale = pending_scale * scale
+                    elif layers and layers[-1][2] == 'linear':
+                        layers[-1][0] = layers[-1][0] * scale
+                        layers[-1][1] = layers[-1][1] * scale + shift
+                    else:
+                        pending_scale, pending_shift = scale, shift
+
+                else:
+                    raise ValueError(f"Layer tidak didukung oleh NumPy engine: {class_name}")
+
+            if pending_scale is not None:
+                raise ValueError("BatchNormalization di akhir model tidak bisa di-fold")
+
+        for kernel, bias, activation in layers:
+            if activation not in ACTIVATIONS:
+                raise ValueError(f"Aktivasi tidak didukung: {activation}")
+
+        self.layers = [
+            (np.ascontiguousarray(kernel, dtype=np.float32),
+             np.ascontiguousarray(bias, dtype=np.float32),
+             ACTIVATIONS[activation])
+            for kernel, bias, activation in layers
+        ]
+        return self.layers
+
+    def predict(self, x, verbose=0):
+        """Forward pass; signature mengikuti keras Model.predict"""
+        x = np.asarray(x, dtype=np.float32)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+
+        for kernel, bias, activation in self.layers:
+            x = x @ kernel
+            x += bias
+            x = activation(x)
+
+        return x
+
+    __call__ = predict
+
+    def verify_against_keras(self, keras_model=None, num_samples=256, tolerance=None):
+        """Bandingkan probabilitas dengan model Keras pada input random"""
+        if tolerance is None:
+            tolerance = self.config.INFERENCE_TOLERANCE
+
+        if keras_model is None:
+            import tensorflow as tf
+            keras_model = tf.keras.models.load_model(self.model_path)
+
+        rng = np.random.default_rng(42)
+        dummy_input = rng.standard_normal((num_samples, self.config.NUM_FEATURES)).astype(np.float32)
+
+        keras_output = keras_model.predict(dummy_input, verbose=0)
+        numpy_output = self.predict(dummy_input)
+        max_diff = float(np.max(np.abs(keras_output - numpy_output)))
+
+        if max_diff > tolerance:
+            raise AssertionError(
+                f"NumPy engine berbeda dari Keras: max diff {max_diff:.2e} > {tolerance:.0e}")
+
+        return max_diff
@@ -0,0 +1,90 @@
+import queue
+import threading
+import numpy as np
+
+class LatestQueue(queue.Queue):
+    """Queue bounded yang membuang item paling lama saat penuh.
+
+    Counter dropped dilindungi lock sendiri: put_latest bisa dipanggil dari
+    beberapa thread stage dan dropped dibaca dari main thread.
+    """
+
+    def __init__(self, maxsize=2):
+        super().__init__(maxsize)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    @property
+    def dropped(self):
+        with self._dropped_lock:
+            return self._dropped
+
+    def put_latest(self, item):
+        while True:
+            try:
+                self.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.get_nowait()
+                except queue.Empty:
+                    continue
+                with self._dropped_lock:
+                    self._dropped += 1
+
+class FramePacket:
+    """Data satu frame yang mengalir antar stage, membawa timestamp capture"""
+    __slots__ = ('frame_id', 'capture_time', 'frame', 'landmarks_list', 'hand_keys',
+                 'hand_detected', 'landmark_time')
+
+    def __init__(self, frame_id, capture_time, frame):
+        self.frame_id = frame_id
+        self.capture_time = capture_time
+        self.frame = frame
+        self.landmarks_list = []
+        self.hand_keys = []
+        self.hand_detected = False
+        self.landmark_time = None
+
+class LatencyStats:
+    """Kumpulkan sample latency (detik) dan ringkas sebagai mean / p95"""
+
+    def __init__(self, max_samples=1000):
+        self.samples = []
+        self.max_samples = max_samples
+
+    def add(self, value):
+        self.samples.append(value)
+        if len(self.samples) > self.max_samples:
+            self.samples.pop(0)
+
+    @property
+    def mean_ms(self):
+        return float(np.mean(self.samples)) * 1000 if self.samples else 0.0
+
+    @property
+    def p95_ms(self):
+        return float(np.percentile(self.samples, 95)) * 1000 if self.samples else 0.0
+
+    def summary(self):
+        return f"mean {self.mean_ms:.1f} ms | p95 {self.p95_ms:.1f} ms"
+
+def start_stage(target, stop_event, name):
+    """Jalankan fungsi stage di thread daemon; stage berhenti saat stop_event di-set"""
+    def run():
+        try:
+            while not stop_event.is_set():
+                target()
+        except Exception as e:
+            print(f"Error in {name} stage: {e}")
+            stop_event.set()
+
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    return thread
+
+def get_or_none(source_queue, timeout=0.1):
+    try:
+        return source_queue.get(timeout=timeout)
+    except queue.Empty:
+        return None
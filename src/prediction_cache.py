@@ -0,0 +1,75 @@
+from collections import OrderedDict
+import numpy as np
+from src.config import Config
+
+class PredictionCache:
+    """LRU cache probabilitas prediksi di depan predictor.
+
+    Key = 21 landmark relatif terhadap wrist (landmark 0), di-quantize ke grid
+    Config.PREDICTION_CACHE_GRID. Frame berurutan saat huruf ditahan
+    menghasilkan key yang sama sehingga scaling + inference bisa dilewati.
+    """
+
+    def __init__(self, max_size=None, grid=None, enabled=None):
+        config = Config()
+        self.max_size = config.PREDICTION_CACHE_SIZE if max_size is None else max_size
+        self.grid = config.PREDICTION_CACHE_GRID if grid is None else grid
+        if self.grid <= 0:
+            raise ValueError(f"Cache grid must be > 0, got {self.grid}")
+        # max_size=0 -> cache tidak menyimpan apa pun, jadi sama dengan dimatikan
+        self.enabled = (config.PREDICTION_CACHE_ENABLED if enabled is None else enabled) and self.max_size > 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def make_keys(self, landmarks):
+        """Key per baris dari batch landmark (n, 63)"""
+        points = np.asarray(landmarks, dtype=np.float32).reshape(len(landmarks), -1, 3)
+        relative = points - points[:, :1, :]
+        quantized = np.round(relative / self.grid).astype(np.int32)
+        return [row.tobytes() for row in quantized]
+
+    def predict(self, landmarks, predict_fn):
+        """Probabilitas untuk batch landmark; hanya baris yang miss dikirim ke predict_fn"""
+        landmarks = np.asarray(landmarks)
+        if landmarks.ndim == 1:
+            landmarks = landmarks.reshape(1, -1)
+
+        if not self.enabled:
+            return predict_fn(landmarks)
+
+        keys = self.make_keys(landmarks)
+        cached = [self.entries.get(key) for key in keys]
+        miss_rows = [i for i, probs in enumerate(cached) if probs is None]
+
+        self.misses += len(miss_rows)
+        self.hits += len(keys) - len(miss_rows)
+
+        if miss_rows:
+            # Semua miss tetap diprediksi dalam satu batch
+            new_predictions = predict_fn(landmarks[miss_rows])
+            for i, probs in zip(miss_rows, new_predictions):
+                cached[i] = np.array(probs, dtype=np.float32)
+                self.entries[keys[i]] = cached[i]
+
+        for key in keys:
+            self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+        return np.stack(cached)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats_text(self):
+        if not self.enabled:
+            return "Cache: off"
+        return f"Cache: {self.hits}/{self.hits + self.misses} hit ({self.hit_rate*100:.0f}%)"
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,13 +1,24 @@
+import os
+import time
 import cv2
+import joblib
 import mediapipe as mp
 import numpy as np
-import tensorflow as tf
 from .config import Config
+from .inference import create_predictor
+from .landmark_extractor import LandmarkExtractor
+from .adaptive_resolution import ResolutionController
+from .smoothing import PredictionSmoother
 
 class RealTimeCoordinateDetector:
-    def __init__(self, model_path):
+    def __init__(self, model_path, backend=None):
         self.config = Config()
-        self.model = tf.keras.models.load_model(model_path)
+        self.predictor = create_predictor(backend, model_path)
+        
+        # Scaler sekali di awal (tidak perlu jika model fused)
+        self.scaler = None
+        if not self.predictor.includes_scaler:
+            self.scaler = joblib.load(os.path.join(self.config.MODELS_DIR, 'scaler.pkl'))
         
         # Setup MediaPipe
         self.mp_hands = mp.solutions.hands
@@ -18,71 +29,72 @@ class RealTimeCoordinateDetector:
             min_tracking_confidence=self.config.MIN_TRACKING_CONFIDENCE
         )
         self.mp_draw = mp.solutions.drawing_utils
+        self.landmark_extractor = LandmarkExtractor()
+        self.resolution = ResolutionController()
         
         # Setup camera
         self.cap = cv2.VideoCapture(0)
         self.cap.set(3, 640)
         self.cap.set(4, 480)
         
-        # Prediction smoothing
-        self.prediction_history = []
+        # Prediction smoothing (per tangan, key = (index, handedness))
         self.history_size = 5
+        self.smoother = PredictionSmoother(self.history_size)
+        self.hand_predictions = {}
     
     def extract_and_predict(self, frame):
-        """Extract landmarks dan lakukan prediction"""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        """Extract landmarks semua tangan dan predict dalam satu batch"""
+        # Resolusi input MediaPipe adaptif; frame display tetap full resolution
+        start = time.perf_counter()
+        rgb_frame = cv2.cvtColor(self.resolution.resize(frame, frame.shape[1]), cv2.COLOR_BGR2RGB)
         results = self.hands.process(rgb_frame)
+        self.resolution.update(time.perf_counter() - start)
         
         prediction = "None"
         confidence = 0.0
+        self.hand_predictions = {}
         
         if results.multi_hand_landmarks:
+            # View (n_hands, 63) float32 ke buffer extractor
+            landmarks_list, handedness = self.landmark_extractor.extract(results)
+            hand_keys = list(enumerate(handedness))
+            
             for hand_landmarks in results.multi_hand_landmarks:
-                # Extract landmarks
-                landmarks = []
-                for landmark in hand_landmarks.landmark:
-                    landmarks.extend([landmark.x, landmark.y, landmark.z])
-                
-                # Preprocess dan predict
-                if len(landmarks) == self.config.NUM_FEATURES:
-                    from data_loader import CoordinateDataLoader
-                    data_loader = CoordinateDataLoader()
-                    
-                    try:
-                        processed_landmarks = data_loader.preprocess_single_sample(landmarks)
-                        predictions = self.model.predict(processed_landmarks, verbose=0)
-                        
-                        predicted_class = np.argmax(predictions[0])
-                        current_confidence = np.max(predictions[0])
-                        current_prediction = self.config.LETTERS[predicted_class]
-                        
-                        # Smooth prediction
-                        prediction, confidence = self.smooth_prediction(
-                            current_prediction, current_confidence
-                        )
-                        
-                    except Exception as e:
-                        print(f"Prediction error: {e}")
-                
                 # Draw landmarks
                 self.mp_draw.draw_landmarks(
                     frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+            
+            if len(landmarks_list):
+                try:
+                    # Satu forward pass untuk (n_hands, 63)
+                    batch = landmarks_list
+                    if self.scaler is not None:
+                        batch = self.scaler.transform(batch)
+                    predictions = self.predictor.predict(batch)
+                    
+                    predicted_classes = np.argmax(predictions, axis=1)
+                    confidences = np.max(predictions, axis=1)
+                    
+                    for hand_key, predicted_class, current_confidence in zip(
+                            hand_keys, predicted_classes, confidences):
+                        # Smooth prediction per tangan
+                        self.hand_predictions[hand_key] = self.smooth_prediction(
+                            self.config.LETTERS[predicted_class], current_confidence, hand_key
+                        )
+                    
+                    # Prediksi utama = tangan dengan confidence tertinggi
+                    prediction, confidence = max(self.hand_predictions.values(), key=lambda x: x[1])
+                    
+                except Exception as e:
+                    print(f"Prediction error: {e}")
+            
+            self.smoother.prune(hand_keys)
         
         return frame, prediction, confidence
     
-    def smooth_prediction(self, current_pred, current_conf):
-        """Smooth prediction menggunakan history"""
-        self.prediction_history.append((current_pred, current_conf))
-        
-        if len(self.prediction_history) > self.history_size:
-            self.prediction_history.pop(0)
-        
-        if len(self.prediction_history) == self.history_size:
-            # Ambil prediction dengan confidence tertinggi
-            best_pred = max(self.prediction_history, key=lambda x: x[1])
-            return best_pred[0], best_pred[1]
-        
-        return current_pred, current_conf
+    def smooth_prediction(self, current_pred, current_conf, hand_key=(0, None)):
+        """Smooth prediction menggunakan history per tangan"""
+        return self.smoother.update(hand_key, current_pred, current_conf)
     
     def run_detection(self):
         """Jalankan real-time detection"""
@@ -113,4 +125,5 @@ class RealTimeCoordinateDetector:
                 break
         
         self.cap.release()
-        cv2.destroyAllWindows()
\ No newline at end of file
+        cv2.destroyAllWindows()
+        print(self.resolution.summary())
\ No newline at end of file
@@ -0,0 +1,178 @@
+import atexit
+import csv
+import os
+import queue
+import threading
+import time
+from src.config import Config
+
+def landmark_columns():
+    """Kolom CSV: x_0,y_0,z_0,...,x_20,y_20,z_20,label"""
+    columns = []
+    for i in range(Config.NUM_LANDMARKS):
+        columns.extend([f'x_{i}', f'y_{i}', f'z_{i}'])
+    columns.append('label')
+    return columns
+
+class SampleWriter:
+    """Append sample ke {letter}_coordinates.csv lewat file handle yang tetap terbuka.
+
+    Baris di-buffer di memori dan di-flush saat jumlahnya mencapai
+    flush_rows, saat flush_interval detik lewat, dan saat close() (juga
+    lewat atexit, jadi Ctrl-C tidak menghilangkan data). Biaya write()
+    tidak bergantung pada ukuran file. mode='w' menimpa file huruf yang
+    pertama kali ditulis (seperti save_to_csv), mode='a' menambahkan.
+    """
+
+    def __init__(self, data_dir=None, flush_rows=None, flush_interval=None, mode='a'):
+        config = Config()
+        self.data_dir = data_dir or config.RAW_COORD_DIR
+        self.flush_rows = flush_rows or config.SAMPLE_WRITER_FLUSH_ROWS
+        self.flush_interval = flush_interval or config.SAMPLE_WRITER_FLUSH_SECONDS
+        self.mode = mode
+        self.files = {}
+        self.writers = {}
+        self.buffer = []
+        self.last_flush = time.time()
+        self.rows_written = 0
+        self.letter_rows = {}  # Baris yang sudah di-flush per huruf
+
+        # Latency write() (detik) untuk memastikan tetap konstan
+        self.write_count = 0
+        self.write_time = 0.0
+        self.max_write_time = 0.0
+
+        os.makedirs(self.data_dir, exist_ok=True)
+        atexit.register(self.close)
+
+    def _writer(self, letter):
+        if letter not in self.writers:
+            path = os.path.join(self.data_dir, f'{letter}_coordinates.csv')
+            write_header = self.mode == 'w' or not os.path.exists(path) or os.path.getsize(path) == 0
+            self.files[letter] = open(path, self.mode, newline='')
+            self.writers[letter] = csv.writer(self.files[letter])
+            if write_header:
+                self.writers[letter].writerow(landmark_columns())
+        return self.writers[letter]
+
+    def write(self, landmarks, letter):
+        """Buffer satu sample (63 koordinat); flush jika threshold tercapai"""
+        start = time.perf_counter()
+        self.buffer.append((letter, list(landmarks)))
+        if len(self.buffer) >= self.flush_rows or time.time() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+        elapsed = time.perf_counter() - start
+        self.write_count += 1
+        self.write_time += elapsed
+        self.max_write_time = max(self.max_write_time, elapsed)
+
+    def flush(self):
+        """Tulis semua baris yang di-buffer ke file masing-masing huruf"""
+        letters = set()
+        for letter, landmarks in self.buffer:
+            self._writer(letter).writerow(landmarks + [letter])
+            letters.add(letter)
+        for letter in letters:
+            self.files[letter].flush()
+        for letter, _ in self.buffer:
+            self.letter_rows[letter] = self.letter_rows.get(letter, 0) + 1
+        self.rows_written += len(self.buffer)
+        self.buffer = []
+        self.last_flush = time.time()
+
+    def close(self):
+        if self.buffer:
+            self.flush()
+        for f in self.files.values():
+            f.close()
+        self.files = {}
+        self.writers = {}
+
+    def summary(self):
+        mean_ms = self.write_time / self.write_count * 1000 if self.write_count else 0.0
+        return (f"Sample writer: {self.rows_written} rows written, "
+                f"save latency mean {mean_ms:.3f} ms / max {self.max_write_time*1000:.3f} ms")
+
+class BackgroundSampleWriter:
+    """SampleWriter di thread terpisah: capture loop hanya memasukkan sample ke queue.
+
+    Queue dibatasi SAMPLE_WRITER_QUEUE_SIZE: jika disk tertinggal, submit()
+    blok (backpressure) alih-alih memori tumbuh tanpa batas. Kapan buffer
+    di-flush tetap diputuskan threshold SampleWriter (baris / detik);
+    selain itu flush dipaksa oleh flush()/close() dan saat queue kosong
+    lebih lama dari SAMPLE_WRITER_FLUSH_SECONDS. confirmed() hanya
+    menghitung baris yang sudah di-flush ke file.
+    """
+
+    _FLUSH = object()  # Marker di queue: paksa flush
+
+    def __init__(self, data_dir=None, queue_size=None, mode='a'):
+        config = Config()
+        self.writer = SampleWriter(data_dir, mode=mode)
+        self.idle_flush = config.SAMPLE_WRITER_FLUSH_SECONDS
+        self.queue = queue.Queue(maxsize=queue_size or config.SAMPLE_WRITER_QUEUE_SIZE)
+        self.error = None
+        self.submitted = 0
+        self.blocked_time = 0.0  # Total waktu submit() menunggu karena queue penuh
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def submit(self, landmarks, letter):
+        if self.error is not None:
+            raise self.error
+        start = time.perf_counter()
+        self.queue.put((letter, list(landmarks)))
+        self.blocked_time += time.perf_counter() - start
+        self.submitted += 1
+
+    def _run(self):
+        while True:
+            try:
+                item = self.queue.get(timeout=self.idle_flush)
+            except queue.Empty:
+                # Capture berhenti: tulis sisa buffer agar confirmed() tidak tertahan
+                if self.writer.buffer:
+                    try:
+                        self.writer.flush()
+                    except Exception as e:
+                        print(f"❌ Sample writer error: {e}")
+                        self.error = e
+                continue
+            try:
+                if item is None:
+                    self.writer.close()
+                    return
+                if item is self._FLUSH:
+                    self.writer.flush()
+                else:
+                    letter, landmarks = item
+                    self.writer.write(landmarks, letter)
+            except Exception as e:
+                print(f"❌ Sample writer error: {e}")
+                self.error = e
+            finally:
+                self.queue.task_done()
+
+    def confirmed(self, letter=None):
+        """Jumlah baris yang sudah di-flush ke file (total atau per huruf)"""
+        if letter is None:
+            return self.writer.rows_written
+        return self.writer.letter_rows.get(letter, 0)
+
+    def flush(self):
+        """Tunggu sampai semua sample yang di-submit sudah ditulis ke file"""
+        if self.thread.is_alive():
+            self.queue.put(self._FLUSH)
+            self.queue.join()
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    def summary(self):
+        return (f"{self.writer.summary()} | {self.submitted} submitted, "
+                f"capture loop blocked {self.blocked_time*1000:.1f} ms total")
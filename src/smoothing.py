@@ -0,0 +1,34 @@
+class PredictionSmoother:
+    """Smoothing prediksi per tangan.
+
+    Setiap tangan punya history sendiri dengan key (hand_index, handedness),
+    sehingga prediksi tangan kiri dan kanan tidak saling mempengaruhi.
+    """
+
+    def __init__(self, history_size=5, min_history=None):
+        self.history_size = history_size
+        self.min_history = min_history or history_size
+        self.histories = {}
+
+    def update(self, key, prediction, confidence):
+        """Tambah prediksi baru dan kembalikan (prediction, confidence) hasil smoothing"""
+        history = self.histories.setdefault(key, [])
+        history.append((prediction, confidence))
+
+        if len(history) > self.history_size:
+            history.pop(0)
+
+        if len(history) >= self.min_history:
+            # Ambil prediction dengan confidence tertinggi
+            return max(history, key=lambda x: x[1])
+
+        return prediction, confidence
+
+    def prune(self, active_keys):
+        """Hapus history tangan yang tidak terdeteksi lagi"""
+        for key in list(self.histories):
+            if key not in active_keys:
+                del self.histories[key]
+
+    def reset(self):
+        self.histories = {}
@@ -0,0 +1,235 @@
+import csv
+import io
+import json
+import multiprocessing
+import os
+import time
+from src.config import Config
+from src.sample_writer import landmark_columns
+
+def label_for_video(video_path, video_dir):
+    """Label dari nama folder (videos/A/clip.mp4) atau prefix nama file (A_clip.mp4)"""
+    relative = os.path.relpath(video_path, video_dir)
+    parts = relative.split(os.sep)
+    if len(parts) > 1 and parts[0].upper() in Config.LETTERS:
+        return parts[0].upper()
+    stem = os.path.splitext(parts[-1])[0]
+    prefix = stem.replace('-', '_').replace(' ', '_').split('_')[0].upper()
+    return prefix if prefix in Config.LETTERS else None
+
+def extract_video_landmarks(task):
+    """Worker: landmark semua frame satu video dengan instance Hands sendiri.
+
+    Instance Hands dibuat per video agar state tracking tidak terbawa ke
+    video berikutnya di worker yang sama. Return frame yang di-decode dan
+    frame yang benar-benar diproses MediaPipe (setelah frame_step) terpisah.
+    """
+    import cv2
+    import mediapipe as mp
+    from src.landmark_extractor import LandmarkExtractor
+
+    video_path, label, frame_step = task
+    config = Config()
+    extractor = LandmarkExtractor(max_hands=1)
+    rows = []
+    frames_read = 0
+    frames_processed = 0
+    start = time.perf_counter()
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        return video_path, label, None, 0, 0, 0.0
+
+    with mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=1,
+            min_detection_confidence=config.MIN_DETECTION_CONFIDENCE,
+            min_tracking_confidence=config.MIN_TRACKING_CONFIDENCE) as hands:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames_read += 1
+            if (frames_read - 1) % frame_step:
+                continue
+            results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            frames_processed += 1
+            landmarks, _ = extractor.extract(results)
+            if len(landmarks):
+                rows.append(landmarks[0].tolist())
+    cap.release()
+
+    return video_path, label, rows, frames_read, frames_processed, time.perf_counter() - start
+
+class VideoDatasetBuilder:
+    """Bangun data/raw_coordinates/*.csv dari folder video berlabel dengan process pool.
+
+    Baris ditambahkan ke {label}_coordinates.csv (schema sama dengan collect.py).
+    Checkpoint menyimpan video yang selesai dan range byte append yang
+    sedang berjalan; saat resume, hanya append yang terputus itu yang
+    dipotong sehingga baris video tersebut tidak terduplikasi.
+    """
+
+    def __init__(self, video_dir, output_dir=None, workers=None, frame_step=1):
+        self.config = Config()
+        self.video_dir = video_dir
+        self.output_dir = output_dir or self.config.RAW_COORD_DIR
+        self.workers = workers or os.cpu_count() or 1
+        self.frame_step = max(1, frame_step)
+        self.checkpoint_path = os.path.join(self.output_dir, self.config.VIDEO_CHECKPOINT_NAME)
+
+    def find_videos(self):
+        """Return list (path, label) terurut; video tanpa label valid dilewati"""
+        videos = []
+        for root, _, files in os.walk(self.video_dir):
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() not in self.config.VIDEO_EXTENSIONS:
+                    continue
+                path = os.path.join(root, name)
+                label = label_for_video(path, self.video_dir)
+                if label is None:
+                    print(f"⚠️ Skipping {path}: cannot infer label (use A/clip.mp4 or A_clip.mp4)")
+                    continue
+                videos.append((path, label))
+        return sorted(videos)
+
+    def load_checkpoint(self):
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as f:
+                checkpoint = json.load(f)
+            checkpoint.pop('csv_sizes', None)  # Format lama: ukuran permanen per label
+            checkpoint.setdefault('pending', {})
+            return checkpoint
+        return {'completed': {}, 'pending': {}}
+
+    def save_checkpoint(self, checkpoint):
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def csv_path(self, label):
+        return os.path.join(self.output_dir, f'{label}_coordinates.csv')
+
+    def rollback_uncommitted(self, checkpoint):
+        """Batalkan append yang belum di-commit (run sebelumnya terputus di tengah tulis).
+
+        Hanya file yang ukurannya masih di antara ukuran sebelum dan sesudah
+        append tersebut yang dipotong; file yang sudah ditambah proses lain
+        (collect.py, build_image_dataset.py, ...) tidak pernah dipotong.
+        """
+        for label, append in checkpoint['pending'].items():
+            path = self.csv_path(label)
+            if not os.path.exists(path):
+                continue
+            size = os.path.getsize(path)
+            if append['start'] < size <= append['end']:
+                with open(path, 'r+b') as f:
+                    f.truncate(append['start'])
+                print(f"↩️ {os.path.basename(path)}: rolled back uncommitted rows")
+            elif size > append['end']:
+                print(f"⚠️ {os.path.basename(path)} grew since the interrupted run; not rolling back "
+                      f"(rows of {append['video']} may be duplicated)")
+        checkpoint['pending'] = {}
+        self.save_checkpoint(checkpoint)
+
+    def append_rows(self, checkpoint, video_path, label, rows, frames_read, frames_processed):
+        path = self.csv_path(label)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if size == 0:
+            writer.writerow(landmark_columns())
+        writer.writerows(row + [label] for row in rows)
+        data = buffer.getvalue().encode()
+
+        # Catat range byte append ini sebelum menulis agar rollback tahu persis apa yang ditulis builder
+        checkpoint['pending'][label] = {'video': video_path, 'start': size, 'end': size + len(data)}
+        self.save_checkpoint(checkpoint)
+
+        with open(path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        del checkpoint['pending'][label]
+        checkpoint['completed'][video_path] = {'label': label, 'frames': frames_read,
+                                               'processed': frames_processed, 'rows': len(rows)}
+        self.save_checkpoint(checkpoint)
+
+    def _run_pool(self, tasks, workers, on_result):
+        """Jalankan task di pool; return (frame di-decode, frame diproses MediaPipe, waktu wall-clock)"""
+        context = multiprocessing.get_context('spawn')
+        decoded_frames = processed_frames = 0
+        start = time.perf_counter()
+        with context.Pool(processes=workers) as pool:
+            for result in pool.imap_unordered(extract_video_landmarks, tasks):
+                decoded_frames += result[3]
+                processed_frames += result[4]
+                on_result(result)
+        return decoded_frames, processed_frames, time.perf_counter() - start
+
+    def run(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        checkpoint = self.load_checkpoint()
+        self.rollback_uncommitted(checkpoint)
+
+        videos = self.find_videos()
+        pending = [(path, label, self.frame_step) for path, label in videos
+                   if path not in checkpoint['completed']]
+        print(f"Videos: {len(videos)} found, {len(videos) - len(pending)} already done, "
+              f"{len(pending)} to process with {self.workers} workers")
+        if not pending:
+            return checkpoint
+
+        done = [0]
+
+        def on_result(result):
+            video_path, label, rows, frames_read, frames_processed, elapsed = result
+            done[0] += 1
+            if rows is None:
+                print(f"❌ [{done[0]}/{len(pending)}] Cannot open {video_path}")
+                return
+            self.append_rows(checkpoint, video_path, label, rows, frames_read, frames_processed)
+            print(f"✅ [{done[0]}/{len(pending)}] {os.path.basename(video_path)} ({label}): "
+                  f"{len(rows)} rows from {frames_processed}/{frames_read} frames in {elapsed:.1f}s")
+
+        decoded, processed, elapsed = self._run_pool(pending, self.workers, on_result)
+        print(f"\nProcessed {processed} frames ({processed / elapsed:.1f} frames/s) of {decoded} decoded "
+              f"({decoded / elapsed:.1f} decoded/s) in {elapsed:.1f}s, {self.workers} workers")
+        return checkpoint
+
+    def benchmark_scaling(self, worker_counts, max_videos=None):
+        """Ukur frames/second untuk beberapa jumlah worker (tanpa menulis CSV).
+
+        frames/s = frame yang diproses MediaPipe; frame yang dilewati frame_step
+        hanya dihitung di decoded/s.
+        """
+        videos = self.find_videos()[:max_videos]
+        tasks = [(path, label, self.frame_step) for path, label in videos]
+        if not tasks:
+            print("❌ No videos found")
+            return None
+
+        print(f"=== SCALING BENCHMARK ({len(tasks)} videos) ===")
+        report = {'videos': len(tasks), 'frame_step': self.frame_step, 'results': []}
+        baseline = None
+        for workers in worker_counts:
+            decoded, processed, elapsed = self._run_pool(tasks, workers, lambda result: None)
+            fps = processed / elapsed if elapsed > 0 else 0.0
+            decoded_fps = decoded / elapsed if elapsed > 0 else 0.0
+            baseline = baseline or fps
+            report['results'].append({'workers': workers, 'frames': processed, 'decoded_frames': decoded,
+                                      'seconds': elapsed, 'frames_per_second': fps,
+                                      'decoded_frames_per_second': decoded_fps,
+                                      'speedup': fps / baseline if baseline else 0.0})
+            print(f"{workers:2d} workers: {fps:8.1f} frames/s ({decoded_fps:.1f} decoded/s) | "
+                  f"speedup {fps / baseline:.2f}x")
+
+        os.makedirs(self.config.RESULTS_DIR, exist_ok=True)
+        report_path = os.path.join(self.config.RESULTS_DIR, 'video_dataset_scaling.json')
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Scaling report saved: {report_path}")
+        return report
@@ -7,23 +7,35 @@ from sklearn.metrics import classification_report, confusion_matrix, precision_r
 from sklearn.metrics import roc_auc_score, accuracy_score
 import os
 import json
+import argparse
 from src.data_loader import CoordinateDataLoader
 from src.config import Config
+from src.inference import PREDICTORS, create_predictor, default_model_path
 
-def load_best_model():
-    """Load model terbaik"""
-    model_paths = [
-        os.path.join(Config().MODELS_DIR, 'coordinate_model.h5'),  # Best model dari checkpoint
-        os.path.join(Config().MODELS_DIR, 'coordinate_model_final.h5'),  # Final model
-        os.path.join(Config().MODELS_DIR, 'best_model.h5')  # Fallback
-    ]
-    
-    for model_path in model_paths:
-        if os.path.exists(model_path):
-            print(f"Loading model from: {model_path}")
-            return tf.keras.models.load_model(model_path)
-    
-    raise FileNotFoundError("No trained model found!")
+def load_best_model(backend=None):
+    """Load model terbaik sebagai predictor"""
+    backend = backend or Config().INFERENCE_BACKEND
+    # Data test sudah di-scale oleh data loader, jadi jangan pakai model fused
+    model_path = default_model_path(backend, prefer_fused=False)  # FileNotFoundError jika tidak ada
+    
+    print(f"Loading model from: {model_path} (backend: {backend})")
+    return create_predictor(backend, model_path)
+
+def predictor_inputs(model, data_loader, X):
+    """Data loader sudah men-scale X; predictor yang men-scale sendiri (remote) butuh landmark mentah"""
+    if model.includes_scaler:
+        return data_loader.scaler.inverse_transform(X).astype(np.float32)
+    return X
+
+def evaluate_predictor(model, X_test, y_test, data_loader=None):
+    """Hitung loss (sparse categorical crossentropy) dan accuracy dari predictor"""
+    if data_loader is not None:
+        X_test = predictor_inputs(model, data_loader, X_test)
+    y_pred_proba = model.predict(X_test)
+    true_proba = np.clip(y_pred_proba[np.arange(len(y_test)), y_test], 1e-7, 1.0)
+    test_loss = float(-np.mean(np.log(true_proba)))
+    test_accuracy = float(np.mean(np.argmax(y_pred_proba, axis=1) == y_test))
+    return test_loss, test_accuracy, y_pred_proba
 
 def plot_confusion_matrix(y_true, y_pred, class_names, save_path=None):
     """Plot confusion matrix"""
@@ -99,9 +111,9 @@ def plot_per_class_metrics(y_true, y_pred, class_names, save_path=None):
     
     return metrics_df
 
-def test_single_prediction(model, data_loader, sample_index=None):
-    """Test prediction untuk single sample"""
-    X_train, y_train, X_val, y_val, X_test, y_test, class_names = data_loader.load_dataset()
+def test_single_prediction(model, data_loader, sample_index=None, dataset=None):
+    """Test prediction untuk single sample (dataset = hasil load_dataset() jika sudah ada)"""
+    X_train, y_train, X_val, y_val, X_test, y_test, class_names = dataset or data_loader.load_dataset()
     
     if sample_index is None:
         sample_index = np.random.randint(0, len(X_test))
@@ -112,7 +124,7 @@ def test_single_prediction(model, data_loader, sample_index=None):
     true_class = class_names[true_label]
     
     # Predict
-    prediction = model.predict(sample.reshape(1, -1), verbose=0)
+    prediction = model.predict(predictor_inputs(model, data_loader, sample.reshape(1, -1)))
     predicted_class_idx = np.argmax(prediction[0])
     predicted_class = class_names[predicted_class_idx]
     confidence = np.max(prediction[0])
@@ -134,6 +146,11 @@ def test_single_prediction(model, data_loader, sample_index=None):
     return true_class == predicted_class
 
 def main():
+    parser = argparse.ArgumentParser(description="Evaluate coordinate model")
+    parser.add_argument('--backend', choices=sorted(PREDICTORS), default=None,
+                        help="Inference backend (default: Config.INFERENCE_BACKEND)")
+    args = parser.parse_args()
+    
     print("=== COORDINATE-BASED SIGN LANGUAGE MODEL TESTING ===")
     
     # Buat direktori results
@@ -142,7 +159,7 @@ def main():
     # Load model
     print("\n1. Loading model...")
     try:
-        model = load_best_model()
+        model = load_best_model(args.backend)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         print("Please run 'python train_coordinate_model.py' first to train a model.")
@@ -153,20 +170,20 @@ def main():
     data_loader = CoordinateDataLoader()
     
     try:
-        X_train, y_train, X_val, y_val, X_test, y_test, class_names = data_loader.load_dataset()
+        dataset = data_loader.load_dataset()
+        X_train, y_train, X_val, y_val, X_test, y_test, class_names = dataset
     except FileNotFoundError:
         print("Error: Dataset not found!")
         return
     
     # Evaluate model
     print("\n3. Evaluating model on test set...")
-    test_loss, test_accuracy = model.evaluate(X_test, y_test, verbose=0)
+    test_loss, test_accuracy, y_pred_proba = evaluate_predictor(model, X_test, y_test, data_loader)
     print(f"Test Accuracy: {test_accuracy:.4f}")
     print(f"Test Loss: {test_loss:.4f}")
     
     # Predictions
     print("\n4. Generating predictions...")
-    y_pred_proba = model.predict(X_test, verbose=0)
     y_pred = np.argmax(y_pred_proba, axis=1)
     
     # Classification Report
@@ -187,7 +204,7 @@ def main():
     print("\n8. Testing single predictions...")
     correct_predictions = 0
     for i in range(5):  # Test 5 random samples
-        if test_single_prediction(model, data_loader):
+        if test_single_prediction(model, data_loader, dataset=dataset):
             correct_predictions += 1
     
     print(f"\nSingle prediction test: {correct_predictions}/5 correct")
@@ -1,6 +1,8 @@
 import os
+import numpy as np
 import pandas as pd
 from src.config import Config
+from src.binary_dataset import load_binary_dataset
 
 def check_dataset():
     """Check dataset structure and contents"""
@@ -8,12 +10,12 @@ def check_dataset():
     
     print("=== DATASET CHECK ===")
     print(f"PROCESSED_DIR: {config.PROCESSED_DIR}")
-    print(f"COORDINATE_CSV: {config.COORDINATE_CSV}")
+    print(f"BINARY_DATASET_PATH: {config.BINARY_DATASET_PATH}")
     
     # Check if directory exists
     print(f"\n1. Checking directories...")
     print(f"PROCESSED_DIR exists: {os.path.exists(config.PROCESSED_DIR)}")
-    print(f"COORDINATE_CSV exists: {os.path.exists(config.COORDINATE_CSV)}")
+    print(f"BINARY_DATASET_PATH exists: {os.path.exists(config.BINARY_DATASET_PATH)}")
     
     if os.path.exists(config.PROCESSED_DIR):
         print(f"Files in PROCESSED_DIR:")
@@ -21,21 +23,24 @@ def check_dataset():
             file_path = os.path.join(config.PROCESSED_DIR, file)
             print(f"  - {file} (size: {os.path.getsize(file_path)} bytes)")
     
-    # Check CSV file
-    if os.path.exists(config.COORDINATE_CSV):
-        print(f"\n2. Checking CSV file...")
+    # Check binary dataset
+    if os.path.exists(config.BINARY_DATASET_PATH):
+        print(f"\n2. Checking binary dataset...")
         try:
-            df = pd.read_csv(config.COORDINATE_CSV)
-            print(f"Shape: {df.shape}")
-            print(f"Columns: {df.columns.tolist()}")
+            X, y, header = load_binary_dataset(config.BINARY_DATASET_PATH, verify=True)
+            print(f"Shape: {X.shape} ({X.dtype}), labels {y.dtype}")
+            print(f"Classes: {header['class_names']}")
+            print(f"SHA-256: {header['sha256']} (verified)")
             print(f"First 5 rows:")
-            print(df.head())
+            print(X[:5])
             print(f"\nLabel distribution:")
-            print(df['label'].value_counts().sort_index())
+            counts = np.bincount(y, minlength=len(header['class_names']))
+            for name, count in zip(header['class_names'], counts):
+                print(f"  {name}: {count}")
             
             # Check expected features
             expected_features = config.NUM_FEATURES
-            actual_features = len([col for col in df.columns if col != 'label'])
+            actual_features = X.shape[1]
             print(f"\nExpected features: {expected_features} (21 landmarks * 3 coordinates)")
             print(f"Actual features: {actual_features}")
             
@@ -44,10 +49,10 @@ def check_dataset():
                 print(f"Check your data collection process")
             
         except Exception as e:
-            print(f"Error reading CSV: {e}")
+            print(f"Error reading dataset: {e}")
     else:
-        print(f"\n❌ CSV file not found at: {config.COORDINATE_CSV}")
-        print(f"Please run: python collect_coordinates.py")
+        print(f"\n❌ Dataset not found at: {config.BINARY_DATASET_PATH}")
+        print(f"Please run: python collect_coordinate.py")
 
 def check_raw_data():
     """Check raw coordinate files"""
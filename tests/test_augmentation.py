@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from src.augmentation import LandmarkAugmenter, check_scaled_range
+from src.config import Config
+
+def hands(n=32, seed=0):
+    points = np.random.default_rng(seed).uniform(0.3, 0.7, (n, Config.NUM_LANDMARKS, 3)).astype(np.float32)
+    points[:, 0, 2] = 0.0  # z wrist MediaPipe selalu 0
+    return points.reshape(n, -1)
+
+def test_for_batch_is_reproducible():
+    batch = hands()
+    first = LandmarkAugmenter(seed=7).for_batch(3).augment(batch)
+    second = LandmarkAugmenter(seed=7).for_batch(3).augment(batch)
+    np.testing.assert_array_equal(first, second)
+
+def test_for_batch_does_not_depend_on_call_order():
+    batch = hands()
+    augmenter = LandmarkAugmenter(seed=7)
+    in_order = [augmenter.for_batch(i).augment(batch) for i in range(4)]
+    reversed_order = [augmenter.for_batch(i).augment(batch) for i in reversed(range(4))][::-1]
+    for a, b in zip(in_order, reversed_order):
+        np.testing.assert_array_equal(a, b)
+
+def test_for_batch_differs_per_index_and_seed():
+    batch = hands()
+    base = LandmarkAugmenter(seed=7).for_batch(0).augment(batch)
+    assert not np.array_equal(base, LandmarkAugmenter(seed=7).for_batch(1).augment(batch))
+    assert not np.array_equal(base, LandmarkAugmenter(seed=8).for_batch(0).augment(batch))
+
+def test_for_batch_leaves_parent_rng_untouched():
+    augmenter = LandmarkAugmenter(seed=7)
+    state = augmenter.rng.bit_generator.state
+    augmenter.for_batch(5).augment(hands())
+    assert augmenter.rng.bit_generator.state == state
+
+def test_wrist_z_and_scaled_range():
+    augmented = LandmarkAugmenter(seed=1).augment(hands()).reshape(-1, Config.NUM_LANDMARKS, 3)
+    assert np.all(augmented[:, 0, 2] == 0.0)
+    pytest.importorskip('sklearn')
+    assert check_scaled_range(LandmarkAugmenter(seed=1)) < 20.0
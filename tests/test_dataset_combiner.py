@@ -0,0 +1,65 @@
+import os
+import numpy as np
+import pandas as pd
+from src.binary_dataset import load_binary_dataset
+from src.dataset_combiner import DatasetCombiner
+from src.sample_writer import landmark_columns
+
+def write_letter(directory, letter, num_rows, seed):
+    data = np.random.default_rng(seed).random((num_rows, len(landmark_columns()) - 1), dtype=np.float32)
+    df = pd.DataFrame(data, columns=landmark_columns()[:-1])
+    df['label'] = letter
+    df.to_csv(os.path.join(directory, f'{letter}_coordinates.csv'), index=False)
+
+def combiner(tmp_path, name, raw_dir, extra_dirs=()):
+    return DatasetCombiner(str(raw_dir), str(tmp_path / f'{name}.bin'),
+                           str(tmp_path / f'{name}_manifest.json'), extra_dirs)
+
+def load(tmp_path, name):
+    features, labels, header = load_binary_dataset(str(tmp_path / f'{name}.bin'))
+    return np.array(features), np.array(header['class_names'])[labels]
+
+def test_incremental_matches_full_rebuild(tmp_path):
+    raw_dir = tmp_path / 'raw'
+    raw_dir.mkdir()
+    for seed, letter in enumerate('ABC'):
+        write_letter(raw_dir, letter, 10 + seed, seed)
+    incremental = combiner(tmp_path, 'incremental', raw_dir)
+    assert incremental.combine()['changed'] == ['A', 'B', 'C']
+
+    # Ubah B, hapus C, tambah D: hanya B dan D yang di-parse ulang
+    write_letter(raw_dir, 'B', 7, 10)
+    os.remove(raw_dir / 'C_coordinates.csv')
+    write_letter(raw_dir, 'D', 5, 11)
+    stats = incremental.combine()
+    assert stats['changed'] == ['B', 'D']
+    assert stats['removed'] == ['C']
+
+    combiner(tmp_path, 'full', raw_dir).combine(force=True)
+    features, labels = load(tmp_path, 'incremental')
+    full_features, full_labels = load(tmp_path, 'full')
+    np.testing.assert_array_equal(features, full_features)
+    np.testing.assert_array_equal(labels, full_labels)
+    assert stats['samples'] == len(full_features) == 22
+
+def test_unchanged_sources_are_not_rewritten(tmp_path):
+    raw_dir = tmp_path / 'raw'
+    raw_dir.mkdir()
+    write_letter(raw_dir, 'A', 4, 0)
+    combiner(tmp_path, 'dataset', raw_dir).combine()
+
+    stats = combiner(tmp_path, 'dataset', raw_dir).combine()
+    assert not stats['updated']
+    assert stats['changed'] == []
+    assert stats['samples'] == 4
+
+def test_extra_dirs_are_merged_under_their_own_keys(tmp_path):
+    raw_dir, image_dir = tmp_path / 'raw', tmp_path / 'image_coordinates'
+    raw_dir.mkdir()
+    image_dir.mkdir()
+    write_letter(raw_dir, 'A', 3, 0)
+    write_letter(image_dir, 'A', 2, 1)
+
+    stats = combiner(tmp_path, 'dataset', raw_dir, [str(image_dir)]).combine()
+    assert stats['changed'] == ['A', 'image_coordinates/A']
+    assert stats['class_counts'] == {'A': 5}
@@ -0,0 +1,49 @@
+import numpy as np
+from src.config import Config
+from src.motion_gate import MotionGate
+
+def counting_predictor(calls):
+    def predict(x):
+        calls.append(len(x))
+        return np.full((len(x), Config.NUM_CLASSES), len(calls), dtype=np.float32)
+    return predict
+
+def test_still_hand_reuses_prediction():
+    calls = []
+    gate = MotionGate(threshold=0.01, max_skip=10, enabled=True)
+    landmarks = np.zeros((1, Config.NUM_FEATURES), dtype=np.float32)
+    for _ in range(5):
+        predictions = gate.predict(landmarks, counting_predictor(calls))
+
+    assert calls == [1]
+    assert predictions[0, 0] == 1
+    assert (gate.scored_frames, gate.skipped_frames) == (1, 4)
+
+def test_zero_threshold_scores_every_frame():
+    calls = []
+    gate = MotionGate(threshold=0, enabled=True)
+    landmarks = np.zeros((1, Config.NUM_FEATURES), dtype=np.float32)
+    for _ in range(5):
+        gate.predict(landmarks, counting_predictor(calls))
+
+    assert gate.threshold == 0
+    assert len(calls) == 5
+
+def test_zero_max_skip_scores_every_frame():
+    calls = []
+    gate = MotionGate(threshold=1.0, max_skip=0, enabled=True)
+    landmarks = np.zeros((1, Config.NUM_FEATURES), dtype=np.float32)
+    for _ in range(5):
+        gate.predict(landmarks, counting_predictor(calls))
+
+    assert len(calls) == 5
+
+def test_movement_triggers_inference():
+    calls = []
+    gate = MotionGate(threshold=0.01, max_skip=10, enabled=True)
+    landmarks = np.zeros((1, Config.NUM_FEATURES), dtype=np.float32)
+    gate.predict(landmarks, counting_predictor(calls))
+    landmarks[0, 3] = 0.05  # x landmark 1 bergeser
+    gate.predict(landmarks, counting_predictor(calls))
+
+    assert len(calls) == 2
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from src.config import Config
+from src.numpy_inference import NumpyCoordinateModel
+
+def build_keras_model(keras):
+    """MLP kecil dengan susunan layer yang sama seperti model training (Dense-ReLU-BN-Dropout)"""
+    config = Config()
+    model = keras.Sequential([
+        keras.layers.Input(shape=(config.NUM_FEATURES,)),
+        keras.layers.Dense(32, activation='relu'),
+        keras.layers.BatchNormalization(),
+        keras.layers.Dropout(0.3),
+        keras.layers.Dense(16, activation='relu'),
+        keras.layers.BatchNormalization(),
+        keras.layers.Dense(config.NUM_CLASSES, activation='softmax'),
+    ])
+    # Statistik BN acak agar folding benar-benar diuji
+    rng = np.random.default_rng(0)
+    for layer in model.layers:
+        if isinstance(layer, keras.layers.BatchNormalization):
+            gamma, beta, mean, variance = layer.get_weights()
+            layer.set_weights([rng.uniform(0.5, 1.5, gamma.shape), rng.normal(0, 0.1, beta.shape),
+                               rng.normal(0, 0.5, mean.shape), rng.uniform(0.5, 2.0, variance.shape)])
+    return model
+
+def test_matches_keras(tmp_path):
+    tf = pytest.importorskip('tensorflow')
+    keras_model = build_keras_model(tf.keras)
+    model_path = str(tmp_path / 'model.h5')
+    keras_model.save(model_path)
+
+    model = NumpyCoordinateModel(model_path)
+    x = np.random.default_rng(1).standard_normal((64, Config.NUM_FEATURES)).astype(np.float32)
+    expected = keras_model.predict(x, verbose=0)
+
+    np.testing.assert_allclose(model.predict(x), expected, atol=Config.INFERENCE_TOLERANCE)
+    np.testing.assert_allclose(model.predict(x[0]), expected[:1], atol=Config.INFERENCE_TOLERANCE)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from src.config import Config
+from src.prediction_cache import PredictionCache
+
+def counting_predictor(calls):
+    def predict(x):
+        calls.append(len(x))
+        return np.tile(np.arange(Config.NUM_CLASSES, dtype=np.float32), (len(x), 1))
+    return predict
+
+def test_same_hand_hits_cache():
+    calls = []
+    cache = PredictionCache(max_size=8, enabled=True)
+    landmarks = np.random.default_rng(0).random((1, Config.NUM_FEATURES), dtype=np.float32)
+    first = cache.predict(landmarks, counting_predictor(calls))
+    second = cache.predict(landmarks, counting_predictor(calls))
+
+    np.testing.assert_array_equal(first, second)
+    assert calls == [1]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_zero_max_size_disables_cache():
+    calls = []
+    cache = PredictionCache(max_size=0, enabled=True)
+    landmarks = np.zeros((2, Config.NUM_FEATURES), dtype=np.float32)
+    for _ in range(3):
+        assert cache.predict(landmarks, counting_predictor(calls)).shape == (2, Config.NUM_CLASSES)
+
+    assert not cache.enabled
+    assert calls == [2, 2, 2]
+    assert len(cache.entries) == 0
+
+def test_zero_grid_is_rejected():
+    with pytest.raises(ValueError):
+        PredictionCache(grid=0)
+
+def test_lru_evicts_oldest():
+    cache = PredictionCache(max_size=2, enabled=True)
+    rows = np.random.default_rng(1).random((3, Config.NUM_FEATURES), dtype=np.float32)
+    for row in rows:
+        cache.predict(row, counting_predictor([]))
+
+    assert len(cache.entries) == 2
+    assert cache.make_keys(rows[:1])[0] not in cache.entries
@@ -0,0 +1,49 @@
+import os
+import pandas as pd
+from src.config import Config
+from src.sample_writer import SampleWriter
+
+def landmarks(value):
+    return [float(value)] * Config.NUM_FEATURES
+
+def read_rows(data_dir, letter):
+    path = os.path.join(data_dir, f'{letter}_coordinates.csv')
+    return pd.read_csv(path) if os.path.exists(path) else pd.DataFrame()
+
+def test_flushes_when_row_threshold_reached(tmp_path):
+    writer = SampleWriter(str(tmp_path), flush_rows=5, flush_interval=3600)
+    for i in range(4):
+        writer.write(landmarks(i), 'A')
+    assert writer.rows_written == 0
+    assert len(writer.buffer) == 4
+
+    writer.write(landmarks(4), 'A')
+    assert writer.rows_written == 5
+    assert writer.buffer == []
+    assert len(read_rows(tmp_path, 'A')) == 5
+    writer.close()
+
+def test_flushes_when_interval_elapsed(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('src.sample_writer.time.time', lambda: now[0])
+    writer = SampleWriter(str(tmp_path), flush_rows=100, flush_interval=2.0)
+    writer.write(landmarks(0), 'B')
+    assert writer.rows_written == 0
+
+    now[0] += 2.5
+    writer.write(landmarks(1), 'B')
+    assert writer.rows_written == 2
+    assert writer.letter_rows == {'B': 2}
+    writer.close()
+
+def test_close_flushes_remaining_rows_per_letter(tmp_path):
+    writer = SampleWriter(str(tmp_path), flush_rows=100, flush_interval=3600)
+    writer.write(landmarks(1), 'A')
+    writer.write(landmarks(2), 'C')
+    writer.write(landmarks(3), 'A')
+    writer.close()
+
+    rows = read_rows(tmp_path, 'A')
+    assert list(rows.columns[-1:]) == ['label']
+    assert rows['x_0'].tolist() == [1.0, 3.0]
+    assert len(read_rows(tmp_path, 'C')) == 1
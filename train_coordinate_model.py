@@ -1,3 +1,4 @@
+import argparse
 import tensorflow as tf
 from tensorflow import keras
 import numpy as np
@@ -6,7 +7,8 @@ import os
 import json
 import joblib
 from src.data_loader import CoordinateDataLoader
-from src.model_training import CoordinateModel
+from src.model_training import CoordinateModel, benchmark_input_pipeline
+from src.augmentation import LandmarkAugmenter
 from src.config import Config
 
 def plot_training_history(history, save_path=None):
@@ -101,6 +103,18 @@ def save_training_report(history, test_accuracy, test_loss, class_names, save_di
     print(f"Training summary saved to: {text_report_path}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Train coordinate model")
+    parser.add_argument('--augment', action='store_true',
+                        help="Augmentasi landmark on-the-fly (rotasi, scale, translasi, jitter, mirror)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Seed RNG augmentasi (default: Config.AUGMENT_SEED)")
+    parser.add_argument('--tf-data', action='store_true',
+                        help="Input lewat tf.data (shuffle, map paralel, cache, prefetch)")
+    parser.add_argument('--step-time-report', action='store_true',
+                        help="Bandingkan step time dengan/tanpa tf.data lalu keluar (tanpa menyimpan model)")
+    parser.add_argument('--report-epochs', type=int, default=3)
+    args = parser.parse_args()
+    
     print("=== COORDINATE-BASED SIGN LANGUAGE MODEL TRAINING ===")
     
     # Initialize config
@@ -133,6 +147,11 @@ def main():
         print(f"Error loading dataset: {e}")
         return
     
+    augmenter = LandmarkAugmenter(seed=args.seed) if args.augment else None
+    if args.step_time_report:
+        benchmark_input_pipeline(X_train, y_train, X_val, y_val, data_loader, augmenter, args.report_epochs)
+        return
+    
     # Build model
     print("\n2. Building model...")
     model = CoordinateModel()
@@ -141,7 +160,11 @@ def main():
     
     # Train model - ✅ PASS data_loader ke training function
     print("\n3. Training model...")
-    history = model.train(X_train, y_train, X_val, y_val, data_loader)
+    if augmenter is not None:
+        print("Augmentation: ON (vectorized per batch)")
+    if args.tf_data:
+        print("Input pipeline: tf.data")
+    history = model.train(X_train, y_train, X_val, y_val, data_loader, augmenter, args.tf_data)
     
     # Evaluate model
     print("\n4. Evaluating model...")